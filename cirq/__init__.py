@@ -384,6 +384,7 @@ from cirq.sim import (
     StateVectorStepResult,
     StateVectorTrialResult,
     StepResult,
+    TrajectorySimulator,
     WaveFunctionSimulatorState,
     WaveFunctionStepResult,
     WaveFunctionTrialResult,
@@ -493,6 +494,7 @@ from cirq.protocols import (
     qid_shape,
     quil,
     QuilFormatter,
+    read_binary,
     read_json,
     resolve_parameters,
     resolve_parameters_once,
@@ -521,6 +523,7 @@ from cirq.protocols import (
     SupportsQasmWithArgsAndQubits,
     SupportsTraceDistanceBound,
     SupportsUnitary,
+    to_binary,
     to_json,
     obj_to_dict_helper,
     trace_distance_bound,
@@ -550,6 +553,7 @@ from cirq.vis import (
 from cirq.work import (
     CircuitSampleJob,
     PauliSumCollector,
+    ParallelSampler,
     Sampler,
     Collector,
     ZerosSampler,
@@ -19,6 +19,7 @@ Operations. Each Operation is a Gate that acts on some Qubits, for a given
 Moment the Operations must all act on distinct Qubits.
 """
 
+import bisect
 from collections import defaultdict
 from itertools import groupby
 import math
@@ -344,7 +345,7 @@ class AbstractCircuit(abc.ABC):
             return None
 
         return self._first_moment_operating_on(
-            qubits, (end_moment_index - k - 1 for k in range(max_distance))
+            qubits, range(end_moment_index - 1, end_moment_index - 1 - max_distance, -1)
         )
 
     def reachable_frontier_from(
@@ -1353,10 +1354,20 @@ class Circuit(AbstractCircuit):
                 circuit.
             device: Hardware that the circuit should be able to run on.
         """
-        self._moments: List['cirq.Moment'] = []
+        self._moments = []
         self._device = device
         self.append(contents, strategy=strategy)
 
+    @property
+    def _moments(self) -> '_MomentList':
+        return self._moment_list
+
+    @_moments.setter
+    def _moments(self, moments: Iterable['cirq.Moment']) -> None:
+        if not isinstance(moments, _MomentList):
+            moments = _MomentList(moments)
+        self._moment_list = moments
+
     @property
     def device(self) -> devices.Device:
         return self._device
@@ -1527,13 +1538,50 @@ class Circuit(AbstractCircuit):
             new_device=self.device if new_device is None else new_device, qubit_mapping=func
         )
 
+    def _first_moment_operating_on(
+        self, qubits: Iterable['cirq.Qid'], indices: Iterable[int]
+    ) -> Optional[int]:
+        if not isinstance(indices, range) or indices.step not in (1, -1):
+            return super()._first_moment_operating_on(qubits, indices)
+        if not indices:
+            return None
+        start, stop = (
+            (indices[0], indices[-1] + 1) if indices.step == 1 else (indices[-1], indices[0] + 1)
+        )
+        qubit_indices = self._moments.qubit_indices()
+        found = None
+        for q in frozenset(qubits):
+            moment_indices = qubit_indices.get(q)
+            if not moment_indices:
+                continue
+            if indices.step == 1:
+                i = bisect.bisect_left(moment_indices, start)
+                if i < len(moment_indices) and moment_indices[i] < stop:
+                    if found is None or moment_indices[i] < found:
+                        found = moment_indices[i]
+            else:
+                i = bisect.bisect_left(moment_indices, stop) - 1
+                if i >= 0 and moment_indices[i] >= start:
+                    if found is None or moment_indices[i] > found:
+                        found = moment_indices[i]
+        return found
+
+    def all_qubits(self) -> FrozenSet['cirq.Qid']:
+        return self._moments.all_qubits()
+
     def _prev_moment_available(self, op: 'cirq.Operation', end_moment_index: int) -> Optional[int]:
+        blocking_index = self.prev_moment_operating_on(op.qubits, end_moment_index)
+        first_commuted = 0 if blocking_index is None else blocking_index + 1
+        if (
+            type(self._device).can_add_operation_into_moment
+            is devices.Device.can_add_operation_into_moment
+        ):
+            # Operations can be added into every moment they commute past.
+            return min(first_commuted, end_moment_index)
         last_available = end_moment_index
         k = end_moment_index
-        while k > 0:
+        while k > first_commuted:
             k -= 1
-            if not self._can_commute_past(k, op):
-                return last_available
             if self._can_add_op_at(k, op):
                 last_available = k
         return last_available
@@ -1586,9 +1634,6 @@ class Circuit(AbstractCircuit):
             return True
         return self._device.can_add_operation_into_moment(operation, self._moments[moment_index])
 
-    def _can_commute_past(self, moment_index: int, operation: 'cirq.Operation') -> bool:
-        return not self._moments[moment_index].operates_on(operation.qubits)
-
     def insert(
         self,
         index: int,
@@ -2068,6 +2113,126 @@ class Circuit(AbstractCircuit):
         return c_noisy
 
 
+class _MomentList(list):
+    """The list of moments of a `cirq.Circuit`, indexed by qubit.
+
+    For every qubit, the sorted indices of the moments operating on it are
+    kept up to date when moments are appended or replaced. Other mutations
+    shift moment indices, so they drop the index, which is then rebuilt on the
+    next query.
+    """
+
+    def __init__(self, moments: Iterable['cirq.Moment'] = ()) -> None:
+        super().__init__(moments)
+        self._qubit_indices: Optional[Dict['cirq.Qid', List[int]]] = None
+        self._all_qubits: Optional[FrozenSet['cirq.Qid']] = None
+
+    def __reduce__(self):
+        return _MomentList, (list(self),)
+
+    def qubit_indices(self) -> Dict['cirq.Qid', List[int]]:
+        """Returns the sorted indices of the moments operating on each qubit."""
+        if self._qubit_indices is None:
+            qubit_indices: Dict['cirq.Qid', List[int]] = defaultdict(list)
+            for i, moment in enumerate(self):
+                for q in moment.qubits:
+                    qubit_indices[q].append(i)
+            self._qubit_indices = dict(qubit_indices)
+            self._all_qubits = None
+        return self._qubit_indices
+
+    def all_qubits(self) -> FrozenSet['cirq.Qid']:
+        if self._all_qubits is None:
+            self._all_qubits = frozenset(self.qubit_indices())
+        return self._all_qubits
+
+    def _index_moment(self, index: int, moment: 'cirq.Moment') -> None:
+        if self._qubit_indices is None:
+            return
+        for q in moment.qubits:
+            moment_indices = self._qubit_indices.get(q)
+            if moment_indices is None:
+                self._qubit_indices[q] = [index]
+                self._all_qubits = None
+            elif not moment_indices or moment_indices[-1] < index:
+                moment_indices.append(index)
+            else:
+                bisect.insort(moment_indices, index)
+
+    def _unindex_moment(self, index: int, moment: 'cirq.Moment') -> None:
+        if self._qubit_indices is None:
+            return
+        for q in moment.qubits:
+            moment_indices = self._qubit_indices[q]
+            del moment_indices[bisect.bisect_left(moment_indices, index)]
+            if not moment_indices:
+                del self._qubit_indices[q]
+                self._all_qubits = None
+
+    def _drop_index(self) -> None:
+        self._qubit_indices = None
+        self._all_qubits = None
+
+    def append(self, moment: 'cirq.Moment') -> None:
+        super().append(moment)
+        self._index_moment(len(self) - 1, moment)
+
+    def extend(self, moments: Iterable['cirq.Moment']) -> None:
+        for moment in moments:
+            self.append(moment)
+
+    def __iadd__(self, moments: Iterable['cirq.Moment']) -> '_MomentList':  # type: ignore
+        self.extend(moments)
+        return self
+
+    def insert(self, index: int, moment: 'cirq.Moment') -> None:
+        if index >= len(self):
+            self.append(moment)
+        else:
+            super().insert(index, moment)
+            self._drop_index()
+
+    def __setitem__(self, key, value):
+        if isinstance(key, slice) or not -len(self) <= key < len(self):
+            super().__setitem__(key, value)
+            self._drop_index()
+            return
+        index = key % len(self)
+        self._unindex_moment(index, self[index])
+        super().__setitem__(index, value)
+        self._index_moment(index, value)
+
+    def __delitem__(self, key):
+        super().__delitem__(key)
+        self._drop_index()
+
+    def __imul__(self, repetitions):
+        result = super().__imul__(repetitions)
+        self._drop_index()
+        return result
+
+    def pop(self, *args):
+        result = super().pop(*args)
+        self._drop_index()
+        return result
+
+    def remove(self, moment: 'cirq.Moment') -> None:
+        super().remove(moment)
+        self._drop_index()
+
+    def clear(self) -> None:
+        super().clear()
+        self._drop_index()
+
+    def reverse(self) -> None:
+        super().reverse()
+        self._drop_index()
+
+    def sort(self, *args, **kwargs) -> None:
+        super().sort(*args, **kwargs)
+        self._drop_index()
+
+
 def _get_op_circuit(op: ops.Operation) -> Optional['cirq.FrozenCircuit']:
     """Retrieves the circuit contained by an operation, if there is one."""
     from cirq.circuits import CircuitOperation
@@ -12,7 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from typing import Any, Callable, Dict, Generic, Iterator, TypeVar, cast, TYPE_CHECKING
+from typing import Any, Callable, Dict, Generic, Iterable, Iterator, TypeVar, cast, TYPE_CHECKING
 
 import functools
 import networkx
@@ -65,7 +65,10 @@ class CircuitDag(networkx.DiGraph):
     application order between two operations.  The first must be applied before
     the second.
 
-    The graph is maximalist (transitive completion).
+    The graph is maximalist (transitive completion), unless it is constructed
+    with `transitive_reduction=True`. In that case only the edges that are not
+    implied by other edges are stored, i.e. the transitive reduction of the
+    maximalist graph.
     """
 
     disjoint_qubits = staticmethod(_disjoint_qubits)
@@ -75,6 +78,8 @@ class CircuitDag(networkx.DiGraph):
         can_reorder: Callable[['cirq.Operation', 'cirq.Operation'], bool] = _disjoint_qubits,
         incoming_graph_data: Any = None,
         device: devices.Device = devices.UNCONSTRAINED_DEVICE,
+        *,
+        transitive_reduction: bool = False,
     ) -> None:
         """Initializes a CircuitDag.
 
@@ -89,10 +94,38 @@ class CircuitDag(networkx.DiGraph):
                 value supported by networkx.DiGraph() e.g. an edge list or
                 another graph.
             device: Hardware that the circuit should be able to run on.
+            transitive_reduction: If set, appended operations are only
+                connected to the last operation on each of their qubits that
+                is not already an ancestor of another of those operations.
+                Appending then takes time proportional to the number of
+                qubits in the past light cone of the operation, for merging
+                the per-qubit operation counts of its predecessors, instead
+                of time proportional to the size of the graph.
+                Requires the default `can_reorder` predicate and an empty
+                initial graph.
+
+        Raises:
+            ValueError: `transitive_reduction` was set with a custom
+                `can_reorder` predicate or with `incoming_graph_data`.
         """
+        # The construction state is set up first because networkx may clear
+        # the graph while initializing it.
+        self._transitive_reduction = transitive_reduction
+        # The last appended node on each qubit.
+        self._frontier: Dict['cirq.Qid', Unique[ops.Operation]] = {}
+        # For every appended node and qubit, the number of operations on that
+        # qubit that are ancestors of the node or the node itself. Operations
+        # on a qubit are totally ordered, so a node is an ancestor of another
+        # iff the latter's count on one of the former's qubits is at least as
+        # large as the former's own count on it.
+        self._clocks: Dict[Unique[ops.Operation], Dict['cirq.Qid', int]] = {}
         super().__init__(incoming_graph_data)
         self.can_reorder = can_reorder
         self.device = device
+        if transitive_reduction and can_reorder is not _disjoint_qubits:
+            raise ValueError('transitive_reduction requires the default can_reorder predicate.')
+        if transitive_reduction and incoming_graph_data is not None:
+            raise ValueError('transitive_reduction requires an empty initial graph.')
 
     @staticmethod
     def make_node(op: 'cirq.Operation') -> Unique:
@@ -102,9 +135,14 @@ class CircuitDag(networkx.DiGraph):
     def from_circuit(
         circuit: circuit.Circuit,
         can_reorder: Callable[['cirq.Operation', 'cirq.Operation'], bool] = _disjoint_qubits,
+        *,
+        transitive_reduction: bool = False,
     ) -> 'CircuitDag':
         return CircuitDag.from_ops(
-            circuit.all_operations(), can_reorder=can_reorder, device=circuit.device
+            circuit.all_operations(),
+            can_reorder=can_reorder,
+            device=circuit.device,
+            transitive_reduction=transitive_reduction,
         )
 
     @staticmethod
@@ -112,14 +150,20 @@ class CircuitDag(networkx.DiGraph):
         *operations: 'cirq.OP_TREE',
         can_reorder: Callable[['cirq.Operation', 'cirq.Operation'], bool] = _disjoint_qubits,
         device: devices.Device = devices.UNCONSTRAINED_DEVICE,
+        transitive_reduction: bool = False,
     ) -> 'CircuitDag':
-        dag = CircuitDag(can_reorder=can_reorder, device=device)
+        dag = CircuitDag(
+            can_reorder=can_reorder, device=device, transitive_reduction=transitive_reduction
+        )
         for op in ops.flatten_op_tree(operations):
             dag.append(cast(ops.Operation, op))
         return dag
 
     def append(self, op: 'cirq.Operation') -> None:
         new_node = self.make_node(op)
+        if self._transitive_reduction:
+            self._append_to_frontier(new_node)
+            return
         for node in list(self.nodes()):
             if not self.can_reorder(node.val, op):
                 self.add_edge(node, new_node)
@@ -127,6 +171,85 @@ class CircuitDag(networkx.DiGraph):
                     self.add_edge(pred, new_node)
         self.add_node(new_node)
 
+    def _append_to_frontier(self, new_node: Unique[ops.Operation]) -> None:
+        qubits = new_node.val.qubits
+        latest = {q: self._frontier[q] for q in qubits if q in self._frontier}
+        clock: Dict['cirq.Qid', int] = {}
+        for node in set(latest.values()):
+            for q, count in self._clocks[node].items():
+                if clock.get(q, 0) < count:
+                    clock[q] = count
+        self.add_node(new_node)
+        for q, node in latest.items():
+            # `node` is redundant if it is an ancestor of another predecessor.
+            own_count = self._clocks[node][q]
+            if not any(
+                other is not node and self._clocks[other].get(q, 0) >= own_count
+                for other in latest.values()
+            ):
+                self.add_edge(node, new_node)
+        for q in qubits:
+            clock[q] = clock.get(q, 0) + 1
+            self._frontier[q] = new_node
+        self._clocks[new_node] = clock
+
+    def remove_node(self, n: Unique[ops.Operation]) -> None:
+        """Removes a node, keeping the order of the remaining operations.
+
+        With `transitive_reduction`, edges implied through the removed node
+        are replaced by direct edges from its predecessors to its successors,
+        and qubits whose last operation was removed continue from the latest
+        remaining operation before it.
+        """
+        if not self._transitive_reduction:
+            super().remove_node(n)
+            return
+        preds = list(self.pred[n]) if n in self else []
+        succs = list(self.succ[n]) if n in self else []
+        super().remove_node(n)
+        self.add_edges_from((p, s) for p in preds for s in succs)
+        del self._clocks[n]
+        for q in n.val.qubits:
+            if self._frontier.get(q) is not n:
+                continue
+            # The predecessor with the most operations on q before n descends
+            # from the latest remaining operation on q.
+            latest = max(preds, key=lambda p: self._clocks[p].get(q, 0), default=None)
+            if latest is not None and self._clocks[latest].get(q, 0) > 0:
+                self._frontier[q] = latest
+            else:
+                del self._frontier[q]
+
+    def remove_nodes_from(self, nodes: Iterable[Unique[ops.Operation]]) -> None:
+        if not self._transitive_reduction:
+            super().remove_nodes_from(nodes)
+            return
+        # Counts grow along edges, so later nodes are removed first and no
+        # edges are added to nodes that are about to be removed.
+        removed = sorted(
+            {n for n in nodes if n in self},
+            key=lambda n: sum(self._clocks[n].values()),
+            reverse=True,
+        )
+        for n in removed:
+            self.remove_node(n)
+
+    def clear(self) -> None:
+        super().clear()
+        self._frontier.clear()
+        self._clocks.clear()
+
+    def copy(self, as_view: bool = False) -> 'CircuitDag':
+        if as_view:
+            return super().copy(as_view=True)
+        dag = super().copy()
+        dag.can_reorder = self.can_reorder
+        dag.device = self.device
+        dag._transitive_reduction = self._transitive_reduction
+        dag._frontier = dict(self._frontier)
+        dag._clocks = {node: dict(clock) for node, clock in self._clocks.items()}
+        return dag
+
     def __eq__(self, other):
         if not isinstance(other, type(self)):
             return NotImplemented
@@ -204,7 +327,7 @@ class CircuitDag(networkx.DiGraph):
             if node not in remaining_dag:
                 continue
             if is_blocker(node.val):
-                successors = list(remaining_dag.succ[node])
+                successors = networkx.descendants(remaining_dag, node)
                 remaining_dag.remove_nodes_from(successors)
                 remaining_dag.remove_node(node)
                 continue
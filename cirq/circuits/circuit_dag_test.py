@@ -264,3 +264,98 @@ def test_findall_nodes_until_blocked(circuit, is_blocker):
     blocked_nodes = blocking_nodes.union(*(dag.succ[node] for node in blocking_nodes))
     expected_nodes = set(all_nodes) - blocked_nodes
     assert sorted(found_nodes) == sorted(expected_nodes)
+
+
+def test_transitive_reduction_append():
+    q0, q1 = cirq.LineQubit.range(2)
+    dag = cirq.CircuitDag(transitive_reduction=True)
+    dag.append(cirq.CZ(q0, q1))
+    dag.append(cirq.X(q1))
+    dag.append(cirq.CZ(q0, q1))
+    dag.append(cirq.Y(q0))
+    assert set((n1.val, n2.val) for n1, n2 in dag.edges()) == {
+        (cirq.CZ(q0, q1), cirq.X(q1)),
+        (cirq.X(q1), cirq.CZ(q0, q1)),
+        (cirq.CZ(q0, q1), cirq.Y(q0)),
+    }
+
+
+def _edge_vals(dag):
+    return set((n1.val, n2.val) for n1, n2 in dag.edges())
+
+
+def test_transitive_reduction_remove_node():
+    q0, q1 = cirq.LineQubit.range(2)
+    dag = cirq.CircuitDag.from_ops(
+        cirq.X(q0), cirq.CZ(q0, q1), cirq.Y(q0), cirq.Z(q1), transitive_reduction=True
+    )
+    x, cz, y, z = dag.ordered_nodes()
+
+    # Removing a node keeps the order of the operations around it.
+    dag.remove_node(cz)
+    assert _edge_vals(dag) == {(cirq.X(q0), cirq.Y(q0)), (cirq.X(q0), cirq.Z(q1))}
+
+    # Appending after removing the last operation on a qubit continues from
+    # the operation before it, without re-adding the removed node.
+    dag.remove_node(y)
+    dag.append(cirq.H(q0))
+    assert len(dag) == 3
+    assert cz not in dag and y not in dag
+    assert _edge_vals(dag) == {(cirq.X(q0), cirq.Z(q1)), (cirq.X(q0), cirq.H(q0))}
+
+    dag.remove_nodes_from([x, z])
+    dag.append(cirq.H(q1))
+    assert _edge_vals(dag) == set()
+    assert len(dag) == 2
+
+    dag.clear()
+    dag.append(cirq.X(q0))
+    assert len(dag) == 1
+
+
+def test_copy():
+    q0, q1 = cirq.LineQubit.range(2)
+    operations = [cirq.CZ(q0, q1), cirq.X(q1), cirq.CZ(q0, q1)]
+    dag = cirq.CircuitDag.from_ops(*operations, transitive_reduction=True)
+    copy = dag.copy()
+    copy.append(cirq.Y(q0))
+    assert len(dag) == 3
+    assert copy == cirq.CircuitDag.from_ops(*operations, cirq.Y(q0), transitive_reduction=True)
+    assert _edge_vals(copy) == _edge_vals(dag) | {(cirq.CZ(q0, q1), cirq.Y(q0))}
+
+    def never_reorder(op1, op2):
+        return False
+
+    dag = cirq.CircuitDag.from_ops(cirq.X(q0), can_reorder=never_reorder)
+    copy = dag.copy()
+    copy.append(cirq.X(q1))
+    assert copy.can_reorder is never_reorder
+    assert _edge_vals(copy) == {(cirq.X(q0), cirq.X(q1))}
+
+
+def test_transitive_reduction_invalid():
+    with pytest.raises(ValueError, match='default can_reorder'):
+        _ = cirq.CircuitDag(can_reorder=lambda op1, op2: False, transitive_reduction=True)
+    with pytest.raises(ValueError, match='empty initial graph'):
+        _ = cirq.CircuitDag(incoming_graph_data=[(0, 1)], transitive_reduction=True)
+
+
+@pytest.mark.parametrize('circuit', [cirq.testing.random_circuit(10, 10, 0.5) for _ in range(3)])
+def test_transitive_reduction(circuit):
+    dag = cirq.CircuitDag.from_circuit(circuit)
+    reduced = cirq.CircuitDag.from_circuit(circuit, transitive_reduction=True)
+    expected = networkx.dag.transitive_reduction(dag)
+    assert len(reduced.edges()) == len(expected.edges())
+    assert cirq.CircuitDag(incoming_graph_data=networkx.dag.transitive_closure(reduced)) == dag
+    cirq.testing.assert_same_circuits(
+        cirq.Circuit(reduced.all_operations()), cirq.Circuit(dag.all_operations())
+    )
+
+
+@pytest.mark.parametrize('circuit, is_blocker', _get_circuits_and_is_blockers())
+def test_findall_nodes_until_blocked_transitive_reduction(circuit, is_blocker):
+    dag = cirq.CircuitDag.from_circuit(circuit)
+    reduced = cirq.CircuitDag.from_circuit(circuit, transitive_reduction=True)
+    found_vals = [node.val for node in dag.findall_nodes_until_blocked(is_blocker)]
+    reduced_vals = [node.val for node in reduced.findall_nodes_until_blocked(is_blocker)]
+    assert sorted(map(repr, found_vals)) == sorted(map(repr, reduced_vals))
@@ -15,8 +15,10 @@
 from typing import Tuple
 
 from collections import defaultdict
+import copy
 from random import randint, random, sample, randrange
 import os
+import pickle
 import numpy as np
 import pytest
 import sympy
@@ -1842,6 +1844,73 @@ def test_clear_operations_touching():
     )
 
 
+def test_moment_index_tracks_mutations():
+    a, b, c = cirq.LineQubit.range(3)
+
+    def assert_index_consistent(circuit):
+        frozen = circuit.freeze()
+        assert circuit.all_qubits() == frozen.all_qubits()
+        for qubits in [[a], [b], [c], [a, c]]:
+            for i in range(len(circuit) + 2):
+                assert circuit.next_moment_operating_on(
+                    qubits, i
+                ) == frozen.next_moment_operating_on(qubits, i)
+                assert circuit.prev_moment_operating_on(
+                    qubits, i
+                ) == frozen.prev_moment_operating_on(qubits, i)
+
+    circuit = cirq.Circuit(cirq.X(a), cirq.CZ(a, b), cirq.Y(b))
+    assert_index_consistent(circuit)
+    circuit.append(cirq.X(c))
+    assert_index_consistent(circuit)
+    circuit[1] = cirq.Moment([cirq.X(c)])
+    assert_index_consistent(circuit)
+    circuit[-1] = cirq.Moment()
+    assert_index_consistent(circuit)
+    circuit.insert(1, cirq.Moment([cirq.CZ(b, c)]))
+    assert_index_consistent(circuit)
+    del circuit[0]
+    assert_index_consistent(circuit)
+    circuit[0:1] = [cirq.Moment([cirq.X(a)]), cirq.Moment([cirq.X(a), cirq.Y(b)])]
+    assert_index_consistent(circuit)
+    circuit.batch_remove([(1, cirq.X(a))])
+    assert_index_consistent(circuit)
+    circuit.insert_at_frontier([cirq.Z(a), cirq.Z(b)], 0)
+    assert_index_consistent(circuit)
+    circuit *= 2
+    assert_index_consistent(circuit)
+    circuit._moments.reverse()
+    assert_index_consistent(circuit)
+    circuit._moments.pop()
+    circuit._moments.remove(circuit[0])
+    assert_index_consistent(circuit)
+    circuit._moments.sort(key=len)
+    assert_index_consistent(circuit)
+    circuit._moments = [cirq.Moment([cirq.X(b)])]
+    assert_index_consistent(circuit)
+    circuit._moments.clear()
+    assert_index_consistent(circuit)
+
+    copied = pickle.loads(pickle.dumps(cirq.Circuit(cirq.X(a), cirq.CZ(b, c))))
+    copied.append(cirq.Y(c))
+    assert_index_consistent(copied)
+    copied = copy.deepcopy(copied)
+    copied.append(cirq.Y(a))
+    assert_index_consistent(copied)
+
+
+def test_append_many_operations():
+    qubits = cirq.LineQubit.range(50)
+    circuit = cirq.Circuit()
+    for i in range(5000):
+        circuit.append(cirq.X(qubits[i % 50]))
+    circuit.append(cirq.X(cirq.LineQubit(50)))
+    assert len(circuit) == 100
+    assert circuit.all_qubits() == frozenset(cirq.LineQubit.range(51))
+    assert circuit.prev_moment_operating_on([qubits[0]]) == 99
+    assert circuit.next_moment_operating_on([cirq.LineQubit(50)]) == 0
+
+
 @pytest.mark.parametrize('circuit_cls', [cirq.Circuit, cirq.FrozenCircuit])
 def test_all_qubits(circuit_cls):
     a = cirq.NamedQubit('a')
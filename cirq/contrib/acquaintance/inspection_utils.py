@@ -48,7 +48,19 @@ class LogicalAnnotator(ExecutionStrategy):
         yield AcquaintanceOperation(qubits, indices)
 
 
-def get_acquaintance_dag(strategy: 'cirq.Circuit', initial_mapping: LogicalMapping):
+def get_acquaintance_dag(
+    strategy: 'cirq.Circuit', initial_mapping: LogicalMapping, *, transitive_reduction: bool = False
+):
+    """Returns the dependency graph of the acquaintances in a strategy.
+
+    Args:
+        strategy: The acquaintance strategy.
+        initial_mapping: The initial mapping of qubits to logical indices.
+        transitive_reduction: If set, only the edges that are not implied by
+            other edges are included, see `cirq.CircuitDag`. This is much
+            faster to build for large strategies. Defaults to the full
+            dependency graph.
+    """
     strategy = strategy.copy()
     expose_acquaintance_gates(strategy)
     LogicalAnnotator(initial_mapping)(strategy)
@@ -58,13 +70,16 @@ def get_acquaintance_dag(strategy: 'cirq.Circuit', initial_mapping: LogicalMappi
         for op in moment.operations
         if isinstance(op, AcquaintanceOperation)
     )
-    return circuits.CircuitDag.from_ops(acquaintance_ops, device=strategy.device)
+    return circuits.CircuitDag.from_ops(
+        acquaintance_ops, device=strategy.device, transitive_reduction=transitive_reduction
+    )
 
 
 def get_logical_acquaintance_opportunities(
     strategy: 'cirq.Circuit', initial_mapping: LogicalMapping
 ) -> Set[FrozenSet[LogicalIndex]]:
-    acquaintance_dag = get_acquaintance_dag(strategy, initial_mapping)
+    # Only the operations are needed, not the full dependency graph.
+    acquaintance_dag = get_acquaintance_dag(strategy, initial_mapping, transitive_reduction=True)
     logical_acquaintance_opportunities = set()
     for op in acquaintance_dag.all_operations():
         logical_acquaintance_opportunities.add(frozenset(op.logical_indices))
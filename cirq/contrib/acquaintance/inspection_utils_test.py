@@ -14,6 +14,7 @@
 
 from itertools import product, combinations
 
+import networkx
 import pytest
 
 import cirq
@@ -27,3 +28,22 @@ def test_get_logical_acquaintance_opportunities(n_qubits, acquaintance_size):
     initial_mapping = {q: i for i, q in enumerate(qubits)}
     opps = cca.get_logical_acquaintance_opportunities(acquaintance_strategy, initial_mapping)
     assert opps == set(frozenset(s) for s in combinations(range(n_qubits), acquaintance_size))
+
+
+def test_get_acquaintance_dag_transitive_reduction():
+    qubits = cirq.LineQubit.range(4)
+    acquaintance_strategy = cca.complete_acquaintance_strategy(qubits, 2)
+    initial_mapping = {q: i for i, q in enumerate(qubits)}
+    dag = cca.inspection_utils.get_acquaintance_dag(acquaintance_strategy, initial_mapping)
+    reduced = cca.inspection_utils.get_acquaintance_dag(
+        acquaintance_strategy, initial_mapping, transitive_reduction=True
+    )
+    assert len(dag.edges()) == len(networkx.dag.transitive_closure(dag).edges())
+    assert len(reduced.edges()) == len(networkx.dag.transitive_reduction(dag).edges())
+
+    # Acquaintance operations have no value equality, so compare the edges
+    # by the logical indices of their operations.
+    def logical_edges(graph):
+        return {(a.val.logical_indices, b.val.logical_indices) for a, b in graph.edges}
+
+    assert logical_edges(networkx.dag.transitive_closure(reduced)) == logical_edges(dag)
@@ -19,7 +19,7 @@ https://arxiv.org/abs/2002.07730
 
 import collections
 import math
-from typing import Any, Dict, List, Iterator, Sequence, Set
+from typing import Any, Dict, List, Iterator, Optional, Sequence, Set
 
 import numpy as np
 import quimb.tensor as qtn
@@ -37,6 +37,8 @@ class MPSSimulator(simulator.SimulatesSamples, simulator.SimulatesIntermediateSt
         seed: 'cirq.RANDOM_STATE_OR_SEED_LIKE' = None,
         rsum2_cutoff: float = 1e-3,
         sum_prob_atol: float = 1e-3,
+        max_bond_dim: Optional[int] = None,
+        route_with_swaps: bool = False,
     ):
         """Creates instance of `MPSSimulator`.
 
@@ -51,11 +53,34 @@ class MPSSimulator(simulator.SimulatesSamples, simulator.SimulatesIntermediateSt
             sum_prob_atol: Because the computation is approximate, the sum of
                 the probabilities is not 1.0. This parameter is the absolute
                 deviation from 1.0 that is allowed.
+            max_bond_dim: If set, the largest number of singular values kept
+                when splitting a tensor after a two-qubit gate, on top of the
+                truncation from rsum2_cutoff.
+            route_with_swaps: If set, two-qubit gates on qubits that are not
+                neighbors in the qubit order are applied by swapping the first
+                qubit next to the second one and back. The state then stays a
+                chain with nearest-neighbor bonds only.
         """
+        if max_bond_dim is not None and max_bond_dim < 1:
+            raise ValueError(f'max_bond_dim must be a positive integer but was {max_bond_dim}')
         self.init = True
         self._prng = value.parse_random_state(seed)
         self.rsum2_cutoff = rsum2_cutoff
         self.sum_prob_atol = sum_prob_atol
+        self.max_bond_dim = max_bond_dim
+        self.route_with_swaps = route_with_swaps
+
+    def _create_state(
+        self, qubit_map: Dict['cirq.Qid', int], initial_state: int
+    ) -> 'cirq.contrib.quimb.mps_simulator.MPSState':
+        return MPSState(
+            qubit_map,
+            self.rsum2_cutoff,
+            self.sum_prob_atol,
+            initial_state=initial_state,
+            max_bond_dim=self.max_bond_dim,
+            route_with_swaps=self.route_with_swaps,
+        )
 
     def _base_iterator(
         self, circuit: circuits.Circuit, qubit_order: ops.QubitOrderOrList, initial_state: int
@@ -79,16 +104,11 @@ class MPSSimulator(simulator.SimulatesSamples, simulator.SimulatesIntermediateSt
 
         if len(circuit) == 0:
             yield MPSSimulatorStepResult(
-                measurements={},
-                state=MPSState(
-                    qubit_map, self.rsum2_cutoff, self.sum_prob_atol, initial_state=initial_state
-                ),
+                measurements={}, state=self._create_state(qubit_map, initial_state)
             )
             return
 
-        state = MPSState(
-            qubit_map, self.rsum2_cutoff, self.sum_prob_atol, initial_state=initial_state
-        )
+        state = self._create_state(qubit_map, initial_state)
 
         for moment in circuit:
             measurements: Dict[str, List[int]] = collections.defaultdict(list)
@@ -181,6 +201,8 @@ class MPSSimulator(simulator.SimulatesSamples, simulator.SimulatesIntermediateSt
         if repetitions == 0:
             for _, op, _ in resolved_circuit.findall_operations_with_gate_type(ops.MeasurementGate):
                 measurements[protocols.measurement_key(op)] = np.empty([0, 1])
+        elif resolved_circuit.are_all_measurements_terminal():
+            return self._run_by_sampling_final_state(resolved_circuit, repetitions)
 
         for _ in range(repetitions):
             all_step_results = self._base_iterator(
@@ -195,6 +217,35 @@ class MPSSimulator(simulator.SimulatesSamples, simulator.SimulatesIntermediateSt
 
         return {k: np.array(v) for k, v in measurements.items()}
 
+    def _run_by_sampling_final_state(
+        self, circuit: circuits.Circuit, repetitions: int
+    ) -> Dict[str, np.ndarray]:
+        """Simulates the unitary part of the circuit once, then samples.
+
+        Only valid if all the measurements of the circuit are terminal.
+        """
+        qubits = ops.QubitOrder.DEFAULT.order_for(circuit.all_qubits())
+        measurement_ops = [
+            op for _, op, _ in circuit.findall_operations_with_gate_type(ops.MeasurementGate)
+        ]
+        unitary_circuit = circuits.Circuit(
+            ops.Moment(op for op in moment if not isinstance(op.gate, ops.MeasurementGate))
+            for moment in circuit
+        )
+        for step_result in self._base_iterator(unitary_circuit, qubits, initial_state=0):
+            pass
+
+        measured_qubits = [q for op in measurement_ops for q in op.qubits]
+        samples = step_result.state.sample(measured_qubits, repetitions, self._prng)
+
+        measurements = {}
+        start = 0
+        for op in measurement_ops:
+            end = start + len(op.qubits)
+            measurements[protocols.measurement_key(op)] = samples[:, start:end]
+            start = end
+        return measurements
+
     def _check_all_resolved(self, circuit):
         """Raises if the circuit contains unresolved symbols."""
         if protocols.is_parameterized(circuit):
@@ -270,16 +321,7 @@ class MPSSimulatorStepResult(simulator.StepResult):
         seed: 'cirq.RANDOM_STATE_OR_SEED_LIKE' = None,
     ) -> np.ndarray:
 
-        measurements: List[int] = []
-
-        for _ in range(repetitions):
-            measurements.append(
-                self.state.perform_measurement(
-                    qubits, value.parse_random_state(seed), collapse_state_vector=False
-                )
-            )
-
-        return np.array(measurements, dtype=int)
+        return self.state.sample(qubits, repetitions, value.parse_random_state(seed))
 
 
 @value.value_equality
@@ -292,6 +334,8 @@ class MPSState:
         rsum2_cutoff: float,
         sum_prob_atol: float,
         initial_state: int = 0,
+        max_bond_dim: Optional[int] = None,
+        route_with_swaps: bool = False,
     ):
         """Creates and MPSState
 
@@ -307,6 +351,11 @@ class MPSState:
                 the probabilities is not 1.0. This parameter is the absolute
                 deviation from 1.0 that is allowed.
             initial_state: An integer representing the initial state.
+            max_bond_dim: If set, the largest number of singular values kept
+                when splitting a tensor after a two-qubit gate.
+            route_with_swaps: If set, two-qubit gates on qubits that are not
+                neighbors in the qubit order are routed with swaps, so that
+                the state only has nearest-neighbor bonds.
         """
         self.qubit_map = qubit_map
         self.M = []
@@ -337,7 +386,11 @@ class MPSState:
         self.M = self.M[::-1]
         self.rsum2_cutoff = rsum2_cutoff
         self.sum_prob_atol = sum_prob_atol
+        self.max_bond_dim = max_bond_dim
+        self.route_with_swaps = route_with_swaps
         self.num_svd_splits = 0
+        # The relative squared norm dropped by each SVD split, in order.
+        self.truncation_errors: List[float] = []
 
     def i_str(self, i: int) -> str:
         # Returns the index name for the i'th qid.
@@ -358,9 +411,16 @@ class MPSState:
         return self.qubit_map, self.M, self.rsum2_cutoff, self.sum_prob_atol
 
     def copy(self) -> 'MPSState':
-        state = MPSState(self.qubit_map, self.rsum2_cutoff, self.sum_prob_atol)
+        state = MPSState(
+            self.qubit_map,
+            self.rsum2_cutoff,
+            self.sum_prob_atol,
+            max_bond_dim=self.max_bond_dim,
+            route_with_swaps=self.route_with_swaps,
+        )
         state.M = [x.copy() for x in self.M]
         state.num_svd_splits = self.num_svd_splits
+        state.truncation_errors = list(self.truncation_errors)
         return state
 
     def state_vector(self) -> np.ndarray:
@@ -439,39 +499,20 @@ class MPSState:
             U = qtn.Tensor(U, inds=(new_n, old_n))
             self.M[n] = (U @ self.M[n]).reindex({new_n: old_n})
         elif len(op.qubits) == 2:
-            self.num_svd_splits += 1
-
             n, p = [self.qubit_map[qubit] for qubit in op.qubits]
-
-            old_n = self.i_str(n)
-            old_p = self.i_str(p)
-            new_n = 'new_' + old_n
-            new_p = 'new_' + old_p
-
-            U = qtn.Tensor(U, inds=(new_n, new_p, old_n, old_p))
-
-            # This is the index on which we do the contraction. We need to add it iff it's the first
-            # time that we do the joining for that specific pair.
-            mu_ind = self.mu_str(n, p)
-            if mu_ind not in self.M[n].inds:
-                self.M[n].new_ind(mu_ind)
-            if mu_ind not in self.M[p].inds:
-                self.M[p].new_ind(mu_ind)
-
-            T = U @ self.M[n] @ self.M[p]
-
-            left_inds = tuple(set(T.inds) & set(self.M[n].inds)) + (new_n,)
-            X, Y = T.split(
-                left_inds,
-                cutoff=self.rsum2_cutoff,
-                cutoff_mode='rsum2',
-                get='tensors',
-                absorb='both',
-                bond_ind=mu_ind,
-            )
-
-            self.M[n] = X.reindex({new_n: old_n})
-            self.M[p] = Y.reindex({new_p: old_p})
+            if not self.route_with_swaps or abs(n - p) == 1:
+                self._apply_two_site_unitary(U, n, p)
+                return
+
+            # Move the state of the first qubit next to the second one, apply
+            # the gate there, and move it back.
+            step = 1 if p > n else -1
+            path = list(range(n, p - step, step))
+            for i in path:
+                self._swap_sites(i, i + step)
+            self._apply_two_site_unitary(U, p - step, p)
+            for i in reversed(path):
+                self._swap_sites(i, i + step)
         else:
             # NOTE(tonybruguier): There could be a way to handle higher orders. I think this could
             # involve HOSVDs:
@@ -481,6 +522,52 @@ class MPSState:
             # about HOSVDs.
             raise ValueError('Can only handle 1 and 2 qubit operations')
 
+    def _swap_sites(self, n: int, p: int):
+        d = self.M[n].ind_size(self.i_str(n))
+        if self.M[p].ind_size(self.i_str(p)) != d:
+            raise ValueError('Can only route gates through qids of the same dimension')
+        swap = np.eye(d * d).reshape([d] * 4).transpose(1, 0, 2, 3)
+        self._apply_two_site_unitary(swap, n, p)
+
+    def _apply_two_site_unitary(self, U: np.ndarray, n: int, p: int):
+        """Applies a two-qid unitary tensor to the n'th and p'th tensors."""
+        self.num_svd_splits += 1
+
+        old_n = self.i_str(n)
+        old_p = self.i_str(p)
+        new_n = 'new_' + old_n
+        new_p = 'new_' + old_p
+
+        U = qtn.Tensor(U, inds=(new_n, new_p, old_n, old_p))
+
+        # This is the index on which we do the contraction. We need to add it iff it's the first
+        # time that we do the joining for that specific pair.
+        mu_ind = self.mu_str(n, p)
+        if mu_ind not in self.M[n].inds:
+            self.M[n].new_ind(mu_ind)
+        if mu_ind not in self.M[p].inds:
+            self.M[p].new_ind(mu_ind)
+
+        T = U @ self.M[n] @ self.M[p]
+
+        left_inds = tuple(set(T.inds) & set(self.M[n].inds)) + (new_n,)
+        X, Y = T.split(
+            left_inds,
+            cutoff=self.rsum2_cutoff,
+            cutoff_mode='rsum2',
+            max_bond=self.max_bond_dim,
+            get='tensors',
+            absorb='both',
+            bond_ind=mu_ind,
+        )
+
+        norm2 = T.norm() ** 2
+        kept_norm2 = (X @ Y).norm() ** 2
+        self.truncation_errors.append(float(max(0.0, 1.0 - kept_norm2 / norm2)) if norm2 else 0.0)
+
+        self.M[n] = X.reindex({new_n: old_n})
+        self.M[p] = Y.reindex({new_p: old_p})
+
     def estimation_stats(self):
         "Returns some statistics about the memory usage and quality of the approximation."
 
@@ -493,24 +580,133 @@ class MPSState:
         estimated_fidelity = 1.0 + np.expm1(np.log1p(-self.rsum2_cutoff) * self.num_svd_splits)
         estimated_fidelity = round(estimated_fidelity, ndigits=3)
 
+        max_bond_dim = max(
+            [Mi.ind_size(ind) for Mi in self.M for ind in Mi.inds if ind.startswith('mu_')],
+            default=1,
+        )
+
         return {
             "num_coefs_used": num_coefs_used,
             "memory_bytes": memory_bytes,
             "num_svd_splits": self.num_svd_splits,
             "estimated_fidelity": estimated_fidelity,
+            "max_bond_dim": max_bond_dim,
+            "truncation_errors": list(self.truncation_errors),
         }
 
+    def _chain_tensors(self) -> Optional[List[np.ndarray]]:
+        """Returns the tensors as (left bond, qid, right bond) arrays.
+
+        Missing bonds have dimension 1. Returns None if some tensors that are
+        not neighbors in the qubit order share a bond, in which case the state
+        is not a chain.
+        """
+        tensors = []
+        for i, M in enumerate(self.M):
+            left = right = None
+            for ind in M.inds:
+                if ind == self.i_str(i):
+                    continue
+                _, a, b = ind.split('_')
+                j = int(a) + int(b) - i
+                if j == i - 1:
+                    left = ind
+                elif j == i + 1:
+                    right = ind
+                else:
+                    return None
+            sizes = dict(zip(M.inds, M.shape))
+            inds = [ind for ind in (left, self.i_str(i), right) if ind is not None]
+            shape = [sizes[ind] if ind is not None else 1 for ind in (left, self.i_str(i), right)]
+            tensors.append(np.reshape(M.transpose(*inds).data, shape))
+        return tensors
+
+    def _right_environments(self, tensors: List[np.ndarray]) -> List[np.ndarray]:
+        """Contracts each suffix of the chain with its conjugate.
+
+        The k'th environment has one index for the left bond of the k'th tensor
+        and one for its conjugate. The first one holds the squared norm.
+        """
+        envs = [np.ones((1, 1))]
+        for A in reversed(tensors):
+            envs.append(np.einsum('asb,bc,dsc->ad', A, envs[-1], A.conj(), optimize=True))
+        return envs[::-1]
+
+    def _sample_chain(
+        self, tensors: List[np.ndarray], repetitions: int, prng: np.random.RandomState
+    ) -> np.ndarray:
+        """Samples all the qids of a chain, one qid at a time.
+
+        The right environments are computed once. Each qid is then sampled
+        from its marginal conditioned on the outcomes of the qids to its left,
+        which only involves the tensor of that qid and its right environment.
+        All the repetitions are sampled together.
+        """
+        envs = self._right_environments(tensors)
+        sum_probs = envs[0][0, 0].real
+        if abs(sum_probs - 1.0) > self.sum_prob_atol:
+            raise ValueError('Sum of probabilities exceeds tolerance: {}'.format(sum_probs))
+
+        samples = np.empty((repetitions, len(tensors)), dtype=int)
+        rows = np.arange(repetitions)
+        left = np.ones((repetitions, 1))
+        for k, A in enumerate(tensors):
+            branches = np.einsum('na,asb->nsb', left, A)
+            probs = np.einsum('nsb,bc,nsc->ns', branches, envs[k + 1], branches.conj()).real
+            cdf = np.cumsum(np.maximum(probs, 0), axis=1)
+            cdf /= cdf[:, -1:]
+            outcomes = np.sum(cdf <= prng.random_sample((repetitions, 1)), axis=1)
+            outcomes = np.minimum(outcomes, A.shape[1] - 1)
+            samples[:, k] = outcomes
+            left = branches[rows, outcomes] / np.sqrt(probs[rows, outcomes])[:, np.newaxis]
+        return samples
+
+    def sample(
+        self, qubits: Sequence[ops.Qid], repetitions: int, prng: np.random.RandomState
+    ) -> np.ndarray:
+        """Samples qids without mutating the state.
+
+        Args:
+            qubits: The sequence of qids to sample, in that order.
+            repetitions: The number of samples to draw.
+            prng: A random number generator, used to draw the samples.
+
+        Returns:
+            An array of shape (repetitions, len(qubits)) with the samples.
+        """
+        tensors = self._chain_tensors()
+        if tensors is None:
+            samples = [
+                self.perform_measurement(qubits, prng, collapse_state_vector=False)
+                for _ in range(repetitions)
+            ]
+            return np.array(samples, dtype=int).reshape(repetitions, len(qubits))
+        samples = self._sample_chain(tensors, repetitions, prng)
+        return samples[:, [self.qubit_map[qubit] for qubit in qubits]]
+
     def perform_measurement(
         self, qubits: Sequence[ops.Qid], prng: np.random.RandomState, collapse_state_vector=True
     ) -> List[int]:
         """Performs a measurement over one or more qubits.
 
+        If the state is a chain, the outcomes are sampled from local
+        environments and the state is renormalized once. Otherwise, the
+        marginal of each qubit is computed from a partial trace.
+
         Args:
             qubits: The sequence of qids to measure, in that order.
             prng: A random number generator, used to simulate measurements.
             collapse_state_vector: A Boolean specifying whether we should mutate
                 the state after the measurement.
         """
+        tensors = self._chain_tensors()
+        if tensors is not None:
+            sample = self._sample_chain(tensors, 1, prng)[0]
+            chain_results = [int(sample[self.qubit_map[qubit]]) for qubit in qubits]
+            if collapse_state_vector:
+                self._collapse(qubits, chain_results)
+            return chain_results
+
         results: List[int] = []
 
         if collapse_state_vector:
@@ -548,3 +744,24 @@ class MPSState:
             results.append(result)
 
         return results
+
+    def _collapse(self, qubits: Sequence[ops.Qid], results: Sequence[int]) -> None:
+        """Projects a chain state onto measurement outcomes and renormalizes it."""
+        for qubit, result in zip(qubits, results):
+            n = self.qubit_map[qubit]
+            d = qubit.dimension
+            projector = np.zeros((d, d))
+            projector[result][result] = 1.0
+
+            old_n = self.i_str(n)
+            new_n = 'new_' + old_n
+
+            projector = qtn.Tensor(projector, inds=(new_n, old_n))
+
+            self.M[n] = (projector @ self.M[n]).reindex({new_n: old_n})
+
+        tensors = self._chain_tensors()
+        assert tensors is not None
+        norm = math.sqrt(self._right_environments(tensors)[0][0, 0].real)
+        n = self.qubit_map[qubits[0]]
+        self.M[n] = self.M[n] / norm
@@ -294,12 +294,18 @@ def test_supremacy_big():
     mps_simulator = ccq.mps_simulator.MPSSimulator(rsum2_cutoff=5e-5)
     result = mps_simulator.simulate(circuit, qubit_order=qubit_order, initial_state=0)
 
-    assert result.final_state.estimation_stats() == {
+    stats = result.final_state.estimation_stats()
+    truncation_errors = stats.pop('truncation_errors')
+    max_bond_dim = stats.pop('max_bond_dim')
+    assert stats == {
         'estimated_fidelity': 0.997,
         'memory_bytes': 11008,
         'num_svd_splits': 64,
         'num_coefs_used': 688,
     }
+    assert len(truncation_errors) == 64
+    assert all(0 <= e < 5e-5 for e in truncation_errors)
+    assert max_bond_dim >= 2
 
 
 def test_simulate_moment_steps_sample():
@@ -388,3 +394,77 @@ def test_state_copy():
         assert len(x) == len(y)
         for i in range(len(x)):
             assert not np.shares_memory(x[i], y[i])
+
+
+def test_sample_chain_ghz():
+    qubits = cirq.LineQubit.range(20)
+    circuit = cirq.Circuit(cirq.H(qubits[0]))
+    circuit.append(cirq.CNOT(a, b) for a, b in zip(qubits, qubits[1:]))
+    circuit.append(cirq.measure(*qubits[::2], key='even'))
+    circuit.append(cirq.measure(*qubits[1::2], key='odd'))
+
+    simulator = ccq.mps_simulator.MPSSimulator(seed=1234)
+    result = simulator.run(circuit, repetitions=200)
+    even = result.measurements['even']
+    odd = result.measurements['odd']
+    assert even.shape == odd.shape == (200, 10)
+    np.testing.assert_equal(even, odd)
+    np.testing.assert_equal(even, np.repeat(even[:, :1], 10, axis=1))
+    assert 50 < np.sum(even[:, 0]) < 150
+
+
+def test_perform_measurement_chain_collapses():
+    q0, q1, q2 = cirq.LineQubit.range(3)
+    circuit = cirq.Circuit(cirq.H(q0), cirq.CNOT(q0, q1), cirq.H(q2))
+    simulator = ccq.mps_simulator.MPSSimulator()
+    state = simulator.simulate(circuit).final_state
+    assert state._chain_tensors() is not None
+
+    result = state.perform_measurement([q1], np.random.RandomState(1))
+    expected = np.zeros((2, 2))
+    expected[result[0], result[0]] = 1
+    expected = np.kron(expected.reshape(-1), np.ones(2) / np.sqrt(2))
+    np.testing.assert_allclose(state.to_numpy(), expected, atol=1e-6)
+
+
+def test_sample_non_chain():
+    q0, q1, q2 = cirq.LineQubit.range(3)
+    circuit = cirq.Circuit(cirq.H(q0), cirq.CNOT(q0, q2))
+    simulator = ccq.mps_simulator.MPSSimulator()
+    state = simulator.simulate(circuit).final_state
+    assert state._chain_tensors() is None
+
+    samples = state.sample([q2, q1, q0], 10, np.random.RandomState(1))
+    assert samples.shape == (10, 3)
+    np.testing.assert_equal(samples[:, 0], samples[:, 2])
+    np.testing.assert_equal(samples[:, 1], 0)
+
+
+def test_max_bond_dim():
+    qubits = cirq.LineQubit.range(6)
+    circuit = cirq.testing.random_circuit(qubits, n_moments=12, op_density=1.0, random_state=1)
+    circuit = cirq.Circuit(op for op in circuit.all_operations() if len(op.qubits) <= 2)
+
+    simulator = ccq.mps_simulator.MPSSimulator(max_bond_dim=2, route_with_swaps=True)
+    state = simulator.simulate(circuit).final_state
+    stats = state.estimation_stats()
+    assert stats['max_bond_dim'] <= 2
+    assert len(stats['truncation_errors']) == stats['num_svd_splits']
+    assert max(stats['truncation_errors']) > 0
+
+    with pytest.raises(ValueError, match='max_bond_dim'):
+        ccq.mps_simulator.MPSSimulator(max_bond_dim=0)
+
+
+def test_route_with_swaps():
+    q0, q1, q2, q3 = cirq.LineQubit.range(4)
+    circuit = cirq.Circuit(
+        cirq.H(q0), cirq.CNOT(q0, q3), cirq.CZ(q3, q1) ** 0.5, cirq.ISWAP(q2, q0) ** 0.3
+    )
+    simulator = ccq.mps_simulator.MPSSimulator(rsum2_cutoff=1e-8, route_with_swaps=True)
+    state = simulator.simulate(circuit).final_state
+    assert state._chain_tensors() is not None
+    assert state.copy().route_with_swaps
+    np.testing.assert_allclose(
+        state.to_numpy(), cirq.final_state_vector(circuit, dtype=np.complex128), atol=1e-4
+    )
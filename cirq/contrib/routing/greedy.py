@@ -107,7 +107,7 @@ class _GreedyRouter:
         initial_mapping: Optional[Dict[ops.Qid, ops.Qid]] = None,
         can_reorder: Callable[
             [ops.Operation, ops.Operation], bool
-        ] = circuits.circuit_dag._disjoint_qubits,
+        ] = circuits.CircuitDag.disjoint_qubits,
         random_state: 'cirq.RANDOM_STATE_OR_SEED_LIKE' = None,
     ):
 
@@ -120,7 +120,11 @@ class _GreedyRouter:
             for b, d in neighbor_distances.items()
         }
 
-        self.remaining_dag = circuits.CircuitDag.from_circuit(circuit, can_reorder=can_reorder)
+        self.remaining_dag = circuits.CircuitDag.from_circuit(
+            circuit,
+            can_reorder=can_reorder,
+            transitive_reduction=can_reorder is circuits.CircuitDag.disjoint_qubits,
+        )
         self.logical_qubits = list(self.remaining_dag.all_qubits())
         self.physical_qubits = list(self.device_graph.nodes)
         self.edge_sets: Dict[int, List[Sequence[QidPair]]] = {}
@@ -382,32 +382,31 @@ def cross_entropy_benchmarking(
     probs_meas = {n: np.zeros((num_circuits, 2 ** num_qubits)) for n in cycle_range}
     probs_exp = {n: np.zeros((num_circuits, 2 ** num_qubits)) for n in cycle_range}
 
-    for k in range(num_circuits):
-
-        # Generates one random XEB circuit with max(num_cycle_range) cycles.
-        # Then the first n cycles of the circuit are taken to generate
-        # shorter circuits with n cycles (n taken from cycles). All of these
-        # circuits are stored in circuits_k.
-        circuits_k = _build_xeb_circuits(
-            qubits, cycle_range, scrambling_gates_per_cycle, benchmark_ops
-        )
+    # Generates the random XEB circuits, each with max(cycle_range) cycles.
+    # The first n cycles of each circuit are taken to generate shorter
+    # circuits with n cycles (n taken from cycles).
+    xeb_cycles = [
+        _random_xeb_cycles(qubits, max(cycle_range), scrambling_gates_per_cycle, benchmark_ops)
+        for _ in range(num_circuits)
+    ]
 
-        # Run each circuit with the sampler to obtain a collection of
-        # bit-strings, from which the bit-string probabilities are estimated.
-        probs_meas_k = _measure_prob_distribution(sampler, repetitions, qubits, circuits_k)
+    # Run all the circuits with the sampler as a single batch to obtain
+    # collections of bit-strings, from which the bit-string probabilities are
+    # estimated.
+    all_circuits = [
+        circuit for cycles_k in xeb_cycles for circuit in _truncated_circuits(cycles_k, cycle_range)
+    ]
+    all_probs_meas = _measure_prob_distribution(sampler, repetitions, qubits, all_circuits)
 
-        # Simulate each circuit with the Cirq simulator to obtain the
-        # state vector at the end of each circuit, from which the
-        # theoretically expected bit-string probabilities are obtained.
-        probs_exp_k = []  # type: List[np.ndarray]
-        for circ_k in circuits_k:
-            res = simulator.simulate(circ_k, qubit_order=qubits)
-            state_probs = np.abs(np.asarray(res.final_state_vector)) ** 2  # type: ignore
-            probs_exp_k.append(state_probs)
+    for k, cycles_k in enumerate(xeb_cycles):
+        # Simulate each random circuit once with the Cirq simulator, and
+        # obtain the theoretically expected bit-string probabilities from the
+        # state vector at the end of each number of cycles.
+        probs_exp_k = _simulate_prefix_probabilities(simulator, cycles_k, qubits, cycle_range)
 
         for i, num_cycle in enumerate(cycle_range):
             probs_exp[num_cycle][k, :] = probs_exp_k[i]
-            probs_meas[num_cycle][k, :] = probs_meas_k[i]
+            probs_meas[num_cycle][k, :] = all_probs_meas[k * len(cycle_range) + i]
 
     fidelity_vals = _xeb_fidelities(probs_exp, probs_meas)
     xeb_data = [CrossEntropyPair(c, k) for (c, k) in zip(cycle_range, fidelity_vals)]
@@ -470,34 +469,105 @@ def build_entangling_layers(
     ]
 
 
-def _build_xeb_circuits(
+def _random_xeb_cycles(
     qubits: Sequence[ops.Qid],
-    cycles: Sequence[int],
+    num_cycles: int,
     single_qubit_gates: List[List[ops.SingleQubitGate]] = None,
     benchmark_ops: Sequence[ops.Moment] = None,
 ) -> List[circuits.Circuit]:
-    if benchmark_ops is not None:
-        num_d = len(benchmark_ops)
-    else:
-        num_d = 0
-    max_cycles = max(cycles)
-
+    """Returns the cycles of a random XEB circuit, one circuit per cycle."""
     if single_qubit_gates is None:
-        single_rots = _random_half_rotations(qubits, max_cycles)
+        single_rots = _random_half_rotations(qubits, num_cycles)
     else:
-        single_rots = _random_any_gates(qubits, single_qubit_gates, max_cycles)
+        single_rots = _random_any_gates(qubits, single_qubit_gates, num_cycles)
+    xeb_cycles = []  # type: List[circuits.Circuit]
+    for i in range(num_cycles):
+        cycle = circuits.Circuit(single_rots[i])
+        if benchmark_ops is not None:
+            for op_set in benchmark_ops[i % len(benchmark_ops)]:
+                cycle.append(op_set)
+        xeb_cycles.append(cycle)
+    return xeb_cycles
+
+
+def _truncated_circuits(
+    xeb_cycles: Sequence[circuits.Circuit], cycles: Sequence[int]
+) -> List[circuits.Circuit]:
+    """Returns the circuits made of the first n cycles, for each n in cycles."""
     all_circuits = []  # type: List[circuits.Circuit]
     for num_cycles in cycles:
-        circuit_exp = circuits.Circuit()
-        for i in range(num_cycles):
-            circuit_exp.append(single_rots[i])
-            if benchmark_ops is not None:
-                for op_set in benchmark_ops[i % num_d]:
-                    circuit_exp.append(op_set)
-        all_circuits.append(circuit_exp)
+        circuit = circuits.Circuit()
+        for cycle in xeb_cycles[:num_cycles]:
+            circuit.append(cycle.all_operations())
+        all_circuits.append(circuit)
     return all_circuits
 
 
+def _build_xeb_circuits(
+    qubits: Sequence[ops.Qid],
+    cycles: Sequence[int],
+    single_qubit_gates: List[List[ops.SingleQubitGate]] = None,
+    benchmark_ops: Sequence[ops.Moment] = None,
+) -> List[circuits.Circuit]:
+    xeb_cycles = _random_xeb_cycles(qubits, max(cycles), single_qubit_gates, benchmark_ops)
+    return _truncated_circuits(xeb_cycles, cycles)
+
+
+def _simulate_prefix_probabilities(
+    simulator: 'cirq.SimulatesFinalState',
+    xeb_cycles: Sequence[circuits.Circuit],
+    qubits: Sequence[ops.Qid],
+    cycles: Sequence[int],
+) -> List[np.ndarray]:
+    """Returns the ideal bit-string probabilities after each number of cycles.
+
+    Simulators that yield intermediate state vectors simulate the cycles once,
+    and the probabilities are read off at the needed cycle boundaries.
+    Otherwise, each truncated circuit is simulated from scratch.
+    """
+    if not isinstance(simulator, sim.SimulatesIntermediateStateVector):
+        return [
+            np.abs(simulator.simulate(circuit, qubit_order=qubits).final_state_vector) ** 2
+            for circuit in _truncated_circuits(xeb_cycles, cycles)
+        ]
+    # Concatenating the cycles keeps each cycle boundary at a moment boundary.
+    circuit = circuits.Circuit()
+    cycle_ends = [0]
+    for cycle in xeb_cycles[: max(cycles, default=0)]:
+        circuit += cycle
+        cycle_ends.append(len(circuit))
+    return _simulate_probabilities_at_moments(
+        simulator, circuit, qubits, [cycle_ends[n] for n in cycles]
+    )
+
+
+def _simulate_probabilities_at_moments(
+    simulator: 'cirq.SimulatesIntermediateStateVector',
+    circuit: circuits.Circuit,
+    qubits: Sequence[ops.Qid],
+    moment_counts: Sequence[int],
+) -> List[np.ndarray]:
+    """Returns the bit-string probabilities after the first moments of a circuit.
+
+    The circuit is simulated once. The i'th returned array holds the
+    probabilities of the state after the first `moment_counts[i]` moments.
+    """
+    probabilities = {}  # type: Dict[int, np.ndarray]
+    if 0 in moment_counts:
+        probabilities[0] = np.zeros(2 ** len(qubits))
+        probabilities[0][0] = 1
+    needed = set(moment_counts) - {0}
+    if needed:
+        steps = simulator.simulate_moment_steps(circuit, qubit_order=qubits)
+        for num_moments, step_result in enumerate(steps, start=1):
+            if num_moments in needed:
+                amplitudes = step_result.state_vector(copy=False)
+                probabilities[num_moments] = np.abs(amplitudes) ** 2
+                if len(probabilities) == len(set(moment_counts)):
+                    break
+    return [probabilities[n] for n in moment_counts]
+
+
 def _measure_prob_distribution(
     sampler: work.Sampler,
     repetitions: int,
@@ -506,14 +576,15 @@ def _measure_prob_distribution(
 ) -> List[np.ndarray]:
     all_probs = []  # type: List[np.ndarray]
     num_states = 2 ** len(qubits)
+    trial_circuits = []
     for circuit in circuit_list:
         trial_circuit = circuit.copy()
         trial_circuit.append(ops.measure(*qubits, key='z'))
-        res = sampler.run(trial_circuit, repetitions=repetitions)
-        res_hist = dict(res.histogram(key='z'))
+        trial_circuits.append(trial_circuit)
+    for [res] in sampler.run_batch(trial_circuits, repetitions=repetitions):
+        values, counts = res.counts(['z'])
         probs = np.zeros(num_states, dtype=float)
-        for k, v in res_hist.items():
-            probs[k] = float(v) / float(repetitions)
+        probs[values[:, 0]] = counts / float(repetitions)
         all_probs.append(probs)
     return all_probs
 
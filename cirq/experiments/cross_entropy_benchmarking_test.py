@@ -144,3 +144,28 @@ def test_cross_entropy_result_purity_model_fails_with_no_data():
     result = CrossEntropyResult(data=data, repetitions=1000)
     with pytest.raises(ValueError):
         _ = result.purity_depolarizing_model()
+
+
+
+class _FinalStateOnlySimulator:
+    def simulate(self, circuit, qubit_order):
+        return cirq.Simulator().simulate(circuit, qubit_order=qubit_order)
+
+
+@pytest.mark.parametrize('simulator', [cirq.Simulator(), _FinalStateOnlySimulator()])
+def test_simulate_prefix_probabilities(simulator):
+    from cirq.experiments.cross_entropy_benchmarking import (
+        _random_xeb_cycles,
+        _simulate_prefix_probabilities,
+        _truncated_circuits,
+    )
+
+    qubits = cirq.GridQubit.square(2)
+    xeb_cycles = _random_xeb_cycles(
+        qubits, 6, benchmark_ops=build_entangling_layers(qubits, cirq.CZ ** 0.91)
+    )
+    cycles = [5, 0, 2, 6, 2]
+    probabilities = _simulate_prefix_probabilities(simulator, xeb_cycles, qubits, cycles)
+    for circuit, probs in zip(_truncated_circuits(xeb_cycles, cycles), probabilities):
+        expected = cirq.final_state_vector(circuit, qubit_order=qubits)
+        np.testing.assert_allclose(probs, np.abs(expected) ** 2, atol=1e-6)
@@ -37,6 +37,7 @@ from cirq.experiments.cross_entropy_benchmarking import (
     CrossEntropyResultDict,
     CrossEntropyPair,
     SpecklePurityPair,
+    _simulate_probabilities_at_moments,
 )
 from cirq.experiments.fidelity_estimation import least_squares_xeb_fidelity_from_probabilities
 from cirq.experiments.purity_estimation import purity_from_probabilities
@@ -490,14 +491,14 @@ def _get_xeb_result(
     )  # type: Dict[int, List[Tuple[np.ndarray, np.ndarray]]]
     empirical_probabilities = collections.defaultdict(list)  # type: Dict[int, List[np.ndarray]]
     for i, circuit in enumerate(circuits):
-        step_results = simulator.simulate_moment_steps(circuit, qubit_order=qubit_pair)
-        moment_index = 0
-        for depth, measurements in zip(cycles, measurement_results[i]):
-            while moment_index < 2 * depth:
-                step_result = next(step_results)
-                moment_index += 1
-            amplitudes = step_result.state_vector()
-            probabilities = np.abs(amplitudes) ** 2
+        # Each cycle is two moments, so one pass over the circuit gives the
+        # probabilities at every depth.
+        all_depth_probabilities = _simulate_probabilities_at_moments(
+            simulator, circuit, qubit_pair, [2 * depth for depth in cycles]
+        )
+        for depth, probabilities, measurements in zip(
+            cycles, all_depth_probabilities, measurement_results[i]
+        ):
             _, counts = np.unique(measurements, return_counts=True)
             empirical_probs = counts / len(measurements)
             empirical_probs = np.pad(
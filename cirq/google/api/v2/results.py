@@ -162,6 +162,7 @@ def results_to_proto(
 def results_from_proto(
     msg: result_pb2.Result,
     measurements: List[MeasureInfo] = None,
+    pack_measurements: bool = False,
 ) -> List[List[study.Result]]:
     """Converts a v2 result proto into List of list of trial results.
 
@@ -171,6 +172,8 @@ def results_from_proto(
             This may be used for custom ordering of the result. If no
             measurement config is provided, then all results will be returned
             in the order specified within the result.
+        pack_measurements: If True, the trial results store their
+            measurements bit-packed, see `cirq.Result.from_packed_bits`.
 
     Returns:
         A list containing a list of trial results for each sweep.
@@ -178,13 +181,15 @@ def results_from_proto(
 
     measure_map = {m.key: m for m in measurements} if measurements else None
     return [
-        _trial_sweep_from_proto(sweep_result, measure_map) for sweep_result in msg.sweep_results
+        _trial_sweep_from_proto(sweep_result, measure_map, pack_measurements)
+        for sweep_result in msg.sweep_results
     ]
 
 
 def _trial_sweep_from_proto(
     msg: result_pb2.SweepResult,
     measure_map: Dict[str, MeasureInfo] = None,
+    pack_measurements: bool = False,
 ) -> List[study.Result]:
     """Converts a SweepResult proto into List of list of trial results.
 
@@ -194,6 +199,8 @@ def _trial_sweep_from_proto(
             configuration containing qubit ordering. If no measurement config is
             provided, then all results will be returned in the order specified
             within the result.
+        pack_measurements: If True, the trial results store their
+            measurements bit-packed.
 
     Returns:
         A list containing a list of trial results for the sweep.
@@ -202,22 +209,47 @@ def _trial_sweep_from_proto(
     trial_sweep: List[study.Result] = []
     for pr in msg.parameterized_results:
         m_data: Dict[str, np.ndarray] = {}
+        num_qubits: Dict[str, int] = {}
         for mr in pr.measurement_results:
-            qubit_results: OrderedDict[devices.GridQubit, np.ndarray] = OrderedDict()
+            qubit_results: OrderedDict[devices.GridQubit, bytes] = OrderedDict()
             for qmr in mr.qubit_measurement_results:
                 qubit = v2.grid_qubit_from_proto_id(qmr.qubit.id)
                 if qubit in qubit_results:
                     raise ValueError('qubit already exists: {}'.format(qubit))
-                qubit_results[qubit] = unpack_bits(qmr.results, msg.repetitions)
+                qubit_results[qubit] = qmr.results
             if measure_map:
                 ordered_results = [qubit_results[qubit] for qubit in measure_map[mr.key].qubits]
             else:
                 ordered_results = list(qubit_results.values())
-            m_data[mr.key] = np.array(ordered_results).transpose()
-        trial_sweep.append(
-            study.Result.from_single_parameter_set(
-                params=study.ParamResolver(dict(pr.params.assignments)),
-                measurements=m_data,
+            if pack_measurements:
+                m_data[mr.key] = _pack_shots(ordered_results, msg.repetitions)
+                num_qubits[mr.key] = len(ordered_results)
+            else:
+                m_data[mr.key] = np.array(
+                    [unpack_bits(data, msg.repetitions) for data in ordered_results]
+                ).transpose()
+        params = study.ParamResolver(dict(pr.params.assignments))
+        if pack_measurements:
+            trial_result = study.Result.from_packed_bits(
+                params=params, packed_measurements=m_data, num_qubits=num_qubits
+            )
+        else:
+            trial_result = study.Result.from_single_parameter_set(
+                params=params, measurements=m_data
             )
-        )
+        trial_sweep.append(trial_result)
     return trial_sweep
+
+
+def _pack_shots(qubit_data: List[bytes], repetitions: int) -> np.ndarray:
+    """Converts bits packed per qubit, as in the proto, to bits packed per shot.
+
+    Returns a uint8 array with one row per repetition, as produced by
+    `np.packbits(bits, axis=1)` for the (repetitions, qubits) array of bits.
+    """
+    num_bytes = (repetitions + 7) // 8
+    byte_arr = np.frombuffer(b''.join(qubit_data), dtype='uint8')
+    byte_arr = byte_arr.reshape((len(qubit_data), num_bytes, 1))
+    # The proto packs bits in little-endian order within each byte.
+    bits = np.unpackbits(byte_arr, axis=2)[:, :, ::-1].reshape((len(qubit_data), 8 * num_bytes))
+    return np.packbits(bits[:, :repetitions].transpose(), axis=1)
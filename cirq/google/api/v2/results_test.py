@@ -181,6 +181,37 @@ def test_results_to_proto():
             )
 
 
+@pytest.mark.parametrize('reps', [1, 8, 13])
+def test_results_from_proto_pack_measurements(reps):
+    measurements = [
+        v2.MeasureInfo('foo', [q(0, i) for i in range(11)], slot=0, invert_mask=[], tags=[]),
+        v2.MeasureInfo('bar', [q(1, 0)], slot=0, invert_mask=[], tags=[]),
+    ]
+    prng = np.random.RandomState(reps)
+    trial_results = [
+        [
+            cirq.Result.from_single_parameter_set(
+                params=cirq.ParamResolver({'i': i}),
+                measurements={
+                    'foo': prng.randint(2, size=(reps, 11)).astype(bool),
+                    'bar': prng.randint(2, size=(reps, 1)).astype(bool),
+                },
+            )
+            for i in range(2)
+        ]
+    ]
+    proto = v2.results_to_proto(trial_results, measurements)
+    deserialized = v2.results_from_proto(proto, measurements, pack_measurements=True)
+    for trial_result, expected in zip(deserialized[0], trial_results[0]):
+        assert trial_result == expected
+        assert trial_result.repetitions == reps
+        for key in ['foo', 'bar']:
+            assert trial_result.measurements[key].dtype == bool
+            np.testing.assert_array_equal(
+                trial_result.measurements[key], expected.measurements[key]
+            )
+
+
 def test_results_to_proto_sweep_repetitions():
     measurements = [v2.MeasureInfo('foo', [q(0, 0)], slot=0, invert_mask=[False], tags=[])]
     trial_results = [
@@ -28,7 +28,18 @@ import enum
 import os
 import random
 import string
-from typing import Dict, Iterable, List, Optional, Sequence, Set, TypeVar, Union, TYPE_CHECKING
+from typing import (
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    TypeVar,
+    Union,
+    TYPE_CHECKING,
+)
 
 from google.protobuf import any_pb2
 from cirq.google.engine.client import quantum
@@ -53,6 +64,12 @@ TYPE_PREFIX = 'type.googleapis.com/'
 
 _R = TypeVar('_R')
 
+# A circuit, the gate set it is serialized with, and the program description
+# and labels. Programs created from equal keys are interchangeable.
+_ProgramCacheKey = Tuple[
+    'cirq.FrozenCircuit', sgs.SerializableGateSet, Optional[str], Tuple[Tuple[str, str], ...]
+]
+
 
 class ProtoVersion(enum.Enum):
     """Protocol buffer version to use for requests to the quantum engine."""
@@ -140,6 +157,7 @@ class Engine:
         verbose: Optional[bool] = None,
         timeout: Optional[int] = None,
         context: Optional[EngineContext] = None,
+        cache_programs: bool = False,
     ) -> None:
         """Supports creating and running programs against the Quantum Engine.
 
@@ -158,6 +176,12 @@ class Engine:
                 to never timeout.
             context: Engine configuration and context to use. For most users
                 this should never be specified.
+            cache_programs: If True, programs created by this engine are
+                remembered by circuit, gate set, description and labels.
+                `run`, `run_sweep` and `run_sweep_async` calls without a
+                `program_id` then reuse a matching program and only create a
+                new job, and `create_program` reuses the serialized circuit.
+                See `clear_program_cache`.
         """
         if context and (proto_version or service_args or verbose):
             raise ValueError('Either provide context or proto_version, service_args and verbose.')
@@ -171,6 +195,8 @@ class Engine:
                 timeout=timeout,
             )
         self.context = context
+        self._cache_programs = cache_programs
+        self._program_cache: Dict[_ProgramCacheKey, Tuple[str, any_pb2.Any]] = {}
 
     def __str__(self) -> str:
         return f'Engine(project_id={self.project_id!r})'
@@ -285,9 +311,13 @@ class Engine:
         """
         if not gate_set:
             raise ValueError('No gate set provided')
-        engine_program = self.create_program(
+        engine_program = self._cached_program(
             program, program_id, gate_set, program_description, program_labels
         )
+        if engine_program is None:
+            engine_program = self.create_program(
+                program, program_id, gate_set, program_description, program_labels
+            )
         return engine_program.run_sweep(
             job_id=job_id,
             params=params,
@@ -297,6 +327,44 @@ class Engine:
             labels=job_labels,
         )
 
+    async def run_sweep_async(
+        self,
+        program: 'cirq.Circuit',
+        program_id: Optional[str] = None,
+        job_id: Optional[str] = None,
+        params: study.Sweepable = None,
+        repetitions: int = 1,
+        processor_ids: Sequence[str] = ('xmonsim',),
+        gate_set: Optional[sgs.SerializableGateSet] = None,
+        program_description: Optional[str] = None,
+        program_labels: Optional[Dict[str, str]] = None,
+        job_description: Optional[str] = None,
+        job_labels: Optional[Dict[str, str]] = None,
+    ) -> engine_job.EngineJob:
+        """Asynchronously runs the supplied Circuit via Quantum Engine.
+
+        The program and job are created without blocking the event loop, so
+        that many calls can be in flight at once. See `run_sweep` for the
+        arguments and return value.
+        """
+        if not gate_set:
+            raise ValueError('No gate set provided')
+        engine_program = self._cached_program(
+            program, program_id, gate_set, program_description, program_labels
+        )
+        if engine_program is None:
+            engine_program = await self.create_program_async(
+                program, program_id, gate_set, program_description, program_labels
+            )
+        return await engine_program.run_sweep_async(
+            job_id=job_id,
+            params=params,
+            repetitions=repetitions,
+            processor_ids=processor_ids,
+            description=job_description,
+            labels=job_labels,
+        )
+
     def run_batch(
         self,
         programs: List['cirq.Circuit'],
@@ -478,13 +546,51 @@ class Engine:
         if not program_id:
             program_id = _make_random_id('prog-')
 
+        key = self._program_cache_key(program, gate_set, description, labels)
+        code = self._serialize_program_cached(key, program, gate_set)
         new_program_id, new_program = self.context.client.create_program(
             self.project_id,
             program_id,
-            code=self._serialize_program(program, gate_set),
+            code=code,
+            description=description,
+            labels=labels,
+        )
+        if key is not None:
+            self._program_cache[key] = (new_program_id, code)
+
+        return engine_program.EngineProgram(
+            self.project_id, new_program_id, self.context, new_program
+        )
+
+    async def create_program_async(
+        self,
+        program: 'cirq.Circuit',
+        program_id: Optional[str] = None,
+        gate_set: Optional[sgs.SerializableGateSet] = None,
+        description: Optional[str] = None,
+        labels: Optional[Dict[str, str]] = None,
+    ) -> engine_program.EngineProgram:
+        """Asynchronously wraps a Circuit for use with the Quantum Engine.
+
+        See `create_program` for the arguments and return value.
+        """
+        if not gate_set:
+            raise ValueError('No gate set provided')
+
+        if not program_id:
+            program_id = _make_random_id('prog-')
+
+        key = self._program_cache_key(program, gate_set, description, labels)
+        code = self._serialize_program_cached(key, program, gate_set)
+        new_program_id, new_program = await self.context.client.create_program_async(
+            self.project_id,
+            program_id,
+            code=code,
             description=description,
             labels=labels,
         )
+        if key is not None:
+            self._program_cache[key] = (new_program_id, code)
 
         return engine_program.EngineProgram(
             self.project_id, new_program_id, self.context, new_program
@@ -607,6 +713,55 @@ class Engine:
         else:
             raise ValueError('invalid program proto version: {}'.format(self.context.proto_version))
 
+    def _program_cache_key(
+        self,
+        program: 'cirq.Circuit',
+        gate_set: sgs.SerializableGateSet,
+        description: Optional[str],
+        labels: Optional[Dict[str, str]],
+    ) -> Optional[_ProgramCacheKey]:
+        if not self._cache_programs or not isinstance(program, circuits.Circuit):
+            return None
+        return program.freeze(), gate_set, description, tuple(sorted((labels or {}).items()))
+
+    def _serialize_program_cached(
+        self,
+        key: Optional[_ProgramCacheKey],
+        program: 'cirq.Circuit',
+        gate_set: sgs.SerializableGateSet,
+    ) -> any_pb2.Any:
+        if key is not None and key in self._program_cache:
+            return self._program_cache[key][1]
+        return self._serialize_program(program, gate_set)
+
+    def _cached_program(
+        self,
+        program: 'cirq.Circuit',
+        program_id: Optional[str],
+        gate_set: sgs.SerializableGateSet,
+        description: Optional[str],
+        labels: Optional[Dict[str, str]],
+    ) -> Optional[engine_program.EngineProgram]:
+        """Returns a previously created program for the circuit, if any.
+
+        A requested `program_id` always gets a new program.
+        """
+        if program_id:
+            return None
+        key = self._program_cache_key(program, gate_set, description, labels)
+        if key is None or key not in self._program_cache:
+            return None
+        program_id, _ = self._program_cache[key]
+        return engine_program.EngineProgram(self.project_id, program_id, self.context)
+
+    def clear_program_cache(self) -> None:
+        """Forgets the programs remembered when `cache_programs` is set.
+
+        Call this after deleting programs on the Quantum Engine, so that later
+        runs upload their circuits again.
+        """
+        self._program_cache.clear()
+
     def _pack_any(self, message: 'google.protobuf.Message') -> any_pb2.Any:
         """Packs a message into an Any proto.
 
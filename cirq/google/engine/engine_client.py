@@ -12,6 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import asyncio
 import datetime
 import sys
 import time
@@ -156,20 +157,57 @@ class EngineClient:
             try:
                 return request()
             except GoogleAPICallError as err:
-                message = err.message
-                # Raise RuntimeError for exceptions that are not retryable.
-                # Otherwise, pass through to retry.
-                if err.code.value not in RETRYABLE_ERROR_CODES:
-                    raise EngineException(message) from err
-
-            if current_delay > self.max_retry_delay_seconds:
-                raise TimeoutError('Reached max retry attempts for error: {}'.format(message))
-            if self.verbose:
-                print(message, file=sys.stderr)
-                print('Waiting ', current_delay, 'seconds before retrying.', file=sys.stderr)
+                self._prepare_retry(err, current_delay)
             time.sleep(current_delay)
             current_delay *= 2
 
+    async def _make_request_async(self, request: Callable[[], _R]) -> _R:
+        """Like `_make_request`, but without blocking the event loop.
+
+        The request runs in the default executor of the running loop, and the
+        delays between retries are spent in `asyncio.sleep`.
+        """
+        loop = asyncio.get_event_loop()
+        current_delay = 0.1
+
+        while True:
+            try:
+                return await loop.run_in_executor(None, request)
+            except GoogleAPICallError as err:
+                self._prepare_retry(err, current_delay)
+            await asyncio.sleep(current_delay)
+            current_delay *= 2
+
+    def _prepare_retry(self, err: GoogleAPICallError, current_delay: float) -> None:
+        """Raises if a failed request should not be retried after current_delay."""
+        message = err.message
+        # Raise RuntimeError for exceptions that are not retryable.
+        # Otherwise, pass through to retry.
+        if err.code.value not in RETRYABLE_ERROR_CODES:
+            raise EngineException(message) from err
+        if current_delay > self.max_retry_delay_seconds:
+            raise TimeoutError('Reached max retry attempts for error: {}'.format(message))
+        if self.verbose:
+            print(message, file=sys.stderr)
+            print('Waiting ', current_delay, 'seconds before retrying.', file=sys.stderr)
+
+    def _create_program_request(
+        self,
+        project_id: str,
+        program_id: Optional[str],
+        code: qtypes.any_pb2.Any,
+        description: Optional[str],
+        labels: Optional[Dict[str, str]],
+    ) -> Callable[[], qtypes.QuantumProgram]:
+        parent_name = self._project_name(project_id)
+        program_name = self._program_name_from_ids(project_id, program_id) if program_id else ''
+        request = qtypes.QuantumProgram(name=program_name, code=code)
+        if description:
+            request.description = description
+        if labels:
+            request.labels.update(labels)
+        return lambda: self.grpc_client.create_quantum_program(parent_name, request, False)
+
     def create_program(
         self,
         project_id: str,
@@ -190,17 +228,25 @@ class EngineClient:
         Returns:
             Tuple of created program id and program
         """
+        program = self._make_request(
+            self._create_program_request(project_id, program_id, code, description, labels)
+        )
+        return self._ids_from_program_name(program.name)[1], program
 
-        parent_name = self._project_name(project_id)
-        program_name = self._program_name_from_ids(project_id, program_id) if program_id else ''
-        request = qtypes.QuantumProgram(name=program_name, code=code)
-        if description:
-            request.description = description
-        if labels:
-            request.labels.update(labels)
+    async def create_program_async(
+        self,
+        project_id: str,
+        program_id: Optional[str],
+        code: qtypes.any_pb2.Any,
+        description: Optional[str] = None,
+        labels: Optional[Dict[str, str]] = None,
+    ) -> Tuple[str, qtypes.QuantumProgram]:
+        """Asynchronously creates a Quantum Engine program.
 
-        program = self._make_request(
-            lambda: self.grpc_client.create_quantum_program(parent_name, request, False)
+        See `create_program` for the arguments and return value.
+        """
+        program = await self._make_request_async(
+            self._create_program_request(project_id, program_id, code, description, labels)
         )
         return self._ids_from_program_name(program.name)[1], program
 
@@ -374,32 +420,17 @@ class EngineClient:
             )
         )
 
-    def create_job(
+    def _create_job_request(
         self,
         project_id: str,
         program_id: str,
         job_id: Optional[str],
         processor_ids: Sequence[str],
         run_context: qtypes.any_pb2.Any,
-        priority: Optional[int] = None,
-        description: Optional[str] = None,
-        labels: Optional[Dict[str, str]] = None,
-    ) -> Tuple[str, qtypes.QuantumJob]:
-        """Creates and runs a job on Quantum Engine.
-
-        Args:
-            project_id: A project_id of the parent Google Cloud Project.
-            program_id: Unique ID of the program within the parent project.
-            job_id: Unique ID of the job within the parent program.
-            run_context: Properly serialized run context.
-            processor_ids: List of processor id for running the program.
-            priority: Optional priority to run at, 0-1000.
-            description: Optional description to set on the job.
-            labels: Optional set of labels to set on the job.
-
-        Returns:
-            Tuple of created job id and job
-        """
+        priority: Optional[int],
+        description: Optional[str],
+        labels: Optional[Dict[str, str]],
+    ) -> Callable[[], qtypes.QuantumJob]:
         # Check program to run and program parameters.
         if priority and not 0 <= priority < 1000:
             raise ValueError('priority must be between 0 and 1000')
@@ -424,9 +455,75 @@ class EngineClient:
             request.description = description
         if labels:
             request.labels.update(labels)
+        return lambda: self.grpc_client.create_quantum_job(
+            self._program_name_from_ids(project_id, program_id), request, False
+        )
+
+    def create_job(
+        self,
+        project_id: str,
+        program_id: str,
+        job_id: Optional[str],
+        processor_ids: Sequence[str],
+        run_context: qtypes.any_pb2.Any,
+        priority: Optional[int] = None,
+        description: Optional[str] = None,
+        labels: Optional[Dict[str, str]] = None,
+    ) -> Tuple[str, qtypes.QuantumJob]:
+        """Creates and runs a job on Quantum Engine.
+
+        Args:
+            project_id: A project_id of the parent Google Cloud Project.
+            program_id: Unique ID of the program within the parent project.
+            job_id: Unique ID of the job within the parent program.
+            run_context: Properly serialized run context.
+            processor_ids: List of processor id for running the program.
+            priority: Optional priority to run at, 0-1000.
+            description: Optional description to set on the job.
+            labels: Optional set of labels to set on the job.
+
+        Returns:
+            Tuple of created job id and job
+        """
         job = self._make_request(
-            lambda: self.grpc_client.create_quantum_job(
-                self._program_name_from_ids(project_id, program_id), request, False
+            self._create_job_request(
+                project_id,
+                program_id,
+                job_id,
+                processor_ids,
+                run_context,
+                priority,
+                description,
+                labels,
+            )
+        )
+        return self._ids_from_job_name(job.name)[2], job
+
+    async def create_job_async(
+        self,
+        project_id: str,
+        program_id: str,
+        job_id: Optional[str],
+        processor_ids: Sequence[str],
+        run_context: qtypes.any_pb2.Any,
+        priority: Optional[int] = None,
+        description: Optional[str] = None,
+        labels: Optional[Dict[str, str]] = None,
+    ) -> Tuple[str, qtypes.QuantumJob]:
+        """Asynchronously creates and runs a job on Quantum Engine.
+
+        See `create_job` for the arguments and return value.
+        """
+        job = await self._make_request_async(
+            self._create_job_request(
+                project_id,
+                program_id,
+                job_id,
+                processor_ids,
+                run_context,
+                priority,
+                description,
+                labels,
             )
         )
         return self._ids_from_job_name(job.name)[2], job
@@ -506,6 +603,19 @@ class EngineClient:
             )
         )
 
+    async def get_job_async(
+        self, project_id: str, program_id: str, job_id: str, return_run_context: bool
+    ) -> qtypes.QuantumJob:
+        """Asynchronously returns a previously created job.
+
+        See `get_job` for the arguments.
+        """
+        return await self._make_request_async(
+            lambda: self.grpc_client.get_quantum_job(
+                self._job_name_from_ids(project_id, program_id, job_id), return_run_context
+            )
+        )
+
     def set_job_description(
         self, project_id: str, program_id: str, job_id: str, description: str
     ) -> qtypes.QuantumJob:
@@ -660,6 +770,19 @@ class EngineClient:
             )
         )
 
+    async def get_job_results_async(
+        self, project_id: str, program_id: str, job_id: str
+    ) -> qtypes.QuantumResult:
+        """Asynchronously returns the results of a completed job.
+
+        See `get_job_results` for the arguments and return value.
+        """
+        return await self._make_request_async(
+            lambda: self.grpc_client.get_quantum_result(
+                self._job_name_from_ids(project_id, program_id, job_id)
+            )
+        )
+
     def list_processors(self, project_id: str) -> List[qtypes.QuantumProcessor]:
         """Returns a list of Processors that the user has visibility to in the
         current Engine project. The names of these processors are used to
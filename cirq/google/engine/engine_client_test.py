@@ -886,6 +886,88 @@ def test_api_retry_times(client_constructor, mock_time):
         x == y for (x, _), y in zip(mock_time.call_args_list, [(0.1,), (0.2,)]))
 
 
+@pytest.mark.asyncio
+async def test_create_program_and_job_async():
+    with mock.patch.object(quantum, 'QuantumEngineServiceClient', autospec=True) as constructor:
+        grpc_client = setup_mock_(constructor)
+        program = qtypes.QuantumProgram(name='projects/proj/programs/prog')
+        grpc_client.create_quantum_program.return_value = program
+        job = qtypes.QuantumJob(name='projects/proj/programs/prog/jobs/job0')
+        grpc_client.create_quantum_job.return_value = job
+        grpc_client.get_quantum_job.return_value = job
+        result = qtypes.QuantumResult(parent='projects/proj/programs/prog/jobs/job0')
+        grpc_client.get_quantum_result.return_value = result
+
+        code = qtypes.any_pb2.Any()
+        run_context = qtypes.any_pb2.Any()
+        client = EngineClient()
+        assert await client.create_program_async('proj', 'prog', code) == ('prog', program)
+        assert grpc_client.create_quantum_program.call_args[0] == (
+            'projects/proj',
+            qtypes.QuantumProgram(name='projects/proj/programs/prog', code=code),
+            False,
+        )
+        assert await client.create_job_async(
+            'proj', 'prog', 'job0', ['processor0'], run_context, 10
+        ) == ('job0', job)
+        assert grpc_client.create_quantum_job.call_args[0] == (
+            'projects/proj/programs/prog',
+            qtypes.QuantumJob(
+                name='projects/proj/programs/prog/jobs/job0',
+                run_context=run_context,
+                scheduling_config=qtypes.SchedulingConfig(
+                    priority=10,
+                    processor_selector=qtypes.SchedulingConfig.ProcessorSelector(
+                        processor_names=['projects/proj/processors/processor0']
+                    ),
+                ),
+            ),
+            False,
+        )
+        assert await client.get_job_async('proj', 'prog', 'job0', False) == job
+        assert grpc_client.get_quantum_job.call_args[0] == (
+            'projects/proj/programs/prog/jobs/job0',
+            False,
+        )
+        assert await client.get_job_results_async('proj', 'prog', 'job0') == result
+        assert grpc_client.get_quantum_result.call_args[0] == (
+            'projects/proj/programs/prog/jobs/job0',
+        )
+
+        with pytest.raises(ValueError, match='priority must be between 0 and 1000'):
+            await client.create_job_async('proj', 'prog', 'job0', ['processor0'], run_context, 5000)
+
+
+@pytest.mark.asyncio
+async def test_api_retry_async():
+    delays = []
+
+    async def fake_sleep(delay):
+        delays.append(delay)
+
+    with mock.patch.object(
+        quantum, 'QuantumEngineServiceClient', autospec=True
+    ) as constructor, mock.patch('asyncio.sleep', new=fake_sleep):
+        grpc_client = setup_mock_(constructor)
+        job = qtypes.QuantumJob(name='projects/proj/programs/prog/jobs/job0')
+        grpc_client.get_quantum_job.side_effect = [
+            exceptions.ServiceUnavailable('internal error'),
+            job,
+        ]
+        client = EngineClient(max_retry_delay_seconds=0.3)
+        assert await client.get_job_async('proj', 'prog', 'job0', False) == job
+        assert delays == [0.1]
+
+        grpc_client.get_quantum_job.side_effect = exceptions.ServiceUnavailable('internal error')
+        with pytest.raises(TimeoutError, match='Reached max retry attempts.*internal error'):
+            await client.get_job_async('proj', 'prog', 'job0', False)
+        assert delays == [0.1, 0.1, 0.2]
+
+        grpc_client.get_quantum_job.side_effect = exceptions.NotFound('not found')
+        with pytest.raises(EngineException, match='not found'):
+            await client.get_job_async('proj', 'prog', 'job0', False)
+
+
 @mock.patch.object(quantum, 'QuantumEngineServiceClient', autospec=True)
 def test_create_reservation(client_constructor):
     grpc_client = setup_mock_(client_constructor)
@@ -12,6 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 """A helper for jobs that have been created on the Quantum Engine."""
+import asyncio
 import datetime
 import time
 
@@ -36,6 +37,11 @@ TERMINAL_STATES = [
     quantum.enums.ExecutionStatus.State.CANCELLED,
 ]
 
+# Bounds on the delay between two polls of a job in `EngineJob.results_async`.
+# The delay starts at the lower bound and doubles after every poll.
+_MIN_POLL_DELAY_SECONDS = 0.1
+_MAX_POLL_DELAY_SECONDS = 10.0
+
 
 class EngineJob:
     """A job created via the Quantum Engine API.
@@ -302,33 +308,66 @@ class EngineJob:
         )
         return response.result
 
+    async def _wait_for_result_async(self):
+        job = self._job
+        if not job or job.execution_status.state not in TERMINAL_STATES:
+            job = await self.context.client.get_job_async(
+                self.project_id, self.program_id, self.job_id, False
+            )
+        total_seconds_waited = 0.0
+        delay = _MIN_POLL_DELAY_SECONDS
+        timeout = self.context.timeout
+        while True:
+            if timeout and total_seconds_waited >= timeout:
+                break
+            if job.execution_status.state in TERMINAL_STATES:
+                break
+            await asyncio.sleep(delay)
+            total_seconds_waited += delay
+            delay = min(2 * delay, _MAX_POLL_DELAY_SECONDS)
+            job = await self.context.client.get_job_async(
+                self.project_id, self.program_id, self.job_id, False
+            )
+        self._job = job
+        self._raise_on_failure(job)
+        response = await self.context.client.get_job_results_async(
+            self.project_id, self.program_id, self.job_id
+        )
+        return response.result
+
     def results(self) -> List[study.Result]:
         """Returns the job results, blocking until the job is complete."""
-        import cirq.google.engine.engine as engine_base
+        if not self._results:
+            self._parse_result(self._wait_for_result())
+        return self._results
+
+    async def results_async(self) -> List[study.Result]:
+        """Returns the job results once the job is complete.
 
+        Unlike `results`, this does not block the event loop while waiting.
+        The job is polled with exponentially increasing delays.
+        """
         if not self._results:
-            result = self._wait_for_result()
-            result_type = result.type_url[len(engine_base.TYPE_PREFIX) :]
-            if (
-                result_type == 'cirq.google.api.v1.Result'
-                or result_type == 'cirq.api.google.v1.Result'
-            ):
-                v1_parsed_result = v1.program_pb2.Result.FromString(result.value)
-                self._results = self._get_job_results_v1(v1_parsed_result)
-            elif (
-                result_type == 'cirq.google.api.v2.Result'
-                or result_type == 'cirq.api.google.v2.Result'
-            ):
-                v2_parsed_result = v2.result_pb2.Result.FromString(result.value)
-                self._results = self._get_job_results_v2(v2_parsed_result)
-            elif result.Is(v2.batch_pb2.BatchResult.DESCRIPTOR):
-                v2_parsed_result = v2.batch_pb2.BatchResult.FromString(result.value)
-                self._batched_results = self._get_batch_results_v2(v2_parsed_result)
-                self._results = self._flatten(self._batched_results)
-            else:
-                raise ValueError('invalid result proto version: {}'.format(result_type))
+            self._parse_result(await self._wait_for_result_async())
         return self._results
 
+    def _parse_result(self, result: quantum.types.any_pb2.Any) -> None:
+        import cirq.google.engine.engine as engine_base
+
+        result_type = result.type_url[len(engine_base.TYPE_PREFIX) :]
+        if result_type in ('cirq.google.api.v1.Result', 'cirq.api.google.v1.Result'):
+            v1_parsed_result = v1.program_pb2.Result.FromString(result.value)
+            self._results = self._get_job_results_v1(v1_parsed_result)
+        elif result_type in ('cirq.google.api.v2.Result', 'cirq.api.google.v2.Result'):
+            v2_parsed_result = v2.result_pb2.Result.FromString(result.value)
+            self._results = self._get_job_results_v2(v2_parsed_result)
+        elif result.Is(v2.batch_pb2.BatchResult.DESCRIPTOR):
+            v2_parsed_result = v2.batch_pb2.BatchResult.FromString(result.value)
+            self._batched_results = self._get_batch_results_v2(v2_parsed_result)
+            self._results = self._flatten(self._batched_results)
+        else:
+            raise ValueError('invalid result proto version: {}'.format(result_type))
+
     def calibration_results(self):
         """Returns the results of a run_calibration() call.
 
@@ -651,6 +651,74 @@ def test_timeout(patched_time_sleep, get_job):
         job.results()
 
 
+def _async_mock(return_values):
+    """Returns a mock recording its calls, and an async function delegating to it."""
+    calls = mock.Mock(side_effect=return_values)
+
+    async def method(self, *args):
+        return calls(*args)
+
+    return calls, method
+
+
+@pytest.mark.asyncio
+async def test_results_async():
+    running = qtypes.QuantumJob(
+        execution_status=qtypes.ExecutionStatus(state=qtypes.ExecutionStatus.State.RUNNING)
+    )
+    success = qtypes.QuantumJob(
+        execution_status=qtypes.ExecutionStatus(state=qtypes.ExecutionStatus.State.SUCCESS)
+    )
+    get_job, get_job_async = _async_mock([running, running, running, success])
+    get_job_results, get_job_results_async = _async_mock([RESULTS])
+    delays = []
+
+    async def fake_sleep(delay):
+        delays.append(delay)
+
+    with mock.patch(
+        'cirq.google.engine.engine_client.EngineClient.get_job_async', new=get_job_async
+    ), mock.patch(
+        'cirq.google.engine.engine_client.EngineClient.get_job_results_async',
+        new=get_job_results_async,
+    ), mock.patch(
+        'asyncio.sleep', new=fake_sleep
+    ):
+        job = cg.EngineJob('a', 'b', 'steve', EngineContext())
+        data = await job.results_async()
+        assert [str(r) for r in data] == ['q=0110', 'q=1010']
+        assert delays == [0.1, 0.2, 0.4]
+        assert get_job.call_count == 4
+        get_job.assert_called_with('a', 'b', 'steve', False)
+        get_job_results.assert_called_once_with('a', 'b', 'steve')
+
+        # Results are cached after the first call.
+        assert await job.results_async() is data
+        assert get_job.call_count == 4
+
+
+@pytest.mark.asyncio
+async def test_results_async_timeout():
+    running = qtypes.QuantumJob(
+        execution_status=qtypes.ExecutionStatus(state=qtypes.ExecutionStatus.State.RUNNING)
+    )
+    get_job, get_job_async = _async_mock(lambda *args: running)
+    delays = []
+
+    async def fake_sleep(delay):
+        delays.append(delay)
+
+    with mock.patch(
+        'cirq.google.engine.engine_client.EngineClient.get_job_async', new=get_job_async
+    ), mock.patch('asyncio.sleep', new=fake_sleep):
+        job = cg.EngineJob('a', 'b', 'steve', EngineContext(timeout=500))
+        with pytest.raises(RuntimeError, match='Timed out'):
+            await job.results_async()
+    assert get_job.call_count == len(delays) + 1
+    assert max(delays) == 10.0
+    assert sum(delays) >= 500
+
+
 def test_str():
     job = cg.EngineJob('a', 'b', 'steve', EngineContext())
     assert str(job) == 'EngineJob(project_id=\'a\', program_id=\'b\', job_id=\'steve\')'
@@ -115,6 +115,41 @@ class EngineProgram:
             self.project_id, self.program_id, created_job_id, self.context, job
         )
 
+    async def run_sweep_async(
+        self,
+        job_id: Optional[str] = None,
+        params: study.Sweepable = None,
+        repetitions: int = 1,
+        processor_ids: Sequence[str] = ('xmonsim',),
+        description: Optional[str] = None,
+        labels: Optional[Dict[str, str]] = None,
+    ) -> engine_job.EngineJob:
+        """Asynchronously creates a job running the program on the QuantumEngine.
+
+        See `run_sweep` for the arguments and return value.
+        """
+        import cirq.google.engine.engine as engine_base
+
+        if self.result_type != ResultType.Program:
+            raise ValueError('Please use run_batch() for batch mode.')
+        if not job_id:
+            job_id = engine_base._make_random_id('job-')
+        sweeps = study.to_sweeps(params or study.ParamResolver({}))
+        run_context = self._serialize_run_context(sweeps, repetitions)
+
+        created_job_id, job = await self.context.client.create_job_async(
+            project_id=self.project_id,
+            program_id=self.program_id,
+            job_id=job_id,
+            processor_ids=processor_ids,
+            run_context=run_context,
+            description=description,
+            labels=labels,
+        )
+        return engine_job.EngineJob(
+            self.project_id, self.program_id, created_job_id, self.context, job
+        )
+
     def run_batch(
         self,
         job_id: Optional[str] = None,
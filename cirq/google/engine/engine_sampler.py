@@ -13,7 +13,7 @@
 # limitations under the License.
 from typing import List, TYPE_CHECKING, Union, Optional, cast
 
-from cirq import work, circuits
+from cirq import work, circuits, study
 from cirq.google import engine, gate_sets
 
 if TYPE_CHECKING:
@@ -65,6 +65,40 @@ class QuantumEngineSampler(work.Sampler):
             )
         return job.results()
 
+    async def run_async(self, program: 'cirq.Circuit', *, repetitions: int) -> 'cirq.Result':
+        """Asynchronously samples from the given Circuit.
+
+        Submission and polling do not block the event loop, so many calls can
+        be awaited concurrently, e.g. with `asyncio.gather`.
+        """
+        results = await self.run_sweep_async(program, study.UnitSweep, repetitions)
+        return results[0]
+
+    async def run_sweep_async(
+        self,
+        program: Union['cirq.Circuit', 'cirq.google.EngineProgram'],
+        params: 'cirq.Sweepable',
+        repetitions: int = 1,
+    ) -> List['cirq.Result']:
+        """Asynchronously sweeps and samples from the given Circuit.
+
+        Submission and polling do not block the event loop, so many calls can
+        be awaited concurrently, e.g. with `asyncio.gather`.
+        """
+        if isinstance(program, engine.EngineProgram):
+            job = await program.run_sweep_async(
+                params=params, repetitions=repetitions, processor_ids=self._processor_ids
+            )
+        else:
+            job = await self._engine.run_sweep_async(
+                program=cast(circuits.Circuit, program),
+                params=params,
+                repetitions=repetitions,
+                processor_ids=self._processor_ids,
+                gate_set=self._gate_set,
+            )
+        return await job.results_async()
+
     def run_batch(
         self,
         programs: List['cirq.Circuit'],
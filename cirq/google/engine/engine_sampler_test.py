@@ -42,6 +42,41 @@ def test_run_engine_program():
     engine.run_sweep.assert_not_called()
 
 
+@pytest.mark.asyncio
+async def test_run_sweep_async():
+    results = [mock.Mock(), mock.Mock()]
+    job = mock.Mock(spec=cg.EngineJob)
+    calls = []
+
+    async def results_async():
+        return results
+
+    async def run_sweep_async(**kwargs):
+        calls.append(kwargs)
+        return job
+
+    job.results_async = results_async
+    engine = mock.Mock()
+    engine.run_sweep_async = run_sweep_async
+    sampler = cg.QuantumEngineSampler(engine=engine, processor_id='tmp', gate_set=cg.XMON)
+    circuit = cirq.Circuit()
+    params = [cirq.ParamResolver({'a': 1})]
+    assert await sampler.run_sweep_async(circuit, params, 5) == results
+    assert calls == [
+        dict(gate_set=cg.XMON, params=params, processor_ids=['tmp'], program=circuit, repetitions=5)
+    ]
+
+    assert await sampler.run_async(circuit, repetitions=3) is results[0]
+    assert calls[-1]['params'] is cirq.UnitSweep
+    assert calls[-1]['repetitions'] == 3
+    engine.run_sweep.assert_not_called()
+
+    program = mock.Mock(spec=cg.EngineProgram)
+    program.run_sweep_async = run_sweep_async
+    assert await sampler.run_sweep_async(program, params, 5) == results
+    assert calls[-1] == dict(params=params, processor_ids=['tmp'], repetitions=5)
+
+
 def test_run_batch():
     engine = mock.Mock()
     sampler = cg.QuantumEngineSampler(engine=engine, processor_id='tmp', gate_set=cg.XMON)
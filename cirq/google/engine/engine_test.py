@@ -836,6 +836,46 @@ def test_create_program(client):
     assert result.program_id == 'prog'
 
 
+@mock.patch('cirq.google.engine.engine_client.EngineClient')
+def test_run_sweep_cache_programs(client):
+    setup_run_circuit_with_result_(client, _RESULTS_V2)
+    engine = cg.Engine(project_id='proj', cache_programs=True)
+
+    with mock.patch.object(cg.XMON, 'serialize', wraps=cg.XMON.serialize) as serialize:
+        engine.run_sweep(program=_CIRCUIT, params=cirq.Points('a', [1, 2]), gate_set=cg.XMON)
+        engine.run_sweep(program=_CIRCUIT.copy(), params=cirq.Points('a', [3, 4]), gate_set=cg.XMON)
+        assert client().create_program.call_count == 1
+        assert client().create_job.call_count == 2
+        assert client().create_job.call_args[1]['program_id'] == 'prog'
+        assert serialize.call_count == 1
+
+        # A different circuit, description or explicit program id uploads again.
+        engine.run_sweep(program=_CIRCUIT2, gate_set=cg.XMON)
+        engine.run_sweep(program=_CIRCUIT, gate_set=cg.XMON, program_description='other')
+        assert client().create_program.call_count == 3
+        assert serialize.call_count == 3
+        engine.run_sweep(program=_CIRCUIT, program_id='prog', gate_set=cg.XMON)
+        assert client().create_program.call_count == 4
+        assert serialize.call_count == 3
+        assert client().create_program.call_args[1]['code'] == (
+            client().create_program.call_args_list[0][1]['code']
+        )
+
+        engine.clear_program_cache()
+        engine.run_sweep(program=_CIRCUIT, gate_set=cg.XMON)
+        assert client().create_program.call_count == 5
+        assert serialize.call_count == 4
+
+
+@mock.patch('cirq.google.engine.engine_client.EngineClient')
+def test_run_sweep_without_program_cache(client):
+    setup_run_circuit_with_result_(client, _RESULTS_V2)
+    engine = cg.Engine(project_id='proj')
+    engine.run_sweep(program=_CIRCUIT, gate_set=cg.XMON)
+    engine.run_sweep(program=_CIRCUIT, gate_set=cg.XMON)
+    assert client().create_program.call_count == 2
+
+
 @mock.patch('cirq.google.engine.engine_client.EngineClient.list_jobs')
 def test_list_jobs(list_jobs):
     job1 = qtypes.QuantumJob(name='projects/proj/programs/prog1/jobs/job1')
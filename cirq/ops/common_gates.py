@@ -498,10 +498,10 @@ class ZPowGate(eigen_gate.EigenGate, gate_features.SingleQubitGate):
 
         one = args.subspace_index(1)
         c = 1j ** (self._exponent * 2)
-        args.target_tensor[one] *= c
         p = 1j ** (2 * self._exponent * self._global_shift)
+        args.target_tensor[one] *= c * p
         if p != 1:
-            args.target_tensor *= p
+            args.target_tensor[args.subspace_index(0)] *= p
         return args.target_tensor
 
     def _act_on_(self, args: Any):
@@ -947,11 +947,12 @@ class CZPowGate(
             return NotImplemented
 
         c = 1j ** (2 * self._exponent)
-        one_one = args.subspace_index(0b11)
-        args.target_tensor[one_one] *= c
         p = 1j ** (2 * self._exponent * self._global_shift)
+        one_one = args.subspace_index(0b11)
+        args.target_tensor[one_one] *= c * p
         if p != 1:
-            args.target_tensor *= p
+            for bits in range(0b11):
+                args.target_tensor[args.subspace_index(bits)] *= p
         return args.target_tensor
 
     def _act_on_(self, args: Any):
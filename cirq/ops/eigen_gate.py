@@ -12,6 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 import fractions
+import functools
 from typing import (
     AbstractSet,
     Any,
@@ -57,6 +58,57 @@ EigenComponent = NamedTuple(
 )
 
 
+# Maximum number of unitaries kept by the EigenGate unitary cache.
+_UNITARY_CACHE_SIZE = 4096
+
+
+class _UnitaryCacheKey:
+    """Hashes and compares an EigenGate by the values determining its unitary.
+
+    The gate itself is carried along, so that the matrix can be computed on a
+    cache miss, but it takes no part in hashing or equality.
+    """
+
+    __slots__ = ('gate', 'values', '_hash')
+
+    def __init__(self, gate: 'EigenGate') -> None:
+        values: Tuple[Any, ...] = (type(gate), gate._exponent, gate._global_shift)
+        if type(gate)._value_equality_values_ is not EigenGate._value_equality_values_:
+            # The subclass holds more state than the exponent and shift.
+            values += (gate._value_equality_values_(),)
+        self.gate = gate
+        self.values = values
+        self._hash = hash(values)
+
+    def __hash__(self) -> int:
+        return self._hash
+
+    def __eq__(self, other: Any) -> bool:
+        return isinstance(other, _UnitaryCacheKey) and self.values == other.values
+
+
+@functools.lru_cache(maxsize=_UNITARY_CACHE_SIZE)
+def _cached_unitary(key: _UnitaryCacheKey) -> np.ndarray:
+    unitary = key.gate._unitary_from_eigen_components()
+    unitary.flags.writeable = False
+    return unitary
+
+
+def unitary_cache_info() -> functools._CacheInfo:
+    """Returns the hits, misses and size of the EigenGate unitary cache.
+
+    Unitaries of unparameterized EigenGates are memoized by gate value, since
+    the same gates are converted to matrices many times by simulators,
+    decompositions and optimizers.
+    """
+    return _cached_unitary.cache_info()
+
+
+def clear_unitary_cache() -> None:
+    """Empties the EigenGate unitary cache and resets its counters."""
+    _cached_unitary.cache_clear()
+
+
 @value.value_equality(distinct_child_types=True, approximate=True)
 class EigenGate(raw_types.Gate):
     """A gate with a known eigendecomposition.
@@ -68,6 +120,10 @@ class EigenGate(raw_types.Gate):
     eigenvalue i and a part with eigenvalue -i, then EigenGate allows this
     functionality to be unambiguously specified via the _eigen_components
     method.
+
+    Unitaries are memoized by gate type, exponent, global shift and, if a
+    subclass overrides it, `_value_equality_values_`. Subclasses whose matrix
+    depends on other state should override `_unitary_`.
     """
 
     def __init__(
@@ -334,6 +390,14 @@ class EigenGate(raw_types.Gate):
     def _unitary_(self) -> Union[np.ndarray, NotImplementedType]:
         if self._is_parameterized_():
             return NotImplemented
+        try:
+            key = _UnitaryCacheKey(self)
+        except TypeError:
+            # Unhashable state, e.g. an array held by a subclass.
+            return self._unitary_from_eigen_components()
+        return _cached_unitary(key).copy()
+
+    def _unitary_from_eigen_components(self) -> np.ndarray:
         e = cast(float, self._exponent)
         return np.sum(
             [
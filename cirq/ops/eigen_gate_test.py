@@ -374,3 +374,43 @@ class WeightedZPowGate(cirq.EigenGate, cirq.SingleQubitGate):
 )
 def test_equal_up_to_global_phase(gate1, gate2, eq_up_to_global_phase):
     assert cirq.equal_up_to_global_phase(gate1, gate2) == eq_up_to_global_phase
+
+
+def test_unitary_cache():
+    cirq.ops.eigen_gate.clear_unitary_cache()
+    info = cirq.ops.eigen_gate.unitary_cache_info()
+    assert (info.hits, info.misses, info.currsize) == (0, 0, 0)
+
+    u = cirq.unitary(cirq.X ** 0.25)
+    np.testing.assert_allclose(u, cirq.unitary(cirq.XPowGate(exponent=0.25)))
+    info = cirq.ops.eigen_gate.unitary_cache_info()
+    assert (info.hits, info.misses, info.currsize) == (1, 1, 1)
+
+    # Callers get their own writable copy.
+    u[0, 0] = 5
+    assert cirq.unitary(cirq.X ** 0.25)[0, 0] != 5
+
+    # Equal exponents of different types, or different shifts, are not shared.
+    np.testing.assert_allclose(
+        cirq.unitary(cirq.rx(np.pi / 4)), np.exp(-0.125j * np.pi) * cirq.unitary(cirq.X ** 0.25)
+    )
+    np.testing.assert_allclose(cirq.unitary(cirq.Y ** 0.25), cirq.unitary(cirq.Y ** 0.25))
+    assert not np.allclose(cirq.unitary(cirq.Y ** 0.25), cirq.unitary(cirq.X ** 0.25))
+    np.testing.assert_allclose(
+        cirq.unitary(WeightedZPowGate(0.5, exponent=0.5)), np.diag([1, np.exp(0.25j * np.pi)])
+    )
+    np.testing.assert_allclose(
+        cirq.unitary(WeightedZPowGate(0.25, exponent=0.5)), np.diag([1, np.exp(0.125j * np.pi)])
+    )
+
+    cirq.ops.eigen_gate.clear_unitary_cache()
+    assert cirq.ops.eigen_gate.unitary_cache_info().currsize == 0
+
+
+def test_unitary_cache_unhashable_state():
+    class ArrayWeightedZPowGate(WeightedZPowGate):
+        def _value_equality_values_(self):
+            return np.array([self.weight]), self._exponent, self._global_shift
+
+    gate = ArrayWeightedZPowGate(0.5, exponent=0.5)
+    np.testing.assert_allclose(cirq.unitary(gate), np.diag([1, np.exp(0.25j * np.pi)]))
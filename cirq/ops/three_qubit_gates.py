@@ -118,10 +118,11 @@ class CCZPowGate(
         if protocols.is_parameterized(self):
             return NotImplemented
         ooo = args.subspace_index(0b111)
-        args.target_tensor[ooo] *= np.exp(1j * self.exponent * np.pi)
         p = 1j ** (2 * self._exponent * self._global_shift)
+        args.target_tensor[ooo] *= np.exp(1j * self.exponent * np.pi) * p
         if p != 1:
-            args.target_tensor *= p
+            for bits in range(0b111):
+                args.target_tensor[args.subspace_index(bits)] *= p
         return args.target_tensor
 
     def _circuit_diagram_info_(
@@ -81,6 +81,8 @@ from cirq.protocols.json_serialization import (
     json_serializable_dataclass,
     to_json,
     read_json,
+    to_binary,
+    read_binary,
     obj_to_dict_helper,
     SupportsJSON,
 )
@@ -13,6 +13,7 @@
 # limitations under the License.
 """A protocol for implementing high performance channel evolutions."""
 
+import functools
 from typing import Any, Iterable, Optional, Sequence, TypeVar, Tuple, Union
 
 import numpy as np
@@ -257,8 +258,11 @@ def apply_channel(
         return result
 
     # Fallback to using the object's `_channel_` matrices.
-    kraus = channel(val, None)
-    if kraus is not None:
+    kraus_and_superoperator = _kraus_and_superoperator(val, left_shape, args.target_tensor.dtype)
+    if kraus_and_superoperator is not None:
+        kraus, superoperator = kraus_and_superoperator
+        if superoperator is not None:
+            return _apply_superoperator(superoperator, args)
         return _apply_kraus(kraus, args)
 
     # Don't know how to apply channel. Fallback to specified default behavior.
@@ -294,6 +298,51 @@ def _apply_unitary(val: Any, args: 'ApplyChannelArgs') -> Optional[np.ndarray]:
     return right_result
 
 
+def _kraus_and_superoperator(
+    val: Any, qid_shape: Tuple[int, ...], dtype: np.dtype
+) -> Optional[Tuple[Sequence[np.ndarray], Optional[np.ndarray]]]:
+    """Returns the Kraus operators of `val` and possibly its superoperator.
+
+    Results are cached by gate, so that e.g. a noise channel applied to every
+    qubit in every moment is only decomposed once.
+    """
+    gate = getattr(val, 'gate', None)
+    key = val if gate is None else gate
+    if type(key).__hash__ in (None, object.__hash__):
+        # Only values compared by value are cached.
+        return _compute_kraus_and_superoperator(val, qid_shape, dtype)
+    return _cached_kraus_and_superoperator(key, qid_shape, dtype)
+
+
+def _compute_kraus_and_superoperator(
+    val: Any, qid_shape: Tuple[int, ...], dtype: np.dtype
+) -> Optional[Tuple[Sequence[np.ndarray], Optional[np.ndarray]]]:
+    kraus = channel(val, None)
+    if kraus is None:
+        return None
+    # Applying the superoperator takes one contraction with a d^2 x d^2
+    # matrix, while applying the Kraus operators takes two contractions with
+    # a d x d matrix per operator, plus copies of the whole state for each.
+    dim = kraus[0].shape[0]
+    if len(kraus) < 2 or dim > 2 * len(kraus):
+        return kraus, None
+    superoperator = sum(np.einsum('ac,bd->abcd', k, np.conjugate(k)) for k in kraus)
+    return kraus, np.reshape(superoperator.astype(dtype), qid_shape * 4)
+
+
+_cached_kraus_and_superoperator = functools.lru_cache(maxsize=256)(_compute_kraus_and_superoperator)
+
+
+def _apply_superoperator(superoperator: np.ndarray, args: 'ApplyChannelArgs') -> np.ndarray:
+    """Applies a channel in one contraction over the left and right axes."""
+    return linalg.targeted_left_multiply(
+        superoperator,
+        args.target_tensor,
+        tuple(args.left_axes) + tuple(args.right_axes),
+        out=args.out_buffer,
+    )
+
+
 def _apply_kraus(
     kraus: Union[Tuple[np.ndarray], Sequence[Any]], args: 'ApplyChannelArgs'
 ) -> np.ndarray:
@@ -212,6 +212,58 @@ def test_apply_channel_channel_fallback_two_qubit_random():
         np.testing.assert_almost_equal(result, expected)
 
 
+def test_apply_channel_channel_fallback_three_qubit_random():
+    # Few Kraus operators on many qubits are applied one by one.
+    state = cirq.testing.random_superposition(8)
+    rho = np.outer(np.conjugate(state), state)
+    u = cirq.testing.random_unitary(8)
+    expected = 0.5 * rho + 0.5 * np.dot(np.dot(u, rho), np.conjugate(np.transpose(u)))
+    rho.shape = (2,) * 6
+    expected.shape = (2,) * 6
+
+    class HasChannel:
+        def _channel_(self):
+            return (np.sqrt(0.5) * np.eye(8, dtype=np.complex128), np.sqrt(0.5) * u)
+
+    result = apply_channel(HasChannel(), rho, [0, 1, 2], [3, 4, 5], assert_result_is_out_buf=True)
+    np.testing.assert_almost_equal(result, expected)
+
+
+def test_apply_channel_channel_fallback_qutrit():
+    rho = cirq.testing.random_density_matrix(3)
+
+    class QutritChannel:
+        def _qid_shape_(self):
+            return (3,)
+
+        def _channel_(self):
+            return [np.eye(3) * np.sqrt(0.5), np.diag([1, -1, 1j]) * np.sqrt(0.5)]
+
+    expected = 0.5 * rho + 0.5 * np.diag([1, -1, 1j]) @ rho @ np.diag([1, -1, -1j])
+    result = apply_channel(QutritChannel(), rho.copy(), [0], [1], assert_result_is_out_buf=True)
+    np.testing.assert_almost_equal(result, expected)
+
+
+def test_apply_channel_caches_superoperator_by_gate():
+    q0, q1 = cirq.LineQubit.range(2)
+    channel = cirq.asymmetric_depolarize(0.1, 0.2, 0.3)
+    rho = cirq.testing.random_density_matrix(4).reshape((2,) * 4)
+    expected_q0 = apply_channel(channel.on(q0), rho.copy(), [0], [2], assert_result_is_out_buf=True)
+
+    info = cirq.protocols.apply_channel_protocol._cached_kraus_and_superoperator.cache_info()
+    result_q1 = apply_channel(channel.on(q1), rho.copy(), [1], [3], assert_result_is_out_buf=True)
+    new_info = cirq.protocols.apply_channel_protocol._cached_kraus_and_superoperator.cache_info()
+    assert new_info.hits == info.hits + 1
+    assert new_info.misses == info.misses
+
+    full = sum(
+        np.kron(np.eye(2), k) @ rho.reshape(4, 4) @ np.kron(np.eye(2), k).conj().T
+        for k in cirq.channel(channel)
+    )
+    np.testing.assert_almost_equal(result_q1.reshape(4, 4), full)
+    assert not np.allclose(expected_q0, result_q1)
+
+
 def test_apply_channel_no_protocols_implemented():
     class NoProtocols:
         pass
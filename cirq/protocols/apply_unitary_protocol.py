@@ -39,6 +39,10 @@ from cirq.type_workarounds import NotImplementedType
 if TYPE_CHECKING:
     import cirq
 
+# The largest matrix dimension for which monomial (phased permutation)
+# matrices are applied one subspace at a time instead of through np.einsum.
+_MAX_MONOMIAL_MATRIX_DIM = 64
+
 # This is a special indicator value used by the apply_unitary method
 # to determine whether or not the caller provided a 'default' argument. It must
 # be of type np.ndarray to ensure the method has the correct type signature in
@@ -400,6 +404,9 @@ def _strat_apply_unitary_from_unitary(
     val_qid_shape = qid_shape_protocol.qid_shape(unitary_value, default=(2,) * len(args.axes))
     sub_args = args._for_operation_with_qid_shape(range(len(val_qid_shape)), val_qid_shape)
     matrix = matrix.astype(sub_args.target_tensor.dtype)
+    sub_result = _apply_monomial_matrix(matrix, sub_args)
+    if sub_result is not None:
+        return _incorporate_result_into_target(args, sub_args, sub_result)
     if len(val_qid_shape) == 1 and val_qid_shape[0] <= 2:
         # Special case for single-qubit, 2x2 or 1x1 operations.
         # np.einsum is faster for larger cases.
@@ -418,6 +425,56 @@ def _strat_apply_unitary_from_unitary(
     return _incorporate_result_into_target(args, sub_args, sub_result)
 
 
+def _monomial_structure(matrix: np.ndarray) -> Optional[Tuple[np.ndarray, np.ndarray]]:
+    """Decomposes a matrix with exactly one nonzero entry per row and column.
+
+    Returns:
+        A pair `(sources, factors)` such that row `k` of the matrix is
+        `factors[k]` at column `sources[k]` and zero elsewhere, or None if the
+        matrix is not monomial or is too large to be worth decomposing.
+    """
+    dim = matrix.shape[0]
+    if dim > _MAX_MONOMIAL_MATRIX_DIM:
+        return None
+    rows, sources = np.nonzero(matrix)
+    if len(rows) != dim or np.any(rows != np.arange(dim)) or len(np.unique(sources)) != dim:
+        return None
+    return sources, matrix[rows, sources]
+
+
+def _apply_monomial_matrix(matrix: np.ndarray, args: ApplyUnitaryArgs) -> Optional[np.ndarray]:
+    """Applies a matrix with exactly one nonzero entry per row and column.
+
+    Such matrices (diagonal gates, permutations, and permutations with phases)
+    map each subspace of the target axes onto a single other subspace, so they
+    can be applied with strided copies into `available_buffer` instead of a
+    tensor contraction. Like the contraction, this leaves `target_tensor`
+    unchanged. Simulators, which own their state, apply such matrices in place
+    instead (see `cirq.ActOnStateVectorArgs`).
+
+    Returns:
+        The result tensor, or None if the matrix is not monomial or is too
+        large for this method.
+    """
+    structure = _monomial_structure(matrix)
+    if structure is None:
+        return None
+    sources, factors = structure
+
+    def index(k) -> Tuple[Union[slice, int, 'ellipsis'], ...]:
+        # The trailing ellipsis keeps 0-d subspaces as views rather than scalars.
+        return args.subspace_index(big_endian_bits_int=int(k)) + (Ellipsis,)
+
+    for k in range(len(sources)):
+        out = args.available_buffer[index(k)]
+        value = args.target_tensor[index(sources[k])]
+        if factors[k] == 1:
+            out[...] = value
+        else:
+            np.multiply(value, factors[k], out=out)
+    return args.available_buffer
+
+
 def _strat_apply_unitary_from_decompose(val: Any, args: ApplyUnitaryArgs) -> Optional[np.ndarray]:
     operations, qubits, _ = _try_decompose_into_operations_and_qubits(val)
     if operations is None:
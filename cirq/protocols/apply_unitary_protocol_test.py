@@ -490,3 +490,48 @@ def test_apply_unitary_args_with_axes_transposed_to_start():
     assert args.target_tensor[1, 2, 3, 4] == 1
     new_args.available_buffer[2, 4, 1, 3] = 2
     assert args.available_buffer[1, 2, 3, 4] == 2
+
+
+@pytest.mark.parametrize(
+    'matrix',
+    [
+        np.diag([1, 1j]),
+        np.diag([1j, 1, -1, 1]),
+        np.array([[0, 1], [1j, 0]]),
+        cirq.unitary(cirq.CNOT),
+        cirq.unitary(cirq.CCX),
+        cirq.unitary(cirq.ISWAP) @ cirq.unitary(cirq.CZ),
+        cirq.unitary(cirq.QubitPermutationGate([1, 2, 0])),
+    ],
+)
+def test_apply_unitary_monomial_matrix(matrix):
+    class Gate(cirq.Gate):
+        def _num_qubits_(self):
+            return matrix.shape[0].bit_length() - 1
+
+        def _unitary_(self):
+            return matrix
+
+    gate = Gate()
+    n = cirq.num_qubits(gate)
+    axes = list(range(1, n + 1))
+    shape = (2,) * (n + 1)
+    state = cirq.testing.random_superposition(2 ** (n + 1)).reshape(shape)
+    expected = cirq.targeted_left_multiply(matrix.reshape((2,) * (2 * n)), state, axes)
+    target = state.copy()
+    buffer = np.empty_like(state)
+    result = cirq.apply_unitary(gate, cirq.ApplyUnitaryArgs(target, buffer, axes))
+    assert result is buffer
+    np.testing.assert_allclose(result, expected, atol=1e-8)
+    np.testing.assert_array_equal(target, state)
+
+
+def test_apply_unitary_monomial_matrix_on_all_axes():
+    q = cirq.LineQubit(0)
+    matrix = np.array([[0, 1], [1j, 0]])
+    circuit = cirq.Circuit(cirq.H(q), cirq.MatrixGate(matrix)(q))
+    expected = matrix @ np.array([1, 1]) / np.sqrt(2)
+    np.testing.assert_allclose(cirq.final_state_vector(circuit), expected, atol=1e-6)
+    np.testing.assert_allclose(
+        cirq.Simulator().simulate(circuit).final_state_vector, expected, atol=1e-6
+    )
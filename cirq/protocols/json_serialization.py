@@ -13,6 +13,7 @@
 # limitations under the License.
 import dataclasses
 import functools
+import io
 import json
 import numbers
 import pathlib
@@ -27,6 +28,7 @@ from typing import (
     Optional,
     overload,
     Sequence,
+    Tuple,
     Type,
     TYPE_CHECKING,
     Union,
@@ -447,6 +449,98 @@ def _cirq_object_hook(d, resolvers: Sequence[JsonResolver], context_map: Dict[st
     return cls(**d)
 
 
+@functools.lru_cache(maxsize=1)
+def _fast_json_constructors() -> Dict[Type, Callable[[Dict[str, Any]], Any]]:
+    """Constructors for frequently deserialized classes.
+
+    These bypass `_from_json_dict_` and keyword argument unpacking, which
+    dominate the cost of reading large circuits. They are keyed by class, so
+    they are only used when a resolver returns exactly that class.
+    """
+    import cirq
+
+    def eigen_gate(cls):
+        return lambda d: cls(exponent=d['exponent'], global_shift=d['global_shift'])
+
+    constructors: Dict[Type, Callable[[Dict[str, Any]], Any]] = {
+        cirq.GridQubit: lambda d: cirq.GridQubit(d['row'], d['col']),
+        cirq.LineQubit: lambda d: cirq.LineQubit(d['x']),
+        cirq.NamedQubit: lambda d: cirq.NamedQubit(d['name']),
+        cirq.GateOperation: lambda d: cirq.GateOperation(d['gate'], d['qubits']),
+        cirq.Moment: lambda d: cirq.Moment(d['operations']),
+    }
+    for cls in [
+        cirq.XPowGate,
+        cirq.YPowGate,
+        cirq.ZPowGate,
+        cirq.HPowGate,
+        cirq.CZPowGate,
+        cirq.CXPowGate,
+        cirq.SwapPowGate,
+        cirq.ISwapPowGate,
+        cirq.XXPowGate,
+        cirq.YYPowGate,
+        cirq.ZZPowGate,
+    ]:
+        constructors[cls] = eigen_gate(cls)
+    return constructors
+
+
+def _json_object_hook(
+    resolvers: Sequence[JsonResolver], context_map: Dict[str, Any]
+) -> Callable[[Dict[str, Any]], Any]:
+    """Returns an object hook equivalent to `_cirq_object_hook`.
+
+    The constructor for each `cirq_type` is looked up once and cached for the
+    lifetime of the hook, instead of consulting every resolver for every
+    object.
+    """
+    constructors: Dict[str, Callable[[Dict[str, Any]], Any]] = {
+        '_SerializedKey': lambda d: _SerializedKey.read_from_context(context_map, **d),
+        '_SerializedContext': lambda d: _SerializedContext.update_context(context_map, **d),
+        '_ContextualSerialization': lambda d: _ContextualSerialization.deserialize_with_context(
+            **d
+        ),
+    }
+
+    def constructor_for(cirq_type: str) -> Callable[[Dict[str, Any]], Any]:
+        for resolver in resolvers:
+            cls = resolver(cirq_type)
+            if cls is not None:
+                break
+        else:
+            raise ValueError("Could not resolve type '{}' during deserialization".format(cirq_type))
+
+        try:
+            fast_constructor = _fast_json_constructors().get(cls)
+        except TypeError:
+            # The resolver returned an unhashable factory.
+            fast_constructor = None
+        if fast_constructor is not None:
+            return fast_constructor
+
+        from_json_dict = getattr(cls, '_from_json_dict_', None)
+        if from_json_dict is not None:
+            return lambda d: from_json_dict(**d)
+
+        def construct(d: Dict[str, Any]) -> Any:
+            del d['cirq_type']
+            return cls(**d)
+
+        return construct
+
+    def obj_hook(d: Dict[str, Any]) -> Any:
+        cirq_type = d.get('cirq_type')
+        if cirq_type is None:
+            return d
+        constructor = constructors.get(cirq_type)
+        if constructor is None:
+            constructor = constructors[cirq_type] = constructor_for(cirq_type)
+        return constructor(d)
+
+    return obj_hook
+
+
 class SerializableByKey(SupportsJSON):
     """Protocol for objects that can be serialized to a key + context."""
 
@@ -583,6 +677,43 @@ def get_serializable_by_keys(obj: Any) -> List[SerializableByKey]:
     return []
 
 
+def _with_serialization_context(
+    obj: Any, cls: Type[json.JSONEncoder]
+) -> Tuple[Any, Type[json.JSONEncoder]]:
+    """Wraps obj and cls to serialize SerializableByKey objects by key."""
+    if not has_serializable_by_keys(obj):
+        return obj, cls
+
+    class ContextualEncoder(cls):  # type: ignore
+        """An encoder with a context map for concise serialization."""
+
+        # This map is populated gradually during serialization. An object
+        # with components defined in this map will represent those
+        # components using their keys instead of inline definition.
+        context_map: Dict[str, 'SerializableByKey'] = {}
+        # The object first seen with each key. Later occurrences of the same
+        # object are serialized by key without comparing their JSON dicts.
+        context_objects: Dict[str, Any] = {}
+
+        def default(self, o):
+            skey = getattr(o, '_serialization_key_', lambda: None)()
+            if skey in ContextualEncoder.context_map:
+                if ContextualEncoder.context_objects[skey] is o:
+                    return {'cirq_type': '_SerializedKey', 'key': skey}
+                if ContextualEncoder.context_map[skey] == o._json_dict_():
+                    return _SerializedKey(o)._json_dict_()
+                raise ValueError(
+                    'Found different objects with the same serialization key:'
+                    f'\n{ContextualEncoder.context_map[skey]}\n{o}'
+                )
+            if skey is not None:
+                ContextualEncoder.context_map[skey] = o._json_dict_()
+                ContextualEncoder.context_objects[skey] = o
+            return super().default(o)
+
+    return _ContextualSerialization(obj), ContextualEncoder
+
+
 # pylint: disable=function-redefined
 @overload
 def to_json(
@@ -622,31 +753,7 @@ def to_json(
             party classes, prefer adding the _json_dict_ magic method
             to your classes rather than overriding this default.
     """
-    if has_serializable_by_keys(obj):
-
-        class ContextualEncoder(cls):  # type: ignore
-            """An encoder with a context map for concise serialization."""
-
-            # This map is populated gradually during serialization. An object
-            # with components defined in this map will represent those
-            # components using their keys instead of inline definition.
-            context_map: Dict[str, 'SerializableByKey'] = {}
-
-            def default(self, o):
-                skey = getattr(o, '_serialization_key_', lambda: None)()
-                if skey in ContextualEncoder.context_map:
-                    if ContextualEncoder.context_map[skey] == o._json_dict_():
-                        return _SerializedKey(o)._json_dict_()
-                    raise ValueError(
-                        'Found different objects with the same serialization key:'
-                        f'\n{ContextualEncoder.context_map[skey]}\n{o}'
-                    )
-                if skey is not None:
-                    ContextualEncoder.context_map[skey] = o._json_dict_()
-                return super().default(o)
-
-        obj = _ContextualSerialization(obj)
-        cls = ContextualEncoder
+    obj, cls = _with_serialization_context(obj, cls)
 
     if file_or_fn is None:
         return json.dumps(obj, indent=indent, cls=cls)
@@ -695,8 +802,7 @@ def read_json(
 
     context_map: Dict[str, 'SerializableByKey'] = {}
 
-    def obj_hook(x):
-        return _cirq_object_hook(x, resolvers, context_map)
+    obj_hook = _json_object_hook(resolvers, context_map)
 
     if json_text is not None:
         return json.loads(json_text, object_hook=obj_hook)
@@ -706,3 +812,182 @@ def read_json(
             return json.load(file, object_hook=obj_hook)
 
     return json.load(cast(IO, file_or_fn), object_hook=obj_hook)
+
+
+# The binary format is two JSON documents followed by raw array buffers:
+#
+#   magic | arrays length | object length | arrays | object | buffers
+#
+# The lengths are 8 byte little endian integers. "arrays" is a JSON list
+# giving the dtype, shape and offset of each buffer, relative to the first
+# buffer. "object" is the JSON representation of the serialized object, in
+# which numpy arrays are replaced by references
+# {"cirq_type": "_BinaryArray", "index": i} into "arrays". Buffers start at
+# multiples of _BINARY_ALIGNMENT bytes from the start of the file so that
+# they can be memory-mapped.
+_BINARY_MAGIC = b'CIRQBIN1'
+_BINARY_ALIGNMENT = 64
+
+
+def _align(n: int) -> int:
+    return -(-n // _BINARY_ALIGNMENT) * _BINARY_ALIGNMENT
+
+
+class _BinaryEncoder(CirqEncoder):
+    """Extends CirqEncoder to collect numpy arrays as raw buffers.
+
+    Objects with a `_binary_dict_` method are encoded by it instead of
+    `_json_dict_`. It returns a dictionary like `_json_dict_` does, but may
+    contain numpy arrays, which are stored without any conversion.
+    """
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.arrays: List[np.ndarray] = []
+
+    def default(self, o):
+        if hasattr(o, '_binary_dict_'):
+            return o._binary_dict_()
+        if isinstance(o, np.ndarray) and o.dtype != object and o.dtype.fields is None:
+            self.arrays.append(np.ascontiguousarray(o))
+            return {'cirq_type': '_BinaryArray', 'index': len(self.arrays) - 1}
+        return super().default(o)
+
+
+def to_binary(obj: Any, file_or_fn: Union[None, IO, pathlib.Path, str] = None) -> Optional[bytes]:
+    """Write a compact binary representation of obj.
+
+    This is an alternative to `cirq.to_json` for objects holding large numpy
+    arrays, such as `cirq.Result`. The object structure is stored as JSON,
+    but arrays are stored as raw buffers, and results store their binary
+    measurements bit-packed. The output is read with `cirq.read_binary`.
+
+    Args:
+        obj: An object which can be serialized to a JSON representation.
+        file_or_fn: A filename (if a string or `pathlib.Path`) to write to, or
+            a binary IO object to write to, or `None` to indicate that the
+            method should return the bytes as its result. Defaults to `None`.
+    """
+    obj, cls = _with_serialization_context(obj, _BinaryEncoder)
+    encoder = cast(_BinaryEncoder, cls(separators=(',', ':')))
+    object_text = encoder.encode(obj)
+
+    specs: List[Dict[str, Any]] = []
+    offset = 0
+    for array in encoder.arrays:
+        offset = _align(offset)
+        specs.append({'dtype': array.dtype.str, 'shape': array.shape, 'offset': offset})
+        offset += array.nbytes
+    arrays_json = json.dumps(specs).encode()
+    object_json = object_text.encode()
+
+    def write(file: IO) -> None:
+        prefix = b''.join(
+            [
+                _BINARY_MAGIC,
+                len(arrays_json).to_bytes(8, 'little'),
+                len(object_json).to_bytes(8, 'little'),
+                arrays_json,
+                object_json,
+            ]
+        )
+        file.write(prefix + bytes(_align(len(prefix)) - len(prefix)))
+        position = 0
+        for spec, array in zip(specs, encoder.arrays):
+            file.write(bytes(spec['offset'] - position))
+            file.write(array.reshape(-1).view(np.uint8))
+            position = spec['offset'] + array.nbytes
+
+    if file_or_fn is None:
+        buffer = io.BytesIO()
+        write(buffer)
+        return buffer.getvalue()
+
+    if isinstance(file_or_fn, (str, pathlib.Path)):
+        with open(file_or_fn, 'wb') as actually_a_file:
+            write(actually_a_file)
+            return None
+
+    write(file_or_fn)
+    return None
+
+
+def read_binary(
+    file_or_fn: Union[None, IO, pathlib.Path, str] = None,
+    *,
+    data: Optional[bytes] = None,
+    mmap_mode: Optional[str] = None,
+    resolvers: Optional[Sequence[JsonResolver]] = None,
+):
+    """Read an object written by `cirq.to_binary`.
+
+    Only the header is parsed as JSON. Arrays are read directly from their
+    buffers, or memory-mapped if `mmap_mode` is given, in which case only the
+    parts of the file that are accessed are read. For example, reading one
+    key of a memory-mapped `cirq.Result` does not read the other keys.
+
+    Args:
+        file_or_fn: A filename (if a string or `pathlib.Path`) to read from, or
+            a binary IO object to read from, or `None` to indicate that the
+            `data` argument should be used. Defaults to `None`.
+        data: The bytes to read the object from, or else `None` indicating
+            `file_or_fn` should be used. Defaults to `None`.
+        mmap_mode: If not `None`, arrays are returned as `np.memmap` objects
+            opened with this mode, see `numpy.memmap`. Requires a filename.
+        resolvers: A list of functions that are called in order to turn
+            the serialized `cirq_type` string into a constructable class.
+            See `cirq.read_json`.
+    """
+    if (file_or_fn is None) == (data is None):
+        raise ValueError('Must specify ONE of "file_or_fn" or "data".')
+    if mmap_mode is not None and not isinstance(file_or_fn, (str, pathlib.Path)):
+        raise ValueError('mmap_mode requires a filename.')
+
+    if resolvers is None:
+        resolvers = DEFAULT_RESOLVERS
+
+    if data is not None:
+        return _read_binary(io.BytesIO(data), None, None, resolvers)
+    if isinstance(file_or_fn, (str, pathlib.Path)):
+        with open(file_or_fn, 'rb') as file:
+            return _read_binary(file, file_or_fn, mmap_mode, resolvers)
+    return _read_binary(cast(IO, file_or_fn), None, None, resolvers)
+
+
+def _read_binary(
+    file: IO,
+    filename: Union[None, pathlib.Path, str],
+    mmap_mode: Optional[str],
+    resolvers: Sequence[JsonResolver],
+):
+    start = file.tell()
+    if file.read(len(_BINARY_MAGIC)) != _BINARY_MAGIC:
+        raise ValueError('Not a cirq binary file.')
+    arrays_length = int.from_bytes(file.read(8), 'little')
+    object_length = int.from_bytes(file.read(8), 'little')
+    arrays = json.loads(file.read(arrays_length))
+    object_json = file.read(object_length)
+    buffers_start = start + _align(len(_BINARY_MAGIC) + 16 + arrays_length + object_length)
+    context_map: Dict[str, 'SerializableByKey'] = {}
+    cirq_obj_hook = _json_object_hook(resolvers, context_map)
+
+    def read_array(index: int) -> np.ndarray:
+        spec = arrays[index]
+        dtype = np.dtype(spec['dtype'])
+        shape = tuple(spec['shape'])
+        offset = buffers_start + spec['offset']
+        if mmap_mode is not None:
+            if not np.prod(shape):
+                return np.zeros(shape, dtype=dtype)
+            return np.memmap(filename, dtype=dtype, mode=mmap_mode, offset=offset, shape=shape)
+        buffer = bytearray(dtype.itemsize * int(np.prod(shape)))
+        file.seek(offset)
+        file.readinto(buffer)  # type: ignore
+        return np.frombuffer(buffer, dtype=dtype).reshape(shape)
+
+    def obj_hook(x):
+        if x.get('cirq_type') == '_BinaryArray':
+            return read_array(x['index'])
+        return cirq_obj_hook(x)
+
+    return json.loads(object_json, object_hook=obj_hook)
@@ -0,0 +1,39 @@
+# Copyright 2021 The Cirq Developers
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import cirq
+
+
+def _large_circuit() -> cirq.Circuit:
+    qubits = cirq.GridQubit.rect(6, 6)
+    return cirq.testing.random_circuit(
+        qubits,
+        n_moments=100,
+        op_density=0.8,
+        gate_domain={cirq.X: 1, cirq.Y: 1, cirq.Z: 1, cirq.H: 1, cirq.CZ: 2, cirq.CNOT: 2},
+        random_state=1234,
+    )
+
+
+def test_read_json_circuit_perf(benchmark):
+    circuit = _large_circuit()
+    json_text = cirq.to_json(circuit)
+    actual = benchmark(cirq.read_json, json_text=json_text)
+    assert actual == circuit
+
+
+def test_to_json_circuit_perf(benchmark):
+    circuit = _large_circuit()
+    json_text = benchmark(cirq.to_json, circuit)
+    assert cirq.read_json(json_text=json_text) == circuit
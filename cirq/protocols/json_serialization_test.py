@@ -109,6 +109,41 @@ def test_fail_to_resolve():
     assert e.match("Could not resolve type 'MyCustomClass' during deserialization")
 
 
+def test_read_json_resolves_each_type_once():
+    resolved = []
+
+    def counting_resolver(name):
+        resolved.append(name)
+        return None
+
+    q0, q1 = cirq.GridQubit.rect(1, 2)
+    circuit = cirq.Circuit([cirq.H(q0), cirq.CZ(q0, q1), cirq.X(q1) ** 0.5] * 10)
+    actual = cirq.read_json(
+        json_text=cirq.to_json(circuit), resolvers=[counting_resolver] + cirq.DEFAULT_RESOLVERS
+    )
+    assert actual == circuit
+    assert sorted(resolved) == sorted(set(resolved))
+    assert 'GridQubit' in resolved
+
+
+def test_read_json_custom_resolver_overrides_fast_path():
+    class MyQubit(cirq.GridQubit):
+        @classmethod
+        def _from_json_dict_(cls, row, col, **kwargs):
+            return cls(row, col)
+
+    def custom_resolver(name):
+        if name == 'GridQubit':
+            return MyQubit
+
+    q = cirq.GridQubit(2, 3)
+    actual = cirq.read_json(
+        json_text=cirq.to_json(cirq.X(q)), resolvers=[custom_resolver] + cirq.DEFAULT_RESOLVERS
+    )
+    assert actual == cirq.X(q)
+    assert type(actual.qubits[0]) is MyQubit
+
+
 QUBITS = cirq.LineQubit.range(5)
 Q0, Q1, Q2, Q3, Q4 = QUBITS
 
@@ -210,6 +245,7 @@ SHOULDNT_BE_SERIALIZED = [
     'SerializingArg',
     'Simulator',
     'StabilizerSampler',
+    'TrajectorySimulator',
     'Unique',
     'DEFAULT_RESOLVERS',
     # Quantum Engine
@@ -306,6 +342,7 @@ NOT_YET_SERIALIZABLE = [
     'PauliInteractionGate',
     'PauliStringPhasor',
     'PauliSum',
+    'ParallelSampler',
     'PauliSumCollector',
     'PauliTransform',
     'PeriodicValue',
@@ -737,6 +774,75 @@ def test_pathlib_paths(tmpdir):
     assert cirq.read_json(path) == cirq.X
 
 
+def test_binary_roundtrip(tmpdir):
+    q0, q1 = cirq.LineQubit.range(2)
+    circuit = cirq.Circuit(
+        cirq.H(q0),
+        cirq.MatrixGate(cirq.unitary(cirq.CZ)).on(q0, q1),
+        cirq.measure(q0, q1, key='m'),
+    )
+    prng = np.random.RandomState(0)
+    result = cirq.Result(
+        params=cirq.ParamResolver({'a': 0.5}),
+        measurements={
+            'm': prng.randint(2, size=(1000, 2)).astype(bool),
+            'd': prng.randint(3, size=(1000, 1)).astype(np.int8),
+            'e': np.zeros((1000, 0), dtype=np.uint8),
+        },
+    )
+    obj = {'circuit': circuit, 'results': [result, result], 'array': np.eye(3)[:, ::2]}
+
+    data = cirq.to_binary(obj)
+    assert isinstance(data, bytes)
+    assert len(data) < len(cirq.to_json(obj))
+    restored = cirq.read_binary(data=data)
+    assert restored['circuit'] == circuit
+    assert restored['results'] == [result, result]
+    np.testing.assert_array_equal(
+        restored['results'][0].measurements['d'], result.measurements['d']
+    )
+    np.testing.assert_array_equal(restored['array'], np.eye(3)[:, ::2])
+
+    buffer = io.BytesIO()
+    cirq.to_binary(obj, buffer)
+    buffer.seek(0)
+    assert cirq.read_binary(buffer)['results'] == [result, result]
+
+    path = pathlib.Path(tmpdir) / 'obj.bin'
+    cirq.to_binary(obj, path)
+    assert cirq.read_binary(path)['circuit'] == circuit
+    restored = cirq.read_binary(str(path), mmap_mode='r')
+    assert restored['results'] == [result, result]
+    assert isinstance(restored['array'], np.memmap)
+    assert isinstance(restored['results'][0]._records['m'].words, np.memmap)
+    np.testing.assert_array_equal(
+        restored['results'][0].measurements['m'], result.measurements['m']
+    )
+
+
+def test_binary_context_serialization():
+    def custom_resolver(name):
+        if name == 'SBKImpl':
+            return SBKImpl
+
+    sbki = SBKImpl('sbki', data_list=[SBKImpl('a'), SBKImpl('a')])
+    restored = cirq.read_binary(
+        data=cirq.to_binary(sbki), resolvers=[custom_resolver] + cirq.DEFAULT_RESOLVERS
+    )
+    assert restored == sbki
+
+
+def test_read_binary_errors(tmpdir):
+    with pytest.raises(ValueError, match='ONE of'):
+        cirq.read_binary()
+    with pytest.raises(ValueError, match='ONE of'):
+        cirq.read_binary(io.BytesIO(), data=b'')
+    with pytest.raises(ValueError, match='requires a filename'):
+        cirq.read_binary(data=cirq.to_binary(cirq.X), mmap_mode='r')
+    with pytest.raises(ValueError, match='Not a cirq binary file'):
+        cirq.read_binary(data=cirq.to_json(cirq.X).encode())
+
+
 def test_json_serializable_dataclass():
     @cirq.json_serializable_dataclass
     class MyDC:
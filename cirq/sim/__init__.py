@@ -55,6 +55,10 @@ from cirq.sim.sparse_simulator import (
     SparseSimulatorStep,
 )
 
+from cirq.sim.trajectory_simulator import (
+    TrajectorySimulator,
+)
+
 from cirq.sim.state_vector_simulator import (
     SimulatesIntermediateStateVector,
     SimulatesIntermediateWaveFunction,
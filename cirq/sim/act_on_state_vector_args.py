@@ -13,11 +13,12 @@
 # limitations under the License.
 """Objects and methods for acting efficiently on a state vector."""
 
-from typing import Any, Iterable, Sequence, Tuple, TYPE_CHECKING, Union, Dict
+from typing import Any, Iterable, List, Sequence, Tuple, TYPE_CHECKING, Union, Dict
 
 import numpy as np
 
-from cirq import linalg, protocols
+from cirq import linalg, ops, protocols
+from cirq.protocols.apply_unitary_protocol import _monomial_structure
 from cirq.protocols.decompose_protocol import (
     _try_decompose_into_operations_and_qubits,
 )
@@ -25,6 +26,10 @@ from cirq.protocols.decompose_protocol import (
 if TYPE_CHECKING:
     import cirq
 
+# The largest number of amplitudes processed at once when applying a gate to a
+# memory-mapped state vector.
+_MEMMAP_CHUNK_SIZE = 2 ** 24
+
 
 class ActOnStateVectorArgs:
     """State and context for an operation acting on a state vector.
@@ -36,6 +41,15 @@ class ActOnStateVectorArgs:
     2. Overwrite the `available_buffer` property with the new state vector, and
         then pass `available_buffer` into `swap_target_tensor_for`.
     3. Call `record_measurement_result(key, val)` to log a measurement result.
+
+    Unitaries given only by a diagonal or permutation matrix (for example a
+    `cirq.MatrixGate` of a phased permutation) are applied in place, by
+    scaling and rotating the affected subspaces of `target_tensor`, instead
+    of writing the whole result into `available_buffer`.
+
+    The tensors may be `numpy.memmap` arrays. Unitary operations are then
+    applied separately to each slice of the high-order axes they do not act
+    on, and the result is always left in `target_tensor`.
     """
 
     def __init__(
@@ -152,6 +166,7 @@ class ActOnStateVectorArgs:
 
     def _act_on_fallback_(self, action: Any, allow_decompose: bool):
         strats = [
+            _strat_act_on_state_vector_from_monomial_unitary,
             _strat_act_on_state_vector_from_apply_unitary,
             _strat_act_on_state_vector_from_mixture,
             _strat_act_on_state_vector_from_channel,
@@ -171,10 +186,79 @@ class ActOnStateVectorArgs:
         return NotImplemented
 
 
+def _strat_act_on_state_vector_from_monomial_unitary(
+    action: Any,
+    args: 'cirq.ActOnStateVectorArgs',
+) -> bool:
+    """Applies matrix-only diagonal and permutation unitaries in place.
+
+    Values with an `_apply_unitary_` method keep their own kernels. For the
+    others, each cycle of the permutation is rotated through the target with
+    one subspace of scratch space, and each phase is applied to its subspace
+    in place, so subspaces that are left unchanged are never touched.
+    """
+    val = action.gate if isinstance(action, ops.GateOperation) else action
+    if getattr(val, '_apply_unitary_', None) is not None:
+        return NotImplemented
+    method = getattr(val, '_unitary_', None)
+    if method is None:
+        return NotImplemented
+    matrix = method()
+    if matrix is NotImplemented or matrix is None:
+        return NotImplemented
+    dim = int(np.prod([args.target_tensor.shape[axis] for axis in args.axes], dtype=int))
+    if matrix.shape != (dim, dim):
+        return NotImplemented
+    structure = _monomial_structure(matrix)
+    if structure is None:
+        return NotImplemented
+    sources, factors = structure
+
+    cycles = []
+    visited = set()
+    for start in range(dim):
+        if start in visited or (sources[start] == start and factors[start] == 1):
+            continue
+        cycle = [start]
+        visited.add(start)
+        while sources[cycle[-1]] != start:
+            cycle.append(sources[cycle[-1]])
+            visited.add(cycle[-1])
+        cycles.append(cycle)
+    # Rotating a cycle saves its first subspace and moves each of the others
+    # once. Writing the whole result into the buffer moves all subspaces.
+    if sum(len(cycle) + (len(cycle) > 1) for cycle in cycles) > dim:
+        return NotImplemented
+
+    def index(k) -> Tuple[Union[slice, int, 'ellipsis'], ...]:
+        # The trailing ellipsis keeps 0-d subspaces as views rather than scalars.
+        return args.subspace_index(big_endian_bits_int=int(k)) + (Ellipsis,)
+
+    def write(k: int, value: np.ndarray) -> None:
+        out = args.target_tensor[index(k)]
+        if factors[k] == 1:
+            out[...] = value
+        else:
+            np.multiply(value, factors[k], out=out)
+
+    for cycle in cycles:
+        if len(cycle) == 1:
+            args.target_tensor[index(cycle[0])] *= factors[cycle[0]]
+            continue
+        saved = args.available_buffer[index(cycle[0])]
+        saved[...] = args.target_tensor[index(cycle[0])]
+        for k in cycle[:-1]:
+            write(k, args.target_tensor[index(sources[k])])
+        write(cycle[-1], saved)
+    return True
+
+
 def _strat_act_on_state_vector_from_apply_unitary(
     unitary_value: Any,
     args: 'cirq.ActOnStateVectorArgs',
 ) -> bool:
+    if isinstance(args.target_tensor, np.memmap):
+        return _act_on_memmap_chunks_from_apply_unitary(unitary_value, args)
     new_target_tensor = protocols.apply_unitary(
         unitary_value,
         protocols.ApplyUnitaryArgs(
@@ -191,6 +275,47 @@ def _strat_act_on_state_vector_from_apply_unitary(
     return True
 
 
+def _act_on_memmap_chunks_from_apply_unitary(
+    unitary_value: Any,
+    args: 'cirq.ActOnStateVectorArgs',
+) -> bool:
+    shape = args.target_tensor.shape
+    # Chunk over the highest-order axes that the gate does not act on, so
+    # that a gate on a leading qubit does not process the whole state at once.
+    chunk_axes: List[int] = []
+    chunk_size = args.target_tensor.size
+    for axis in range(len(shape)):
+        if chunk_size <= _MEMMAP_CHUNK_SIZE:
+            break
+        if axis not in args.axes:
+            chunk_axes.append(axis)
+            chunk_size //= shape[axis]
+    remaining_axes = [axis for axis in range(len(shape)) if axis not in chunk_axes]
+    axes = tuple(remaining_axes.index(axis) for axis in args.axes)
+
+    for values in np.ndindex(*(shape[axis] for axis in chunk_axes)):
+        index_list: List[Union[int, slice]] = [slice(None)] * len(shape)
+        for axis, v in zip(chunk_axes, values):
+            index_list[axis] = v
+        index = tuple(index_list)
+        target = args.target_tensor[index]
+        result = protocols.apply_unitary(
+            unitary_value,
+            protocols.ApplyUnitaryArgs(
+                target_tensor=target,
+                available_buffer=args.available_buffer[index],
+                axes=axes,
+            ),
+            allow_decompose=False,
+            default=NotImplemented,
+        )
+        if result is NotImplemented:
+            return NotImplemented
+        if result is not target:
+            target[...] = result
+    return True
+
+
 def _strat_act_on_state_vector_from_apply_decompose(
     val: Any,
     args: ActOnStateVectorArgs,
@@ -220,3 +220,97 @@ def test_random_channel_has_random_behavior():
     v = s['out'].value_counts()
     assert v[0] > 1
     assert v[1] > 1
+
+
+def test_act_on_memmap_in_chunks(tmp_path):
+    def memmap(name):
+        return np.memmap(tmp_path / name, dtype=np.complex64, mode='w+', shape=(2, 2, 2))
+
+    state = cirq.testing.random_superposition(8).astype(np.complex64).reshape((2, 2, 2))
+    args = cirq.ActOnStateVectorArgs(
+        target_tensor=memmap('target'),
+        available_buffer=memmap('buffer'),
+        axes=[2],
+        prng=np.random.RandomState(),
+        log_of_measurement_results={},
+    )
+    args.target_tensor[...] = state
+    target = args.target_tensor
+    with mock.patch.object(cirq.sim.act_on_state_vector_args, '_MEMMAP_CHUNK_SIZE', new=2):
+        cirq.act_on(cirq.H(cirq.LineQubit(2)), args)
+        args.axes = (1, 2)
+        cirq.act_on(cirq.CNOT(*cirq.LineQubit.range(1, 3)), args)
+    assert args.target_tensor is target
+    expected = cirq.final_state_vector(
+        cirq.Circuit(cirq.H(cirq.LineQubit(2)), cirq.CNOT(*cirq.LineQubit.range(1, 3))),
+        initial_state=state.reshape(8),
+        qubit_order=cirq.LineQubit.range(3),
+    )
+    np.testing.assert_allclose(target.reshape(8), expected, atol=1e-6)
+
+
+def test_act_on_memmap_chunks_skip_leading_target_axes(tmp_path):
+    def memmap(name):
+        return np.memmap(tmp_path / name, dtype=np.complex64, mode='w+', shape=(2, 2, 2))
+
+    state = cirq.testing.random_superposition(8).astype(np.complex64).reshape((2, 2, 2))
+    args = cirq.ActOnStateVectorArgs(
+        target_tensor=memmap('target'),
+        available_buffer=memmap('buffer'),
+        axes=[0],
+        prng=np.random.RandomState(),
+        log_of_measurement_results={},
+    )
+    args.target_tensor[...] = state
+    q0, _, q2 = cirq.LineQubit.range(3)
+    apply_unitary = cirq.protocols.apply_unitary
+    with mock.patch.object(cirq.sim.act_on_state_vector_args, '_MEMMAP_CHUNK_SIZE', new=2):
+        with mock.patch.object(cirq.protocols, 'apply_unitary', wraps=apply_unitary) as spy:
+            cirq.act_on(cirq.H(q0), args)
+            assert spy.call_count == 4
+            args.axes = (0, 2)
+            cirq.act_on(cirq.CNOT(q0, q2), args)
+            assert spy.call_count == 6
+    expected = cirq.final_state_vector(
+        cirq.Circuit(cirq.H(q0), cirq.CNOT(q0, q2)),
+        initial_state=state.reshape(8),
+        qubit_order=cirq.LineQubit.range(3),
+    )
+    np.testing.assert_allclose(args.target_tensor.reshape(8), expected, atol=1e-6)
+
+
+@pytest.mark.parametrize(
+    'matrix, in_place',
+    [
+        (np.diag([1, 1j]), True),
+        (np.diag([1j, 1, -1, 1]), True),
+        (np.array([[0, 1], [1j, 0]]), False),
+        (cirq.unitary(cirq.CCX), True),
+        (cirq.unitary(cirq.ISWAP) @ cirq.unitary(cirq.CZ), True),
+        (np.diag([1j, -1, 1j, -1j]), True),
+        (np.kron(np.eye(2), [[0, 1], [1, 0]]), False),
+        (cirq.unitary(cirq.H), False),
+    ],
+)
+def test_act_on_monomial_matrix_gate(matrix, in_place):
+    gate = cirq.MatrixGate(matrix)
+    n = cirq.num_qubits(gate)
+    for num_axes in [n, n + 1]:
+        qubits = cirq.LineQubit.range(num_axes)
+        state = cirq.testing.random_superposition(2 ** num_axes).astype(np.complex64)
+        args = cirq.ActOnStateVectorArgs(
+            target_tensor=state.reshape((2,) * num_axes).copy(),
+            available_buffer=np.empty((2,) * num_axes, dtype=np.complex64),
+            axes=range(num_axes - n, num_axes),
+            prng=np.random.RandomState(),
+            log_of_measurement_results={},
+        )
+        target = args.target_tensor
+        cirq.act_on(gate.on(*qubits[num_axes - n :]), args)
+        assert (args.target_tensor is target) == in_place
+        expected = cirq.final_state_vector(
+            cirq.Circuit(gate.on(*qubits[num_axes - n :])),
+            initial_state=state,
+            qubit_order=qubits,
+        )
+        np.testing.assert_allclose(args.target_tensor.reshape(-1), expected, atol=1e-6)
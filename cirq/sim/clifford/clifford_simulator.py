@@ -40,6 +40,7 @@ from cirq.ops.clifford_gate import SingleQubitCliffordGate
 from cirq.ops.dense_pauli_string import DensePauliString
 from cirq.protocols import act_on, unitary
 from cirq.sim import clifford, simulator
+from cirq.sim.clifford import pauli_frame
 from cirq._compat import deprecated, deprecated_parameter
 from cirq.sim.simulator import check_all_resolved
 
@@ -142,6 +143,15 @@ class CliffordSimulator(simulator.SimulatesSamples, simulator.SimulatesIntermedi
         resolved_circuit = protocols.resolve_parameters(circuit, param_resolver)
         check_all_resolved(resolved_circuit)
 
+        if repetitions > 0 and pauli_frame.can_sample_with_pauli_frames(resolved_circuit):
+            frame_measurements = pauli_frame.sample_with_pauli_frames(
+                resolved_circuit,
+                ops.QubitOrder.DEFAULT.order_for(resolved_circuit.all_qubits()),
+                repetitions,
+                self._prng,
+            )
+            return {k: v.astype(bool) for k, v in frame_measurements.items()}
+
         measurements = {}  # type: Dict[str, List[np.ndarray]]
         if repetitions == 0:
             for _, op, _ in resolved_circuit.findall_operations_with_gate_type(ops.MeasurementGate):
@@ -412,7 +412,7 @@ def test_sample_seed():
     result = simulator.run(circuit, repetitions=20)
     measured = result.measurements['q']
     result_string = ''.join(map(lambda x: str(int(x[0])), measured))
-    assert result_string == '11010001111100100000'
+    assert result_string == '11010000100101001111'
 
 
 def test_is_supported_operation():
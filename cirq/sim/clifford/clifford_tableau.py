@@ -141,27 +141,20 @@ class CliffordTableau:
         """Implements the "rowsum" routine defined by
         Aaronson and Gottesman.
         Multiplies the stabilizer in row q1 by the stabilizer in row q2."""
+        self._rowsums(np.array([q1]), q2)
 
-        def g(x1, z1, x2, z2):
-            if not x1 and not z1:
-                return 0
-            elif x1 and z1:
-                return int(z2) - int(x2)
-            elif x1 and not z1:
-                return int(z2) * (2 * int(x2) - 1)
-            else:
-                return int(x2) * (1 - 2 * int(z2))
-
-        r = 2 * int(self.rs[q1]) + 2 * int(self.rs[q2])
-        for j in range(self.n):
-            r += g(self.xs[q2, j], self.zs[q2, j], self.xs[q1, j], self.zs[q1, j])
+    def _rowsums(self, targets: np.ndarray, source: int):
+        """Applies the "rowsum" routine to several rows at once.
 
-        r %= 4
-
-        self.rs[q1] = bool(r)
-
-        self.xs[q1, :] ^= self.xs[q2, :]
-        self.zs[q1, :] ^= self.zs[q2, :]
+        Multiplies the stabilizer in each row of `targets` by the stabilizer in
+        row `source`. Since only the target rows are modified, the products
+        are independent of each other and are computed together.
+        """
+        r = 2 * self.rs[targets].astype(int) + 2 * int(self.rs[source])
+        r += _phase_exponents(self.xs[source], self.zs[source], self.xs[targets], self.zs[targets])
+        self.rs[targets] = r % 4 != 0
+        self.xs[targets, :] ^= self.xs[source, :]
+        self.zs[targets, :] ^= self.zs[source, :]
 
     def _row_to_dense_pauli(self, i: int) -> DensePauliString:
         """
@@ -203,27 +196,32 @@ class CliffordTableau:
 
         Returns: the result (0 or 1) of the measurement.
         """
-        is_commuting = True
-        for i in range(self.n, 2 * self.n):
-            if self.xs[i, q]:
-                p = i
-                is_commuting = False
-                break
-
-        if is_commuting:
-            self.xs[2 * self.n, :] = False
-            self.zs[2 * self.n, :] = False
-            self.rs[2 * self.n] = False
-
-            for i in range(self.n):
-                if self.xs[i, q]:
-                    self._rowsum(2 * self.n, self.n + i)
+        anticommuting = np.flatnonzero(self.xs[self.n : 2 * self.n, q])
+        if not len(anticommuting):
+            # The outcome is the phase of the product of the stabilizers whose
+            # destabilizers anticommute with Z_q, accumulated into the scratch
+            # row. Each factor is multiplied into the running product of the
+            # factors before it, so the phase contributions of all steps can be
+            # computed at once from the prefix products.
+            sources = self.n + np.flatnonzero(self.xs[: self.n, q])
+            xs, zs = self.xs[sources], self.zs[sources]
+            prefix_xs = np.zeros_like(xs)
+            prefix_zs = np.zeros_like(zs)
+            prefix_xs[1:] = np.bitwise_xor.accumulate(xs, axis=0)[:-1]
+            prefix_zs[1:] = np.bitwise_xor.accumulate(zs, axis=0)[:-1]
+            r = 2 * int(np.sum(self.rs[sources])) + int(
+                np.sum(_phase_exponents(xs, zs, prefix_xs, prefix_zs))
+            )
+
+            self.xs[2 * self.n, :] = np.bitwise_xor.reduce(xs, axis=0) if len(xs) else False
+            self.zs[2 * self.n, :] = np.bitwise_xor.reduce(zs, axis=0) if len(zs) else False
+            self.rs[2 * self.n] = r % 4 != 0
             return int(self.rs[2 * self.n])
 
         else:
-            for i in range(2 * self.n):
-                if i != p and self.xs[i, q]:
-                    self._rowsum(i, p)
+            p = self.n + anticommuting[0]
+            targets = np.flatnonzero(self.xs[: 2 * self.n, q])
+            self._rowsums(targets[targets != p], p)
 
             self.xs[p - self.n, :] = self.xs[p, :]
             self.zs[p - self.n, :] = self.zs[p, :]
@@ -237,3 +235,15 @@ class CliffordTableau:
             self.rs[p] = bool(prng.randint(2))
 
             return int(self.rs[p])
+
+
+def _phase_exponents(x1: np.ndarray, z1: np.ndarray, x2: np.ndarray, z2: np.ndarray) -> np.ndarray:
+    """Vectorized form of the function "g" defined by Aaronson and Gottesman.
+
+    Returns, summed over the last axis, the exponent to which i is raised when
+    the Pauli matrices encoded by (x1, z1) and (x2, z2) are multiplied. The
+    arguments are boolean arrays that broadcast against each other.
+    """
+    x1, z1, x2, z2 = (np.asarray(a, dtype=int) for a in (x1, z1, x2, z2))
+    g = x1 * z1 * (z2 - x2) + x1 * (1 - z1) * z2 * (2 * x2 - 1) + (1 - x1) * z1 * x2 * (1 - 2 * z2)
+    return np.sum(g, axis=-1)
@@ -0,0 +1,84 @@
+# Copyright 2020 The Cirq Developers
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import numpy as np
+import pytest
+
+import cirq
+
+
+def _random_clifford_circuit(qubits, depth, prng):
+    gates = [cirq.H, cirq.S, cirq.X, cirq.Z]
+    circuit = cirq.Circuit()
+    for _ in range(depth):
+        if len(qubits) > 1 and prng.randint(2):
+            a, b = prng.choice(len(qubits), 2, replace=False)
+            circuit.append(cirq.CNOT(qubits[a], qubits[b]))
+        else:
+            circuit.append(gates[prng.randint(len(gates))](qubits[prng.randint(len(qubits))]))
+    return circuit
+
+
+def _apply(tableau, circuit, qubits):
+    for op in circuit.all_operations():
+        args = cirq.ActOnCliffordTableauArgs(
+            tableau=tableau,
+            axes=[qubits.index(q) for q in op.qubits],
+            prng=np.random.RandomState(),
+            log_of_measurement_results={},
+        )
+        cirq.act_on(op, args)
+
+
+def test_rowsums_matches_sequential_rowsum():
+    prng = np.random.RandomState(1)
+    qubits = cirq.LineQubit.range(5)
+    tableau = cirq.CliffordTableau(num_qubits=5)
+    _apply(tableau, _random_clifford_circuit(qubits, 60, prng), qubits)
+
+    expected = tableau.copy()
+    targets = np.array([0, 2, 6, 9])
+    for t in targets:
+        expected._rowsum(t, 4)
+    tableau._rowsums(targets, 4)
+    assert tableau == expected
+
+
+@pytest.mark.parametrize('seed', range(5))
+def test_measure_after_inverse_circuit_is_deterministic(seed):
+    prng = np.random.RandomState(seed)
+    n = 6
+    qubits = cirq.LineQubit.range(n)
+    initial_state = prng.randint(2 ** n)
+    circuit = _random_clifford_circuit(qubits, 80, prng)
+    tableau = cirq.CliffordTableau(num_qubits=n, initial_state=initial_state)
+    _apply(tableau, circuit + cirq.inverse(circuit), qubits)
+
+    bits = [tableau._measure(q, prng) for q in range(n)]
+    assert bits == cirq.big_endian_int_to_bits(initial_state, bit_count=n)
+
+
+def test_measure_ghz_state_is_correlated():
+    n = 40
+    qubits = cirq.LineQubit.range(n)
+    circuit = cirq.Circuit(cirq.H(qubits[0]), [cirq.CNOT(qubits[0], q) for q in qubits[1:]])
+    prng = np.random.RandomState(3)
+    outcomes = set()
+    for _ in range(10):
+        tableau = cirq.CliffordTableau(num_qubits=n)
+        _apply(tableau, circuit, qubits)
+        bits = [tableau._measure(q, prng) for q in range(n)]
+        assert len(set(bits)) == 1
+        outcomes.add(bits[0])
+    assert outcomes == {0, 1}
@@ -0,0 +1,193 @@
+# Copyright 2020 The Cirq Developers
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Shot-batched sampling of stabilizer circuits with Pauli frames.
+
+A single reference sample of the circuit is computed with a
+`cirq.CliffordTableau`. Every other shot is described by a Pauli frame, the
+Pauli operator separating that shot's state from the reference state. Frames
+for all shots are propagated through the Clifford gates at once as bit-packed
+arrays (one bit per shot), and a measurement result for a shot is the
+reference result flipped by the X component of its frame on the measured
+qubit. Randomizing the Z component of the frames at initialization and after
+every measurement reproduces the statistics of random measurement outcomes.
+"""
+
+import functools
+from typing import Callable, Dict, List, Optional, Sequence, Tuple, TYPE_CHECKING
+
+import numpy as np
+
+from cirq import ops, protocols
+from cirq.ops.clifford_gate import SingleQubitCliffordGate
+from cirq.ops.global_phase_op import GlobalPhaseOperation
+from cirq.sim.clifford.act_on_clifford_tableau_args import ActOnCliffordTableauArgs
+from cirq.sim.clifford.clifford_tableau import CliffordTableau
+
+if TYPE_CHECKING:
+    import cirq
+
+# The (x, z) bits of each Pauli.
+_PAULI_BITS = {ops.X: (1, 0), ops.Y: (1, 1), ops.Z: (0, 1)}
+
+_FrameUpdate = Callable[['_PauliFrames', Tuple[int, ...]], None]
+
+
+class _PauliFrames:
+    """The X and Z components of the Pauli frames of many shots.
+
+    Both components are stored as `(num_qubits, ceil(repetitions / 8))` uint8
+    arrays, with the bits of consecutive shots packed into bytes.
+    """
+
+    def __init__(self, num_qubits: int, repetitions: int, prng: np.random.RandomState):
+        self.repetitions = repetitions
+        self.prng = prng
+        num_bytes = (repetitions + 7) // 8
+        self.xs = np.zeros((num_qubits, num_bytes), dtype=np.uint8)
+        self.zs = self.random_bytes((num_qubits, num_bytes))
+
+    def random_bytes(self, shape: Tuple[int, ...]) -> np.ndarray:
+        return self.prng.randint(256, size=shape, dtype=np.uint8)
+
+    def x_bits(self, axis: int) -> np.ndarray:
+        return np.unpackbits(self.xs[axis])[: self.repetitions]
+
+
+def _single_qubit_clifford_update(gate: SingleQubitCliffordGate) -> _FrameUpdate:
+    x_to = _PAULI_BITS[gate.transform(ops.X).to]
+    z_to = _PAULI_BITS[gate.transform(ops.Z).to]
+
+    def update(frames: _PauliFrames, axes: Tuple[int, ...]) -> None:
+        (q,) = axes
+        x, z = frames.xs[q], frames.zs[q]
+        frames.xs[q], frames.zs[q] = (
+            (x * x_to[0]) ^ (z * z_to[0]),
+            (x * x_to[1]) ^ (z * z_to[1]),
+        )
+
+    return update
+
+
+def _cnot_update(frames: _PauliFrames, axes: Tuple[int, ...]) -> None:
+    control, target = axes
+    frames.xs[target] ^= frames.xs[control]
+    frames.zs[control] ^= frames.zs[target]
+
+
+def _cz_update(frames: _PauliFrames, axes: Tuple[int, ...]) -> None:
+    a, b = axes
+    frames.zs[a] ^= frames.xs[b]
+    frames.zs[b] ^= frames.xs[a]
+
+
+def _no_update(frames: _PauliFrames, axes: Tuple[int, ...]) -> None:
+    pass
+
+
+def _frame_update(op: 'cirq.Operation') -> Optional[_FrameUpdate]:
+    """Returns how an operation changes the Pauli frames, if supported."""
+    if isinstance(op, GlobalPhaseOperation):
+        return _no_update
+    if op.gate == ops.CNOT:
+        return _cnot_update
+    if op.gate == ops.CZ:
+        return _cz_update
+    if len(op.qubits) == 1 and op.gate is not None:
+        try:
+            hash(op.gate)
+        except TypeError:
+            # The gate is not hashable, so its update cannot be cached.
+            pass
+        else:
+            return _single_qubit_gate_update(op.gate)
+    if len(op.qubits) == 1 and protocols.has_unitary(op):
+        return _single_qubit_unitary_update(protocols.unitary(op))
+    return None
+
+
+@functools.lru_cache(maxsize=1024)
+def _single_qubit_gate_update(gate: 'cirq.Gate') -> Optional[_FrameUpdate]:
+    if not protocols.has_unitary(gate):
+        return None
+    return _single_qubit_unitary_update(protocols.unitary(gate))
+
+
+def _single_qubit_unitary_update(unitary: np.ndarray) -> Optional[_FrameUpdate]:
+    gate = SingleQubitCliffordGate.from_unitary(unitary)
+    if gate is None:
+        return None
+    return _single_qubit_clifford_update(gate)
+
+
+def can_sample_with_pauli_frames(circuit: 'cirq.Circuit') -> bool:
+    """Determines whether `sample_with_pauli_frames` supports a circuit.
+
+    Every operation must be a measurement gate, a global phase, a single qubit
+    Clifford operation, a CNOT or a CZ.
+    """
+    return all(
+        isinstance(op.gate, ops.MeasurementGate) or _frame_update(op) is not None
+        for op in circuit.all_operations()
+    )
+
+
+def sample_with_pauli_frames(
+    circuit: 'cirq.Circuit',
+    qubits: Sequence['cirq.Qid'],
+    repetitions: int,
+    prng: np.random.RandomState,
+) -> Dict[str, np.ndarray]:
+    """Samples a stabilizer circuit by propagating Pauli frames for all shots.
+
+    Args:
+        circuit: The circuit to sample, starting from the all zeros state.
+            Must satisfy `can_sample_with_pauli_frames`.
+        qubits: The qubits of the circuit, defining the tableau ordering.
+        repetitions: The number of shots.
+        prng: The pseudo random number generator used for the reference sample
+            and for randomizing the frames.
+
+    Returns:
+        A dictionary from measurement key to a `(repetitions, num_qubits)`
+        array of measurement results.
+    """
+    qubit_map = {q: i for i, q in enumerate(qubits)}
+    reference = ActOnCliffordTableauArgs(
+        CliffordTableau(num_qubits=len(qubits)),
+        axes=(),
+        prng=prng,
+        log_of_measurement_results={},
+    )
+    frames = _PauliFrames(len(qubits), repetitions, prng)
+
+    results: Dict[str, np.ndarray] = {}
+    for op in circuit.all_operations():
+        axes = tuple(qubit_map[q] for q in op.qubits)
+        reference.axes = axes
+        protocols.act_on(op, reference)
+        if isinstance(op.gate, ops.MeasurementGate):
+            key = op.gate.key
+            reference_bits: List[int] = reference.log_of_measurement_results[key]
+            results[key] = np.stack(
+                [frames.x_bits(axis) ^ bit for axis, bit in zip(axes, reference_bits)], axis=-1
+            ).astype(np.uint8)
+            # The measured qubits are left in a Z eigenstate, which makes
+            # their Z frame components irrelevant.
+            frames.zs[list(axes)] = frames.random_bytes((len(axes), frames.zs.shape[1]))
+        else:
+            update = _frame_update(op)
+            assert update is not None
+            update(frames, axes)
+    return results
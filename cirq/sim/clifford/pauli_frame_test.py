@@ -0,0 +1,136 @@
+# Copyright 2020 The Cirq Developers
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from unittest import mock
+
+import numpy as np
+import pytest
+
+import cirq
+from cirq.sim.clifford import pauli_frame
+
+
+def _sample(circuit, repetitions, seed=0):
+    return pauli_frame.sample_with_pauli_frames(
+        circuit, sorted(circuit.all_qubits()), repetitions, np.random.RandomState(seed)
+    )
+
+
+def test_can_sample_with_pauli_frames():
+    a, b = cirq.LineQubit.range(2)
+    assert pauli_frame.can_sample_with_pauli_frames(
+        cirq.Circuit(
+            cirq.H(a),
+            cirq.S(a) ** -1,
+            cirq.CNOT(a, b),
+            cirq.CZ(a, b),
+            cirq.GlobalPhaseOperation(1j),
+            cirq.measure(a, b),
+        )
+    )
+    assert not pauli_frame.can_sample_with_pauli_frames(cirq.Circuit(cirq.T(a)))
+    assert not pauli_frame.can_sample_with_pauli_frames(cirq.Circuit(cirq.SWAP(a, b)))
+    assert not pauli_frame.can_sample_with_pauli_frames(cirq.Circuit(cirq.reset(a)))
+
+
+def test_unhashable_single_qubit_gate():
+    class UnhashableX(cirq.SingleQubitGate):
+        __hash__ = None
+
+        def _unitary_(self):
+            return np.array([[0, 1], [1, 0]])
+
+    class BrokenGate(cirq.SingleQubitGate):
+        def _has_unitary_(self):
+            return True
+
+        def _unitary_(self):
+            raise TypeError('broken')
+
+    a = cirq.LineQubit(0)
+    circuit = cirq.Circuit(UnhashableX().on(a), cirq.measure(a, key='m'))
+    assert pauli_frame.can_sample_with_pauli_frames(circuit)
+    np.testing.assert_equal(_sample(circuit, repetitions=3)['m'], [[1]] * 3)
+
+    # Errors raised while computing the update of a hashable gate propagate.
+    with pytest.raises(TypeError, match='broken'):
+        _ = pauli_frame.can_sample_with_pauli_frames(cirq.Circuit(BrokenGate().on(a)))
+
+
+def test_deterministic_results():
+    a, b, c = cirq.LineQubit.range(3)
+    circuit = cirq.Circuit(
+        cirq.X(a),
+        cirq.H(b),
+        cirq.S(b),
+        cirq.S(b),
+        cirq.H(b),
+        cirq.CNOT(a, c),
+        cirq.measure(a, b, c, key='m', invert_mask=(False, False, True)),
+    )
+    results = _sample(circuit, repetitions=13)
+    assert results['m'].shape == (13, 3)
+    np.testing.assert_equal(results['m'], [[1, 1, 0]] * 13)
+
+
+def test_ghz_correlations_and_mid_circuit_measurements():
+    qubits = cirq.LineQubit.range(4)
+    circuit = cirq.Circuit(
+        cirq.H(qubits[0]),
+        [cirq.CNOT(qubits[0], q) for q in qubits[1:]],
+        cirq.measure(qubits[0], key='first'),
+        cirq.measure(*qubits, key='all'),
+        cirq.H(qubits[1]),
+        cirq.measure(qubits[1], key='x'),
+    )
+    results = _sample(circuit, repetitions=1000)
+    first, everything, x = results['first'], results['all'], results['x']
+    np.testing.assert_equal(everything, np.repeat(first, 4, axis=1))
+    assert 400 < np.sum(first) < 600
+    assert 400 < np.sum(x) < 600
+    # The X basis measurement is independent of the earlier outcome.
+    assert 150 < np.sum(x[:, 0] & first[:, 0]) < 350
+
+
+@pytest.mark.parametrize('seed', range(3))
+def test_matches_state_vector_statistics(seed):
+    qubits = cirq.LineQubit.range(3)
+    prng = np.random.RandomState(seed)
+    gates = [cirq.H, cirq.S, cirq.X, cirq.Y, cirq.Z, cirq.S ** -1]
+    circuit = cirq.Circuit()
+    for _ in range(20):
+        if prng.randint(3) == 0:
+            a, b = prng.choice(3, 2, replace=False)
+            circuit.append((cirq.CNOT, cirq.CZ)[prng.randint(2)](qubits[a], qubits[b]))
+        else:
+            circuit.append(gates[prng.randint(len(gates))](qubits[prng.randint(3)]))
+    circuit.append(cirq.measure(*qubits, key='m'))
+
+    samples = _sample(circuit, repetitions=4000, seed=seed)['m']
+    counts = np.bincount(samples.dot([4, 2, 1]), minlength=8) / 4000
+    expected = np.abs(cirq.final_state_vector(circuit[:-1], qubit_order=qubits)) ** 2
+    np.testing.assert_allclose(counts, expected, atol=0.04)
+
+
+def test_stabilizer_sampler_uses_pauli_frames():
+    q = cirq.LineQubit(0)
+    circuit = cirq.Circuit(cirq.X(q), cirq.measure(q, key='m'))
+    with mock.patch.object(
+        pauli_frame, 'sample_with_pauli_frames', wraps=pauli_frame.sample_with_pauli_frames
+    ) as mock_sample:
+        result = cirq.StabilizerSampler().run(circuit, repetitions=5)
+        np.testing.assert_equal(result.measurements['m'], [[1]] * 5)
+        result = cirq.CliffordSimulator().run(circuit, repetitions=5)
+        np.testing.assert_equal(result.measurements['m'], [[True]] * 5)
+    assert mock_sample.call_count == 2
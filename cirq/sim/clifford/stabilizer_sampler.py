@@ -20,11 +20,18 @@ import cirq
 from cirq import circuits, protocols, value
 from cirq.sim.clifford.act_on_clifford_tableau_args import ActOnCliffordTableauArgs
 from cirq.sim.clifford.clifford_tableau import CliffordTableau
+from cirq.sim.clifford import pauli_frame
 from cirq.work import sampler
 
 
 class StabilizerSampler(sampler.Sampler):
-    """An efficient sampler for stabilizer circuits."""
+    """An efficient sampler for stabilizer circuits.
+
+    Circuits made of single qubit Cliffords, CNOT, CZ and measurement gates are
+    sampled by simulating a single reference shot and propagating Pauli frames
+    for all repetitions at once. Other circuits are simulated once per
+    repetition.
+    """
 
     def __init__(self, *, seed: 'cirq.RANDOM_STATE_OR_SEED_LIKE' = None):
         """
@@ -51,6 +58,10 @@ class StabilizerSampler(sampler.Sampler):
         return results
 
     def _run(self, circuit: circuits.Circuit, repetitions: int) -> Dict[str, np.ndarray]:
+        if pauli_frame.can_sample_with_pauli_frames(circuit):
+            return pauli_frame.sample_with_pauli_frames(
+                circuit, list(circuit.all_qubits()), repetitions, self._prng
+            )
 
         measurements: Dict[str, List[int]] = {
             key: [] for key in protocols.measurement_keys(circuit)
@@ -15,12 +15,23 @@
 
 import collections
 
-from typing import Any, Dict, Iterator, List, TYPE_CHECKING, Tuple, Type, Union
+from typing import (
+    Any,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    TYPE_CHECKING,
+    Tuple,
+    Type,
+    Union,
+)
 
 import numpy as np
 
 from cirq import circuits, ops, protocols, qis, study, value, devices
-from cirq.sim import density_matrix_utils, simulator
+from cirq.sim import density_matrix_utils, simulator, workspace_pool
 from cirq.sim.simulator import check_all_resolved
 
 if TYPE_CHECKING:
@@ -29,10 +40,27 @@ if TYPE_CHECKING:
 
 
 class _StateAndBuffers:
-    def __init__(self, num_qubits: int, tensor: np.ndarray):
+    def __init__(
+        self, num_qubits: int, tensor: np.ndarray, buffers: Optional[List[np.ndarray]] = None
+    ):
         self.num_qubits = num_qubits
         self.tensor = tensor
-        self.buffers = [np.empty_like(tensor) for _ in range(3)]
+        self.buffers = buffers if buffers is not None else [np.empty_like(tensor) for _ in range(3)]
+
+
+def _initialize_density_matrix(
+    out: np.ndarray, initial_state: Any, qid_shape: Tuple[int, ...]
+) -> None:
+    """Writes a valid density matrix into a `qid_shape * 2` shaped array."""
+    dim = int(np.prod(qid_shape, dtype=int))
+    if isinstance(initial_state, (int, np.integer)) and 0 <= initial_state < dim:
+        out.fill(0)
+        out.reshape(dim, dim)[initial_state, initial_state] = 1
+    else:
+        matrix = qis.to_valid_density_matrix(
+            initial_state, len(qid_shape), qid_shape=qid_shape, dtype=out.dtype
+        )
+        np.copyto(out, matrix.reshape(qid_shape * 2))
 
 
 class DensityMatrixSimulator(simulator.SimulatesSamples, simulator.SimulatesIntermediateState):
@@ -122,6 +150,7 @@ class DensityMatrixSimulator(simulator.SimulatesSamples, simulator.SimulatesInte
         noise: 'cirq.NOISE_MODEL_LIKE' = None,
         seed: 'cirq.RANDOM_STATE_OR_SEED_LIKE' = None,
         ignore_measurement_results: bool = False,
+        reuse_workspaces: bool = False,
     ):
         """Density matrix simulator.
 
@@ -151,6 +180,11 @@ class DensityMatrixSimulator(simulator.SimulatesSamples, simulator.SimulatesInte
 
                The measurement result will be the maximally mixed state
                with equal probability for 0 and 1.
+           reuse_workspaces: If set, the density matrices and scratch buffers
+               of finished simulations are kept and reused by later
+               simulations on the same qid shape, instead of being
+               reallocated. Call `close` (or use the simulator as a context
+               manager) to release them.
         """
         if dtype not in {np.complex64, np.complex128}:
             raise ValueError('dtype must be complex64 or complex128, was {}'.format(dtype))
@@ -159,6 +193,18 @@ class DensityMatrixSimulator(simulator.SimulatesSamples, simulator.SimulatesInte
         self._prng = value.parse_random_state(seed)
         self.noise = devices.NoiseModel.from_noise_model_like(noise)
         self._ignore_measurement_results = ignore_measurement_results
+        self._workspaces = workspace_pool.WorkspacePool() if reuse_workspaces else None
+
+    def close(self) -> None:
+        """Releases the workspaces kept for reuse, if any."""
+        if self._workspaces is not None:
+            self._workspaces.clear()
+
+    def __enter__(self) -> 'DensityMatrixSimulator':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
 
     def _run(
         self, circuit: circuits.Circuit, param_resolver: study.ParamResolver, repetitions: int
@@ -172,14 +218,64 @@ class DensityMatrixSimulator(simulator.SimulatesSamples, simulator.SimulatesInte
             return self._run_sweep_sample(resolved_circuit, repetitions)
         return self._run_sweep_repeat(resolved_circuit, repetitions)
 
+    def _run_sweep(
+        self,
+        circuit: circuits.Circuit,
+        param_resolvers: Sequence[study.ParamResolver],
+        repetitions: int,
+    ) -> Iterator[Dict[str, np.ndarray]]:
+        """See definition in `cirq.SimulatesSamples`.
+
+        The leading moments of the circuit that contain no parameters and no
+        measurements are simulated once, including noise, and only the
+        remaining moments are resolved and simulated for each sweep point.
+        Noise is still applied moment by moment over all qubits of the circuit.
+        """
+        num_static = 0
+        for moment in circuit:
+            if any(protocols.is_parameterized(op) or protocols.is_measurement(op) for op in moment):
+                break
+            num_static += 1
+        if len(param_resolvers) < 2 or num_static == 0:
+            yield from super()._run_sweep(circuit, param_resolvers, repetitions)
+            return
+
+        qubits = sorted(circuit.all_qubits())
+        for step_result in self._base_iterator(
+            circuit=circuit[:num_static],
+            qubit_order=qubits,
+            initial_state=0,
+            noise_qubits=qubits,
+        ):
+            pass
+        prefix_state = step_result.density_matrix()
+
+        all_measurements_are_terminal = circuit.are_all_measurements_terminal()
+        for param_resolver in param_resolvers:
+            resolved_suffix = protocols.resolve_parameters(circuit[num_static:], param_resolver)
+            check_all_resolved(resolved_suffix)
+            if all_measurements_are_terminal:
+                yield self._run_sweep_sample(
+                    resolved_suffix, repetitions, qubits=qubits, initial_state=prefix_state
+                )
+            else:
+                yield self._run_sweep_repeat(
+                    resolved_suffix, repetitions, qubits=qubits, initial_state=prefix_state
+                )
+
     def _run_sweep_sample(
-        self, circuit: circuits.Circuit, repetitions: int
+        self,
+        circuit: circuits.Circuit,
+        repetitions: int,
+        qubits: Optional[List['cirq.Qid']] = None,
+        initial_state: Any = 0,
     ) -> Dict[str, np.ndarray]:
         for step_result in self._base_iterator(
             circuit=circuit,
-            qubit_order=ops.QubitOrder.DEFAULT,
-            initial_state=0,
+            qubit_order=ops.QubitOrder.DEFAULT if qubits is None else qubits,
+            initial_state=initial_state,
             all_measurements_are_terminal=True,
+            noise_qubits=qubits,
         ):
             pass
         measurement_ops = [
@@ -188,7 +284,11 @@ class DensityMatrixSimulator(simulator.SimulatesSamples, simulator.SimulatesInte
         return step_result.sample_measurement_ops(measurement_ops, repetitions, seed=self._prng)
 
     def _run_sweep_repeat(
-        self, circuit: circuits.Circuit, repetitions: int
+        self,
+        circuit: circuits.Circuit,
+        repetitions: int,
+        qubits: Optional[List['cirq.Qid']] = None,
+        initial_state: Any = 0,
     ) -> Dict[str, np.ndarray]:
         measurements = {}  # type: Dict[str, List[np.ndarray]]
         if repetitions == 0:
@@ -197,7 +297,11 @@ class DensityMatrixSimulator(simulator.SimulatesSamples, simulator.SimulatesInte
 
         for _ in range(repetitions):
             all_step_results = self._base_iterator(
-                circuit, qubit_order=ops.QubitOrder.DEFAULT, initial_state=0
+                circuit,
+                qubit_order=ops.QubitOrder.DEFAULT if qubits is None else qubits,
+                initial_state=initial_state,
+                noise_qubits=qubits,
+                recycle_state=True,
             )
             for step_result in all_step_results:
                 for k, v in step_result.measurements.items():
@@ -232,21 +336,53 @@ class DensityMatrixSimulator(simulator.SimulatesSamples, simulator.SimulatesInte
         qubit_order: ops.QubitOrderOrList,
         initial_state: Union[np.ndarray, 'cirq.STATE_VECTOR_LIKE'],
         all_measurements_are_terminal=False,
+        noise_qubits: Optional[Sequence['cirq.Qid']] = None,
+        recycle_state: bool = False,
     ) -> Iterator:
+        """Yields the step results of simulating a circuit.
+
+        If `recycle_state` is set, the caller promises not to keep references
+        to the density matrices of the step results, so that the final state
+        can be given back to the workspace pool along with the buffers.
+        """
         qubits = ops.QubitOrder.as_qubit_order(qubit_order).order_for(circuit.all_qubits())
         qid_shape = protocols.qid_shape(qubits)
         qubit_map = {q: i for i, q in enumerate(qubits)}
-        initial_matrix = qis.to_valid_density_matrix(
-            initial_state, len(qid_shape), qid_shape=qid_shape, dtype=self._dtype
-        )
-        if np.may_share_memory(initial_matrix, initial_state):
-            initial_matrix = initial_matrix.copy()
-        measured = collections.defaultdict(bool)  # type: Dict[Tuple[cirq.Qid, ...], bool]
-        if len(circuit) == 0:
-            yield DensityMatrixStepResult(initial_matrix, {}, qubit_map, self._dtype)
-            return
+        if self._workspaces is None or len(circuit) == 0:
+            initial_matrix = qis.to_valid_density_matrix(
+                initial_state, len(qid_shape), qid_shape=qid_shape, dtype=self._dtype
+            )
+            if np.may_share_memory(initial_matrix, initial_state):
+                initial_matrix = initial_matrix.copy()
+            if len(circuit) == 0:
+                yield DensityMatrixStepResult(initial_matrix, {}, qubit_map, self._dtype)
+                return
+            state = _StateAndBuffers(len(qid_shape), initial_matrix.reshape(qid_shape * 2))
+        else:
+            tensor = self._workspaces.take(qid_shape * 2, self._dtype)
+            _initialize_density_matrix(tensor, initial_state, qid_shape)
+            buffers = [self._workspaces.take(qid_shape * 2, self._dtype) for _ in range(3)]
+            state = _StateAndBuffers(len(qid_shape), tensor, buffers)
+        try:
+            yield from self._simulate_moments(
+                circuit, state, qid_shape, qubit_map, all_measurements_are_terminal, noise_qubits
+            )
+        finally:
+            if self._workspaces is not None:
+                self._workspaces.give(*state.buffers)
+                if recycle_state:
+                    self._workspaces.give(state.tensor)
 
-        state = _StateAndBuffers(len(qid_shape), initial_matrix.reshape(qid_shape * 2))
+    def _simulate_moments(
+        self,
+        circuit: circuits.Circuit,
+        state: _StateAndBuffers,
+        qid_shape: Tuple[int, ...],
+        qubit_map: Dict['cirq.Qid', int],
+        all_measurements_are_terminal: bool,
+        noise_qubits: Optional[Sequence['cirq.Qid']],
+    ) -> Iterator['DensityMatrixStepResult']:
+        measured = collections.defaultdict(bool)  # type: Dict[Tuple[cirq.Qid, ...], bool]
 
         def on_stuck(bad_op: ops.Operation):
             return TypeError(
@@ -260,7 +396,9 @@ class DensityMatrixSimulator(simulator.SimulatesSamples, simulator.SimulatesInte
                 potential_op.gate, ops.MeasurementGate
             )
 
-        noisy_moments = self.noise.noisy_moments(circuit, sorted(circuit.all_qubits()))
+        if noise_qubits is None:
+            noise_qubits = sorted(circuit.all_qubits())
+        noisy_moments = self.noise.noisy_moments(circuit, noise_qubits)
 
         for moment in noisy_moments:
             measurements = collections.defaultdict(list)  # type: Dict[str, List[int]]
@@ -1310,3 +1310,56 @@ def test_final_density_matrix_is_not_last_object():
     assert result.final_density_matrix is not initial_state
     assert not np.shares_memory(result.final_density_matrix, initial_state)
     np.testing.assert_equal(result.final_density_matrix, initial_state)
+
+
+@pytest.mark.parametrize('noise', [None, cirq.depolarize(0.1)])
+def test_run_sweep_reuses_parameter_independent_prefix(noise):
+    q0, q1 = cirq.LineQubit.range(2)
+    circuit = cirq.Circuit(
+        cirq.H(q0),
+        cirq.CNOT(q0, q1),
+        cirq.X(q0) ** sympy.Symbol('t'),
+        cirq.measure(q0, key='a'),
+        cirq.H(q1),
+        cirq.measure(q1, key='b'),
+    )
+    params = cirq.Linspace('t', 0, 1, 4)
+    sequential_simulator = cirq.DensityMatrixSimulator(noise=noise, seed=3)
+    expected = [
+        sequential_simulator.run(circuit, resolver, repetitions=20)
+        for resolver in cirq.to_resolvers(params)
+    ]
+
+    simulator = cirq.DensityMatrixSimulator(noise=noise, seed=3)
+    with mock.patch.object(simulator, '_base_iterator', wraps=simulator._base_iterator) as mock_sim:
+        results = simulator.run_sweep(circuit, params, repetitions=20)
+    assert results == expected
+    prefix = mock_sim.call_args_list[0][1]['circuit']
+    assert prefix == circuit[:2]
+
+
+def test_reuse_workspaces():
+    q0, q1 = cirq.LineQubit.range(2)
+    circuit = cirq.Circuit(cirq.H(q0), cirq.CNOT(q0, q1), cirq.depolarize(0.1).on(q1))
+    expected = cirq.DensityMatrixSimulator().simulate(circuit, initial_state=1)
+    with cirq.DensityMatrixSimulator(reuse_workspaces=True) as simulator:
+        for initial_state in [1, 1, np.diag([0, 1, 0, 0]).astype(np.complex64)]:
+            result = simulator.simulate(circuit, initial_state=initial_state)
+            np.testing.assert_allclose(
+                result.final_density_matrix, expected.final_density_matrix, atol=1e-6
+            )
+        assert simulator._workspaces.nbytes > 0
+    assert simulator._workspaces.nbytes == 0
+
+
+def test_reuse_workspaces_run_repeat():
+    q0 = cirq.LineQubit(0)
+    circuit = cirq.Circuit(cirq.X(q0), cirq.measure(q0, key='a'), cirq.X(q0))
+    circuit.append(cirq.measure(q0, key='b'))
+    simulator = cirq.DensityMatrixSimulator(reuse_workspaces=True)
+    for _ in range(2):
+        result = simulator.run(circuit, repetitions=5)
+        np.testing.assert_equal(result.measurements['a'], [[1]] * 5)
+        np.testing.assert_equal(result.measurements['b'], [[0]] * 5)
+    # The state and all three buffers are kept for reuse.
+    assert simulator._workspaces.nbytes == 4 * 4 * np.dtype(np.complex64).itemsize
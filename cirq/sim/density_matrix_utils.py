@@ -19,6 +19,7 @@ import numpy as np
 
 from cirq import linalg, qis, value
 from cirq._compat import deprecated
+from cirq.sim import state_vector
 
 if TYPE_CHECKING:
     import cirq
@@ -95,10 +96,7 @@ def sample_density_matrix(
     # choosing from a list of tuples or list of lists.
     result = prng.choice(len(probs), size=repetitions, p=probs)
     # Convert to individual qudit measurements.
-    return np.array(
-        [value.big_endian_int_to_digits(result[i], base=meas_shape) for i in range(len(result))],
-        dtype=np.int8,
-    )
+    return np.stack(np.unravel_index(result, meas_shape), axis=-1).astype(np.int8)
 
 
 def measure_density_matrix(
@@ -205,31 +203,7 @@ def _probs(
     all_probs = np.diagonal(np.reshape(density_matrix, (np.prod(qid_shape, dtype=int),) * 2))
     # Shape into a tensor
     tensor = np.reshape(all_probs, qid_shape)
-
-    # Calculate the probabilities for measuring the particular results.
-    if len(indices) == len(qid_shape):
-        # We're measuring every qudit, so no need for fancy indexing
-        probs = np.abs(tensor)
-        probs = np.transpose(probs, indices)
-        probs = np.reshape(probs, np.prod(probs.shape))
-    else:
-        # Fancy indexing required
-        meas_shape = tuple(qid_shape[i] for i in indices)
-        probs = np.abs(
-            [
-                tensor[
-                    linalg.slice_for_qubits_equal_to(
-                        indices, big_endian_qureg_value=b, qid_shape=qid_shape
-                    )
-                ]
-                for b in range(np.prod(meas_shape, dtype=int))
-            ]
-        )
-        probs = np.sum(probs, axis=tuple(range(1, len(probs.shape))))
-
-    # To deal with rounding issues, ensure that the probabilities sum to 1.
-    probs /= np.sum(probs)
-    return probs
+    return state_vector._marginalize(np.abs(tensor), indices)
 
 
 def _validate_density_matrix_qid_shape(
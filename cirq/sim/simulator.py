@@ -29,6 +29,7 @@ Simulator types include:
 
 from typing import (
     Any,
+    Callable,
     Dict,
     Iterator,
     List,
@@ -85,10 +86,11 @@ class SimulatesSamples(work.Sampler, metaclass=abc.ABCMeta):
         _verify_unique_measurement_keys(program)
 
         trial_results = []  # type: List[study.Result]
-        for param_resolver in study.to_resolvers(params):
-            measurements = self._run(
-                circuit=program, param_resolver=param_resolver, repetitions=repetitions
-            )
+        resolvers = list(study.to_resolvers(params))
+        all_measurements = self._run_sweep(
+            circuit=program, param_resolvers=resolvers, repetitions=repetitions
+        )
+        for param_resolver, measurements in zip(resolvers, all_measurements):
             trial_results.append(
                 study.Result.from_single_parameter_set(
                     params=param_resolver, measurements=measurements
@@ -96,6 +98,30 @@ class SimulatesSamples(work.Sampler, metaclass=abc.ABCMeta):
             )
         return trial_results
 
+    def _run_sweep(
+        self,
+        circuit: circuits.Circuit,
+        param_resolvers: Sequence[study.ParamResolver],
+        repetitions: int,
+    ) -> Iterator[Dict[str, np.ndarray]]:
+        """Runs a simulation for each of several parameter resolvers.
+
+        The default implementation calls `_run` once per resolver. Simulators
+        can override this method to share work between sweep points, e.g. by
+        simulating the parameter-independent part of the circuit only once.
+
+        Args:
+            circuit: The circuit to simulate.
+            param_resolvers: Parameters to run with the program, in order.
+            repetitions: Number of times to repeat each run.
+
+        Yields:
+            The measurement results for each resolver, in the format returned
+            by `_run`.
+        """
+        for param_resolver in param_resolvers:
+            yield self._run(circuit=circuit, param_resolver=param_resolver, repetitions=repetitions)
+
     @abc.abstractmethod
     def _run(
         self, circuit: circuits.Circuit, param_resolver: study.ParamResolver, repetitions: int
@@ -748,6 +774,50 @@ def _verify_unique_measurement_keys(circuit: circuits.Circuit):
             raise ValueError('Measurement key {} repeated'.format(",".join(duplicates)))
 
 
+def split_into_static_then_parameterized(
+    circuit: 'cirq.Circuit', is_static: Callable[['cirq.Operation'], bool]
+) -> Tuple['cirq.Circuit', 'cirq.Circuit']:
+    """Splits a circuit into a parameter-independent prefix and a suffix.
+
+    The splitting happens in a per-qubit fashion, like
+    `_split_into_unitary_then_general` in the sparse simulator. An operation
+    that is parameterized, or that fails `is_static`, on qubit A causes later
+    operations on A to be part of the suffix, but later operations on other
+    qubits will continue to be put into the prefix (as long as those qubits
+    have been untouched by the suffix up to that point).
+
+    Args:
+        circuit: The circuit to split.
+        is_static: Additional predicate that operations in the prefix must
+            satisfy, for example being unitary.
+
+    Returns:
+        A tuple of the prefix and the suffix. The prefix has no parameters.
+    """
+    blocked_qubits: Set['cirq.Qid'] = set()
+    prefix = circuits.Circuit()
+    suffix = circuits.Circuit()
+    for moment in circuit:
+        prefix_part = []
+        suffix_part = []
+        for op in moment:
+            qs = set(op.qubits)
+            if (
+                protocols.is_parameterized(op)
+                or not is_static(op)
+                or not qs.isdisjoint(blocked_qubits)
+            ):
+                blocked_qubits |= qs
+                suffix_part.append(op)
+            else:
+                prefix_part.append(op)
+        if prefix_part:
+            prefix.append(ops.Moment(prefix_part))
+        if suffix_part:
+            suffix.append(ops.Moment(suffix_part))
+    return prefix, suffix
+
+
 def check_all_resolved(circuit):
     """Raises if the circuit contains unresolved symbols."""
     if protocols.is_parameterized(circuit):
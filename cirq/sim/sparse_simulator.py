@@ -15,11 +15,14 @@
 """A simulator that uses numpy's einsum for sparse matrix operations."""
 
 import collections
+import tempfile
 from typing import (
     Any,
     Dict,
     Iterator,
     List,
+    Optional,
+    Sequence,
     Type,
     TYPE_CHECKING,
     DefaultDict,
@@ -37,6 +40,8 @@ from cirq.sim import (
     state_vector,
     state_vector_simulator,
     act_on_state_vector_args,
+    trajectory_batch,
+    workspace_pool,
 )
 from cirq.sim.simulator import check_all_resolved
 
@@ -140,7 +145,21 @@ class Simulator(
     the floating-point type used); the closest analogy on hardware requires
     estimating the expectation values from several samples.
 
+    When sampling via the run methods, the simulator can optionally fuse
+    neighboring unitary operations into dense matrices acting on at most
+    `max_fused_qubits` qubits before simulating the unitary prefix of the
+    circuit. This trades many small tensor contractions for a few larger ones,
+    which is typically much faster for deep circuits on many qubits. The
+    circuit supplied by the user is never modified.
+
     See `Simulator` for the definitions of the supported methods.
+
+    With `memmap_dir`, the state vector and its scratch buffer are placed in
+    `numpy.memmap` files under the given directory. Gates are then applied in
+    chunks over the high-order qubits they do not act on, so that only a slice
+    of each file needs to be resident at a time. Only `simulate` and
+    `simulate_moment_steps` keep the state out of core: `run` and measurement
+    sampling still read the whole state vector into memory.
     """
 
     def __init__(
@@ -148,6 +167,9 @@ class Simulator(
         *,
         dtype: Type[np.number] = np.complex64,
         seed: 'cirq.RANDOM_STATE_OR_SEED_LIKE' = None,
+        max_fused_qubits: Optional[int] = None,
+        reuse_workspaces: bool = False,
+        memmap_dir: Optional[str] = None,
     ):
         """A sparse matrix simulator.
 
@@ -155,11 +177,45 @@ class Simulator(
             dtype: The `numpy.dtype` used by the simulation. One of
                 `numpy.complex64` or `numpy.complex128`.
             seed: The random seed to use for this simulator.
+            max_fused_qubits: If set, adjacent unitary operations in the
+                unitary prefix of sampled circuits are merged into dense
+                matrix gates acting on at most this many qubits before
+                simulation. Defaults to None, which disables gate fusion.
+            reuse_workspaces: If set, the state vectors and scratch buffers of
+                finished simulations are kept and reused by later simulations
+                on the same qid shape, instead of being reallocated. Call
+                `close` (or use the simulator as a context manager) to release
+                them.
+            memmap_dir: If set, state vectors and scratch buffers are backed
+                by anonymous temporary files in this directory instead of
+                memory. The files are deleted once the arrays are no longer
+                referenced. This applies to `simulate` and
+                `simulate_moment_steps`; `run` and measurements still load the
+                full state into memory. Takes precedence over
+                `reuse_workspaces`.
         """
         if np.dtype(dtype).kind != 'c':
             raise ValueError('dtype must be a complex type but was {}'.format(dtype))
+        if max_fused_qubits is not None and max_fused_qubits < 1:
+            raise ValueError(
+                'max_fused_qubits must be a positive integer but was {}'.format(max_fused_qubits)
+            )
         self._dtype = dtype
         self._prng = value.parse_random_state(seed)
+        self._max_fused_qubits = max_fused_qubits
+        self._workspaces = workspace_pool.WorkspacePool() if reuse_workspaces else None
+        self._memmap_dir = memmap_dir
+
+    def close(self) -> None:
+        """Releases the workspaces kept for reuse, if any."""
+        if self._workspaces is not None:
+            self._workspaces.clear()
+
+    def __enter__(self) -> 'Simulator':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
 
     def _run(
         self, circuit: circuits.Circuit, param_resolver: study.ParamResolver, repetitions: int
@@ -169,38 +225,97 @@ class Simulator(
         resolved_circuit = protocols.resolve_parameters(circuit, param_resolver)
         check_all_resolved(resolved_circuit)
         qubit_order = sorted(resolved_circuit.all_qubits())
+        return self._run_from_state(
+            resolved_circuit, qubit_order=qubit_order, initial_state=0, repetitions=repetitions
+        )
 
+    def _run_sweep(
+        self,
+        circuit: circuits.Circuit,
+        param_resolvers: Sequence[study.ParamResolver],
+        repetitions: int,
+    ) -> Iterator[Dict[str, np.ndarray]]:
+        """See definition in `cirq.SimulatesSamples`.
+
+        The longest parameter-independent unitary prefix of the circuit is
+        simulated once, and only the remaining suffix is resolved and simulated
+        for each sweep point.
+        """
+        static_prefix, parameterized_suffix = simulator.split_into_static_then_parameterized(
+            circuit, protocols.has_unitary
+        )
+        if len(param_resolvers) < 2 or not len(static_prefix):
+            yield from super()._run_sweep(circuit, param_resolvers, repetitions)
+            return
+
+        qubit_order = sorted(circuit.all_qubits())
+        if self._max_fused_qubits is not None:
+            static_prefix = _fuse_unitary_operations(static_prefix, self._max_fused_qubits)
+        step_result = None
+        for step_result in self._base_iterator(
+            circuit=static_prefix, qubit_order=qubit_order, initial_state=0
+        ):
+            pass
+        assert step_result is not None
+        prefix_state = step_result.state_vector()
+
+        for param_resolver in param_resolvers:
+            resolved_suffix = protocols.resolve_parameters(parameterized_suffix, param_resolver)
+            check_all_resolved(resolved_suffix)
+            yield self._run_from_state(
+                resolved_suffix,
+                qubit_order=qubit_order,
+                initial_state=prefix_state,
+                repetitions=repetitions,
+            )
+
+    def _run_from_state(
+        self,
+        circuit: circuits.Circuit,
+        qubit_order: List['cirq.Qid'],
+        initial_state: 'cirq.STATE_VECTOR_LIKE',
+        repetitions: int,
+    ) -> Dict[str, np.ndarray]:
+        """Samples a resolved circuit starting from the given state."""
         # Simulate as many unitary operations as possible before having to
         # repeat work for each sample.
-        unitary_prefix, general_suffix = _split_into_unitary_then_general(resolved_circuit)
+        unitary_prefix, general_suffix = _split_into_unitary_then_general(circuit)
+        if self._max_fused_qubits is not None:
+            unitary_prefix = _fuse_unitary_operations(unitary_prefix, self._max_fused_qubits)
         step_result = None
         for step_result in self._base_iterator(
             circuit=unitary_prefix,
             qubit_order=qubit_order,
-            initial_state=0,
+            initial_state=initial_state,
             perform_measurements=False,
         ):
             pass
         assert step_result is not None
 
-        # When an otherwise unitary circuit ends with non-demolition computation
-        # basis measurements, we can sample the results more efficiently.
-        general_ops = list(general_suffix.all_operations())
-        if all(isinstance(op.gate, ops.MeasurementGate) for op in general_ops):
-            return step_result.sample_measurement_ops(
-                measurement_ops=cast(List[ops.GateOperation], general_ops),
+        try:
+            # When an otherwise unitary circuit ends with non-demolition
+            # computation basis measurements, we can sample the results more
+            # efficiently.
+            general_ops = list(general_suffix.all_operations())
+            if all(isinstance(op.gate, ops.MeasurementGate) for op in general_ops):
+                return step_result.sample_measurement_ops(
+                    measurement_ops=cast(List[ops.GateOperation], general_ops),
+                    repetitions=repetitions,
+                    seed=self._prng,
+                )
+
+            qid_shape = protocols.qid_shape(qubit_order)
+            intermediate_state = step_result.state_vector().reshape(qid_shape)
+            return self._brute_force_samples(
+                initial_state=intermediate_state,
+                circuit=general_suffix,
                 repetitions=repetitions,
-                seed=self._prng,
+                qubit_order=qubit_order,
             )
-
-        qid_shape = protocols.qid_shape(qubit_order)
-        intermediate_state = step_result.state_vector().reshape(qid_shape)
-        return self._brute_force_samples(
-            initial_state=intermediate_state,
-            circuit=general_suffix,
-            repetitions=repetitions,
-            qubit_order=qubit_order,
-        )
+        finally:
+            # Nothing returned by run references the state of the prefix.
+            if self._workspaces is not None and self._memmap_dir is None:
+                self._workspaces.give(step_result._state_vector.base)
 
     def _brute_force_samples(
         self,
@@ -209,14 +324,28 @@ class Simulator(
         qubit_order: 'cirq.QubitOrderOrList',
         repetitions: int,
     ) -> Dict[str, np.ndarray]:
-        """Repeatedly simulate a circuit in order to produce samples."""
+        """Repeatedly simulate a circuit in order to produce samples.
+
+        When every operation in the circuit is a measurement, unitary, mixture
+        or channel, the repetitions are simulated together as a stack of
+        trajectories. Otherwise the circuit is simulated once per repetition.
+        """
         if repetitions == 0:
             return {key: np.empty(shape=[0, 1]) for key in protocols.measurement_keys(circuit)}
 
+        if trajectory_batch.can_simulate_in_batches(circuit):
+            return trajectory_batch.simulate_trajectory_batches(
+                circuit=circuit,
+                qubits=ops.QubitOrder.as_qubit_order(qubit_order).order_for(circuit.all_qubits()),
+                initial_state=initial_state,
+                repetitions=repetitions,
+                prng=self._prng,
+            )
+
         measurements: DefaultDict[str, List[np.ndarray]] = collections.defaultdict(list)
         for _ in range(repetitions):
             all_step_results = self._base_iterator(
-                circuit, initial_state=initial_state, qubit_order=qubit_order
+                circuit, initial_state=initial_state, qubit_order=qubit_order, recycle_state=True
             )
 
             for step_result in all_step_results:
@@ -230,38 +359,66 @@ class Simulator(
         qubit_order: ops.QubitOrderOrList,
         initial_state: 'cirq.STATE_VECTOR_LIKE',
         perform_measurements: bool = True,
+        recycle_state: bool = False,
     ) -> Iterator['SparseSimulatorStep']:
+        """Yields the step results of simulating a circuit.
+
+        If `recycle_state` is set, the caller promises not to keep references
+        to the state vectors of the step results, so that the final state can
+        be given back to the workspace pool along with the scratch buffer.
+        """
         qubits = ops.QubitOrder.as_qubit_order(qubit_order).order_for(circuit.all_qubits())
         num_qubits = len(qubits)
         qid_shape = protocols.qid_shape(qubits)
         qubit_map = {q: i for i, q in enumerate(qubits)}
-        state = qis.to_valid_state_vector(
-            initial_state, num_qubits, qid_shape=qid_shape, dtype=self._dtype
-        )
+        if self._memmap_dir is not None:
+            state = _empty_memmap(qid_shape, self._dtype, self._memmap_dir)
+            _initialize_state_vector(state, initial_state, qid_shape)
+            buffer = _empty_memmap(qid_shape, self._dtype, self._memmap_dir)
+        elif self._workspaces is None:
+            state = np.reshape(
+                qis.to_valid_state_vector(
+                    initial_state, num_qubits, qid_shape=qid_shape, dtype=self._dtype
+                ),
+                qid_shape,
+            )
+            buffer = np.empty(qid_shape, dtype=self._dtype)
+        else:
+            state = self._workspaces.take(qid_shape, self._dtype)
+            _initialize_state_vector(state, initial_state, qid_shape)
+            buffer = self._workspaces.take(qid_shape, self._dtype)
         if len(circuit) == 0:
-            yield SparseSimulatorStep(state, {}, qubit_map, self._dtype)
+            yield SparseSimulatorStep(state.reshape(-1), {}, qubit_map, self._dtype)
 
         sim_state = act_on_state_vector_args.ActOnStateVectorArgs(
-            target_tensor=np.reshape(state, qid_shape),
-            available_buffer=np.empty(qid_shape, dtype=self._dtype),
+            target_tensor=state,
+            available_buffer=buffer,
             axes=[],
             prng=self._prng,
             log_of_measurement_results={},
         )
 
-        for moment in circuit:
-            for op in moment:
-                if perform_measurements or not isinstance(op.gate, ops.MeasurementGate):
-                    sim_state.axes = tuple(qubit_map[qubit] for qubit in op.qubits)
-                    protocols.act_on(op, sim_state)
-
-            yield SparseSimulatorStep(
-                state_vector=sim_state.target_tensor,
-                measurements=dict(sim_state.log_of_measurement_results),
-                qubit_map=qubit_map,
-                dtype=self._dtype,
-            )
-            sim_state.log_of_measurement_results.clear()
+        try:
+            for moment in circuit:
+                for op in moment:
+                    if perform_measurements or not isinstance(op.gate, ops.MeasurementGate):
+                        sim_state.axes = tuple(qubit_map[qubit] for qubit in op.qubits)
+                        protocols.act_on(op, sim_state)
+
+                yield SparseSimulatorStep(
+                    state_vector=sim_state.target_tensor,
+                    measurements=dict(sim_state.log_of_measurement_results),
+                    qubit_map=qubit_map,
+                    dtype=self._dtype,
+                )
+                sim_state.log_of_measurement_results.clear()
+        finally:
+            # The state may still be referenced by step results, but the
+            # scratch buffer is not.
+            if self._workspaces is not None:
+                self._workspaces.give(sim_state.available_buffer)
+                if recycle_state:
+                    self._workspaces.give(sim_state.target_tensor)
 
     def simulate_expectation_values_sweep(
         self,
@@ -415,3 +572,95 @@ def _split_into_unitary_then_general(
         if general_part:
             general_suffix.append(ops.Moment(general_part))
     return unitary_prefix, general_suffix
+
+
+def _initialize_state_vector(
+    out: np.ndarray, initial_state: 'cirq.STATE_VECTOR_LIKE', qid_shape: Tuple[int, ...]
+) -> None:
+    """Writes a valid state vector into a `qid_shape` shaped array."""
+    if isinstance(initial_state, (int, np.integer)) and 0 <= initial_state < out.size:
+        out.fill(0)
+        out.reshape(-1)[initial_state] = 1
+    else:
+        state = qis.to_valid_state_vector(
+            initial_state, len(qid_shape), qid_shape=qid_shape, dtype=out.dtype
+        )
+        np.copyto(out, np.reshape(state, qid_shape))
+
+
+def _empty_memmap(shape: Tuple[int, ...], dtype: Type[np.number], directory: str) -> np.memmap:
+    """Returns an uninitialized array backed by an unnamed temporary file."""
+    with tempfile.TemporaryFile(dir=directory) as f:
+        return np.memmap(f, dtype=dtype, mode='w+', shape=shape)
+
+
+class _FusedBlock:
+    """A group of unitary operations that will be applied as a single matrix."""
+
+    def __init__(self, fusable: bool) -> None:
+        self.fusable = fusable
+        self.qubits: Set['cirq.Qid'] = set()
+        self.operations: List['cirq.Operation'] = []
+
+    def add(self, op: 'cirq.Operation') -> None:
+        self.qubits.update(op.qubits)
+        self.operations.append(op)
+
+    def to_operation(self) -> 'cirq.Operation':
+        if len(self.operations) == 1:
+            return self.operations[0]
+        qubits = sorted(self.qubits)
+        matrix = circuits.Circuit(self.operations).unitary(qubit_order=qubits)
+        return ops.MatrixGate(matrix, qid_shape=protocols.qid_shape(qubits)).on(*qubits)
+
+
+def _fuse_unitary_operations(circuit: 'cirq.Circuit', max_fused_qubits: int) -> 'cirq.Circuit':
+    """Greedily merges neighboring unitary operations into dense matrix gates.
+
+    Operations are visited in moment order. An operation joins the most recent
+    blocks on each of its qubits whenever every one of those blocks is still
+    the latest block on all of the qubits it touches (so merging them does not
+    reorder any operations) and the merged block acts on at most
+    `max_fused_qubits` qubits. Operations without a unitary, or acting on more
+    than `max_fused_qubits` qubits, are never merged.
+
+    Args:
+        circuit: The circuit to fuse. It is not modified.
+        max_fused_qubits: The largest number of qubits a fused block may act
+            on.
+
+    Returns:
+        A new circuit with the same unitary effect as `circuit`, in which each
+        block of merged operations is replaced by a single `cirq.MatrixGate`.
+    """
+    # Insertion-ordered dict of live blocks, keyed by id. A block that absorbs
+    # new operations is moved to the end, which is valid because it is the
+    # latest block on all of its qubits.
+    blocks: Dict[int, _FusedBlock] = {}
+    latest: Dict['cirq.Qid', _FusedBlock] = {}
+
+    for op in circuit.all_operations():
+        fusable = len(op.qubits) <= max_fused_qubits and protocols.has_unitary(op)
+        block = None
+        if fusable:
+            candidates = {id(latest[q]): latest[q] for q in op.qubits if q in latest}
+            merged_qubits = set(op.qubits)
+            for candidate in candidates.values():
+                merged_qubits |= candidate.qubits
+            if len(merged_qubits) <= max_fused_qubits and all(
+                candidate.fusable and all(latest[q] is candidate for q in candidate.qubits)
+                for candidate in candidates.values()
+            ):
+                block = _FusedBlock(fusable=True)
+                for key, candidate in candidates.items():
+                    for merged_op in candidate.operations:
+                        block.add(merged_op)
+                    del blocks[key]
+        if block is None:
+            block = _FusedBlock(fusable=fusable)
+        block.add(op)
+        blocks[id(block)] = block
+        for q in block.qubits:
+            latest[q] = block
+
+    return circuits.Circuit(block.to_operation() for block in blocks.values())
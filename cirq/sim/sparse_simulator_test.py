@@ -144,8 +144,9 @@ def test_run_invert_mask_measure_not_terminal(dtype):
                 result = simulator.run(circuit, repetitions=3)
                 np.testing.assert_equal(result.measurements, {'m': [[1 - b0, b1]] * 3})
                 assert result.repetitions == 3
-        # We expect repeated calls per b0,b1 instead of one call.
-        assert mock_sim.call_count > 4
+        # Repetitions after a non-terminal measurement are simulated as a batch
+        # of trajectories, so we still expect one call per b0,b1.
+        assert mock_sim.call_count == 4
 
 
 @pytest.mark.parametrize('dtype', [np.complex64, np.complex128])
@@ -164,8 +165,9 @@ def test_run_partial_invert_mask_measure_not_terminal(dtype):
                 result = simulator.run(circuit, repetitions=3)
                 np.testing.assert_equal(result.measurements, {'m': [[1 - b0, b1]] * 3})
                 assert result.repetitions == 3
-        # We expect repeated calls per b0,b1 instead of one call.
-        assert mock_sim.call_count > 4
+        # Repetitions after a non-terminal measurement are simulated as a batch
+        # of trajectories, so we still expect one call per b0,b1.
+        assert mock_sim.call_count == 4
 
 
 @pytest.mark.parametrize('dtype', [np.complex64, np.complex128])
@@ -210,8 +212,9 @@ def test_run_repetitions_measurement_not_terminal(dtype):
                 result = simulator.run(circuit, repetitions=3)
                 np.testing.assert_equal(result.measurements, {'0': [[b0]] * 3, '1': [[b1]] * 3})
                 assert result.repetitions == 3
-        # We expect repeated calls per b0,b1 instead of one call.
-        assert mock_sim.call_count > 4
+        # Repetitions after a non-terminal measurement are simulated as a batch
+        # of trajectories, so we still expect one call per b0,b1.
+        assert mock_sim.call_count == 4
 
 
 @pytest.mark.parametrize('dtype', [np.complex64, np.complex128])
@@ -1010,68 +1013,68 @@ def test_random_seed_non_terminal_measurements_deterministic():
     assert np.all(
         result.measurements['a']
         == [
-            [0],
             [0],
             [1],
             [0],
             [1],
-            [0],
             [1],
             [0],
+            [0],
             [1],
             [1],
-            [0],
-            [0],
             [1],
             [0],
-            [0],
             [1],
             [1],
             [1],
             [0],
+            [1],
+            [1],
             [0],
-            [0],
-            [0],
+            [1],
             [1],
             [0],
+            [1],
             [0],
             [0],
             [1],
             [1],
+            [0],
             [1],
+            [0],
             [1],
         ]
     )
     assert np.all(
         result.measurements['b']
         == [
-            [1],
             [1],
             [0],
             [1],
-            [1],
-            [1],
+            [0],
             [1],
             [1],
             [0],
             [1],
+            [0],
             [1],
             [0],
+            [0],
+            [0],
             [1],
             [1],
             [1],
             [0],
-            [0],
-            [1],
             [1],
+            [0],
             [1],
             [0],
             [1],
             [1],
+            [0],
             [1],
             [1],
             [1],
-            [0],
             [1],
             [1],
             [1],
@@ -1096,34 +1099,34 @@ def test_random_seed_mixture_deterministic():
         == [
             [1],
             [0],
-            [0],
-            [0],
             [1],
-            [0],
-            [0],
             [1],
             [1],
             [1],
             [1],
             [1],
             [0],
-            [1],
             [0],
             [0],
             [0],
             [0],
             [0],
-            [1],
+            [0],
+            [0],
+            [0],
             [0],
             [1],
             [1],
             [0],
+            [0],
+            [0],
             [1],
             [1],
+            [0],
+            [0],
+            [0],
             [1],
             [1],
-            [1],
-            [0],
         ]
     )
 
@@ -1227,3 +1230,147 @@ def test_final_state_vector_is_not_last_object():
     assert result.state_vector() is not initial_state
     assert not np.shares_memory(result.state_vector(), initial_state)
     np.testing.assert_equal(result.state_vector(), initial_state)
+
+
+def test_invalid_max_fused_qubits():
+    with pytest.raises(ValueError, match='max_fused_qubits'):
+        cirq.Simulator(max_fused_qubits=0)
+
+
+@pytest.mark.parametrize('max_fused_qubits', [1, 2, 3])
+def test_run_with_gate_fusion_matches_unfused(max_fused_qubits):
+    qubits = cirq.LineQubit.range(4)
+    circuit = cirq.testing.random_circuit(qubits, n_moments=20, op_density=0.8, random_state=1)
+    circuit.append(cirq.measure(*qubits, key='m'))
+    original = circuit.copy()
+
+    fused = cirq.Simulator(seed=1234, max_fused_qubits=max_fused_qubits)
+    unfused = cirq.Simulator(seed=1234)
+    np.testing.assert_equal(
+        fused.run(circuit, repetitions=100).measurements['m'],
+        unfused.run(circuit, repetitions=100).measurements['m'],
+    )
+    assert circuit == original
+
+
+@pytest.mark.parametrize('max_fused_qubits', [1, 2, 3])
+def test_fuse_unitary_operations_preserves_unitary(max_fused_qubits):
+    qubits = cirq.LineQubit.range(5)
+    circuit = cirq.testing.random_circuit(qubits, n_moments=15, op_density=0.9, random_state=7)
+    fused = cirq.sim.sparse_simulator._fuse_unitary_operations(circuit, max_fused_qubits)
+    assert len(list(fused.all_operations())) <= len(list(circuit.all_operations()))
+    for op in fused.all_operations():
+        assert len(op.qubits) <= max(max_fused_qubits, 3)
+    cirq.testing.assert_allclose_up_to_global_phase(
+        fused.unitary(qubit_order=qubits), circuit.unitary(qubit_order=qubits), atol=1e-8
+    )
+
+
+def test_fuse_unitary_operations_keeps_non_unitary_operations_in_place():
+    q0, q1 = cirq.LineQubit.range(2)
+    circuit = cirq.Circuit(
+        cirq.H(q0), cirq.X(q0), cirq.reset(q0), cirq.Y(q0), cirq.Z(q0), cirq.CNOT(q0, q1)
+    )
+    fused = cirq.sim.sparse_simulator._fuse_unitary_operations(circuit, 2)
+    fused_ops = list(fused.all_operations())
+    assert len(fused_ops) == 3
+    assert fused_ops[1] == cirq.reset(q0)
+    assert isinstance(fused_ops[0].gate, cirq.MatrixGate)
+    np.testing.assert_allclose(
+        cirq.unitary(fused_ops[0]), cirq.unitary(cirq.X) @ cirq.unitary(cirq.H)
+    )
+    assert fused_ops[2].qubits == (q0, q1)
+
+
+def test_run_sweep_reuses_parameter_independent_prefix():
+    q0, q1 = cirq.LineQubit.range(2)
+    circuit = cirq.Circuit(
+        cirq.H(q0),
+        cirq.CNOT(q0, q1),
+        cirq.Y(q1) ** 0.25,
+        cirq.X(q0) ** sympy.Symbol('t'),
+        cirq.measure(q0, q1, key='m'),
+    )
+    params = cirq.Linspace('t', 0, 1, 5)
+    sequential_simulator = cirq.Simulator(seed=7)
+    expected = [
+        sequential_simulator.run(circuit, resolver, repetitions=50)
+        for resolver in cirq.to_resolvers(params)
+    ]
+
+    simulator = cirq.Simulator(seed=7)
+    with mock.patch.object(simulator, '_base_iterator', wraps=simulator._base_iterator) as mock_sim:
+        results = simulator.run_sweep(circuit, params, repetitions=50)
+    assert results == expected
+    # One call for the shared prefix, then one call per sweep point.
+    assert mock_sim.call_count == 6
+    prefix = mock_sim.call_args_list[0][1]['circuit']
+    assert not cirq.is_parameterized(prefix)
+    assert len(list(prefix.all_operations())) == 3
+
+
+def test_run_sweep_prefix_with_non_terminal_measurements():
+    q0, q1 = cirq.LineQubit.range(2)
+    circuit = cirq.Circuit(
+        cirq.X(q1),
+        cirq.measure(q1, key='a'),
+        cirq.X(q0) ** sympy.Symbol('t'),
+        cirq.measure(q0, q1, key='b'),
+    )
+    results = cirq.Simulator().run_sweep(circuit, cirq.Points('t', [0, 1]), repetitions=3)
+    np.testing.assert_equal(results[0].measurements['a'], [[1]] * 3)
+    np.testing.assert_equal(results[0].measurements['b'], [[0, 1]] * 3)
+    np.testing.assert_equal(results[1].measurements['b'], [[1, 1]] * 3)
+
+
+def test_reuse_workspaces():
+    q0, q1 = cirq.LineQubit.range(2)
+    circuit = cirq.Circuit(cirq.H(q0), cirq.CNOT(q0, q1), cirq.X(q1) ** 0.5)
+    expected = cirq.Simulator().simulate(circuit, initial_state=2).final_state_vector
+    with cirq.Simulator(reuse_workspaces=True) as simulator:
+        for initial_state in [2, 2, np.array([0, 0, 1, 0], dtype=np.complex64)]:
+            result = simulator.simulate(circuit, initial_state=initial_state)
+            np.testing.assert_allclose(result.final_state_vector, expected, atol=1e-6)
+        assert simulator._workspaces.nbytes > 0
+        measured = circuit + cirq.Circuit(cirq.measure(q0, q1, key='m'))
+        assert simulator.run(measured, repetitions=3).measurements['m'].shape == (3, 2)
+    assert simulator._workspaces.nbytes == 0
+
+    with pytest.raises(ValueError):
+        cirq.Simulator(reuse_workspaces=True).simulate(circuit, initial_state=4)
+
+
+def test_reuse_workspaces_recycles_run_states():
+    q0, q1 = cirq.LineQubit.range(2)
+    circuit = cirq.Circuit(cirq.H(q0), cirq.CNOT(q0, q1), cirq.measure(q0, q1, key='m'))
+    simulator = cirq.Simulator(reuse_workspaces=True)
+    for _ in range(3):
+        measurements = simulator.run(circuit, repetitions=5).measurements['m']
+        assert np.all(measurements[:, 0] == measurements[:, 1])
+        # Only the state vector and the scratch buffer of one run are pooled.
+        assert simulator._workspaces.nbytes == 2 * 4 * np.dtype(np.complex64).itemsize
+    noisy = cirq.Circuit(cirq.X(q0), cirq.measure(q0, key='a'), cirq.X(q0), cirq.measure(q0))
+    for _ in range(2):
+        assert simulator.run(noisy, repetitions=2).measurements['a'].tolist() == [[1], [1]]
+
+
+def test_reuse_workspaces_keeps_final_states():
+    q0 = cirq.LineQubit(0)
+    simulator = cirq.Simulator(reuse_workspaces=True)
+    result0 = simulator.simulate(cirq.Circuit(cirq.X(q0)))
+    result1 = simulator.simulate(cirq.Circuit(cirq.H(q0)))
+    np.testing.assert_allclose(result0.final_state_vector, [0, 1])
+    np.testing.assert_allclose(result1.final_state_vector, np.array([1, 1]) / np.sqrt(2))
+
+
+def test_memmap_dir(tmp_path):
+    q0, q1 = cirq.LineQubit.range(2)
+    circuit = cirq.Circuit(cirq.H(q0), cirq.CNOT(q0, q1), cirq.X(q1) ** 0.5)
+    expected = cirq.Simulator().simulate(circuit, initial_state=1).final_state_vector
+    simulator = cirq.Simulator(memmap_dir=str(tmp_path))
+    result = simulator.simulate(circuit, initial_state=1)
+    assert isinstance(result._final_simulator_state.state_vector, np.memmap)
+    np.testing.assert_allclose(result.final_state_vector, expected, atol=1e-6)
+    measured = circuit + cirq.Circuit(cirq.measure(q0, q1, key='m'))
+    assert simulator.run(measured, repetitions=3).measurements['m'].shape == (3, 2)
+    assert list(tmp_path.iterdir()) == []
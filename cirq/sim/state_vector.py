@@ -253,10 +253,7 @@ def sample_state_vector(
     result = prng.choice(len(probs), size=repetitions, p=probs)
     # Convert to individual qudit measurements.
     meas_shape = tuple(shape[i] for i in indices)
-    return np.array(
-        [value.big_endian_int_to_digits(result[i], base=meas_shape) for i in range(len(result))],
-        dtype=np.uint8,
-    )
+    return np.stack(np.unravel_index(result, meas_shape), axis=-1).astype(np.uint8)
 
 
 @deprecated_parameter(
@@ -363,30 +360,21 @@ def measure_state_vector(
 
 def _probs(state: np.ndarray, indices: Sequence[int], qid_shape: Tuple[int, ...]) -> np.ndarray:
     """Returns the probabilities for a measurement on the given indices."""
-    tensor = np.reshape(state, qid_shape)
-    # Calculate the probabilities for measuring the particular results.
-    if len(indices) == len(qid_shape):
-        # We're measuring every qudit, so no need for fancy indexing
-        probs = np.abs(tensor) ** 2
-        probs = np.transpose(probs, indices)
-        probs = np.reshape(probs, np.prod(probs.shape))
-    else:
-        # Fancy indexing required
-        meas_shape = tuple(qid_shape[i] for i in indices)
-        probs = (
-            np.abs(
-                [
-                    tensor[
-                        linalg.slice_for_qubits_equal_to(
-                            indices, big_endian_qureg_value=b, qid_shape=qid_shape
-                        )
-                    ]
-                    for b in range(np.prod(meas_shape, dtype=int))
-                ]
-            )
-            ** 2
-        )
-        probs = np.sum(probs, axis=tuple(range(1, len(probs.shape))))
+    probs = np.abs(np.reshape(state, qid_shape)) ** 2
+    return _marginalize(probs, indices)
+
+
+def _marginalize(probs: np.ndarray, indices: Sequence[int]) -> np.ndarray:
+    """Sums a probability tensor over all axes except `indices`.
+
+    The result is flattened in big endian order of the measured axes, in the
+    order given by `indices`, and normalized to sum to 1.
+    """
+    probs = np.sum(probs, axis=tuple(i for i in range(probs.ndim) if i not in indices))
+    # The remaining axes are in increasing order; permute them into the order
+    # of `indices`.
+    remaining = sorted(indices)
+    probs = np.transpose(probs, [remaining.index(i) for i in indices]).reshape(-1)
 
     # To deal with rounding issues, ensure that the probabilities sum to 1.
     probs /= np.sum(probs)
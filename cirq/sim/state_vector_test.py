@@ -82,6 +82,20 @@ def test_sample_state_partial_indices_all_orders():
             np.testing.assert_equal(cirq.sample_state_vector(state, perm), expected)
 
 
+def test_sample_state_partial_qudit_indices_distribution():
+    qid_shape = (2, 3, 2, 4)
+    state = cirq.testing.random_superposition(48, random_state=3).reshape(qid_shape)
+    indices = [3, 1]
+    expected = np.sum(np.abs(state) ** 2, axis=(0, 2)).T.reshape(-1)
+    samples = cirq.sample_state_vector(
+        state, indices, qid_shape=qid_shape, repetitions=20000, seed=1
+    )
+    assert samples.shape == (20000, 2)
+    assert samples.dtype == np.uint8
+    counts = np.bincount(samples[:, 0] * 3 + samples[:, 1], minlength=12)
+    np.testing.assert_allclose(counts / 20000, expected, atol=0.02)
+
+
 def test_sample_state():
     state = np.zeros(8, dtype=np.complex64)
     state[0] = 1 / np.sqrt(2)
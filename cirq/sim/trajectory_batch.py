@@ -0,0 +1,225 @@
+# Copyright 2020 The Cirq Developers
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Simulation of many state vector trajectories at once.
+
+The functions in this module operate on a stacked state tensor of shape
+`(batch,) + qid_shape`, where each entry along the first axis is an
+independent trajectory. Unitary operations are applied to every trajectory in
+a single contraction, while measurements, mixtures and channels sample an
+outcome per trajectory and then update the whole stack with vectorized
+projections.
+"""
+
+from typing import Dict, Iterator, List, Sequence, Tuple, TYPE_CHECKING
+
+import numpy as np
+
+from cirq import linalg, ops, protocols
+
+if TYPE_CHECKING:
+    import cirq
+
+# The largest number of amplitudes held in one stacked state tensor. Batches
+# of trajectories are sized so that they stay below this limit.
+MAX_BATCH_AMPLITUDES = 2 ** 24
+
+
+def can_simulate_in_batches(circuit: 'cirq.Circuit') -> bool:
+    """Determines whether `simulate_trajectory_batches` supports a circuit.
+
+    Every operation must be a `cirq.MeasurementGate` or support the unitary,
+    mixture or channel protocol.
+    """
+    return all(
+        isinstance(op.gate, ops.MeasurementGate)
+        or (
+            not protocols.is_measurement(op)
+            and (protocols.has_unitary(op) or protocols.has_channel(op, allow_decompose=False))
+        )
+        for op in circuit.all_operations()
+    )
+
+
+def simulate_trajectory_batches(
+    circuit: 'cirq.Circuit',
+    qubits: Sequence['cirq.Qid'],
+    initial_state: np.ndarray,
+    repetitions: int,
+    prng: np.random.RandomState,
+    max_batch_amplitudes: int = MAX_BATCH_AMPLITUDES,
+) -> Dict[str, np.ndarray]:
+    """Samples measurement results from many trajectories of a circuit.
+
+    Args:
+        circuit: The circuit to simulate. Must satisfy
+            `can_simulate_in_batches`.
+        qubits: The qubits of the state, in the order of the axes of
+            `initial_state`.
+        initial_state: The state every trajectory starts from, as a tensor
+            with one axis per qubit.
+        repetitions: The number of trajectories to sample.
+        prng: The pseudo random number generator used for sampling.
+        max_batch_amplitudes: Trajectories are simulated in batches holding at
+            most this many amplitudes (but always at least one trajectory).
+
+    Returns:
+        A dictionary from measurement key to a `(repetitions, num_qubits)`
+        array of measurement results.
+    """
+    results = {
+        op.gate.key: [np.empty((0, len(op.qubits)), dtype=np.uint8)]
+        for op in circuit.all_operations()
+        if isinstance(op.gate, ops.MeasurementGate)
+    }
+    for _, measurements in final_trajectory_states(
+        circuit, qubits, initial_state, repetitions, prng, max_batch_amplitudes
+    ):
+        for key, digits in measurements.items():
+            results[key].append(digits)
+    return {key: np.concatenate(batches) for key, batches in results.items()}
+
+
+def final_trajectory_states(
+    circuit: 'cirq.Circuit',
+    qubits: Sequence['cirq.Qid'],
+    initial_state: np.ndarray,
+    repetitions: int,
+    prng: np.random.RandomState,
+    max_batch_amplitudes: int = MAX_BATCH_AMPLITUDES,
+) -> Iterator[Tuple[np.ndarray, Dict[str, np.ndarray]]]:
+    """Simulates many trajectories of a circuit, one batch at a time.
+
+    Args:
+        circuit: The circuit to simulate. Must satisfy
+            `can_simulate_in_batches`.
+        qubits: The qubits of the state, in the order of the axes of
+            `initial_state`.
+        initial_state: The state every trajectory starts from, as a tensor
+            with one axis per qubit.
+        repetitions: The number of trajectories to simulate.
+        prng: The pseudo random number generator used for sampling.
+        max_batch_amplitudes: Trajectories are simulated in batches holding at
+            most this many amplitudes (but always at least one trajectory).
+
+    Yields:
+        For every batch, the stacked final states of its trajectories, with
+        shape `(batch,) + initial_state.shape`, and a dictionary from
+        measurement key to a `(batch, num_qubits)` array of the measurement
+        results of its trajectories.
+    """
+    qubit_map = {q: i for i, q in enumerate(qubits)}
+    circuit_ops = [
+        (op, tuple(qubit_map[q] + 1 for q in op.qubits)) for op in circuit.all_operations()
+    ]
+    measurement_ops = [op for op, _ in circuit_ops if isinstance(op.gate, ops.MeasurementGate)]
+
+    batch_size = max(1, max_batch_amplitudes // max(1, initial_state.size))
+    for start in range(0, repetitions, batch_size):
+        stop = min(start + batch_size, repetitions)
+        results = {
+            op.gate.key: np.empty((stop - start, len(op.qubits)), dtype=np.uint8)
+            for op in measurement_ops
+        }
+        state = np.repeat(initial_state[np.newaxis], stop - start, axis=0)
+        buffer = np.empty_like(state)
+        for op, axes in circuit_ops:
+            if isinstance(op.gate, ops.MeasurementGate):
+                state, digits = _measure_batch(state, axes, prng)
+                invert_mask = np.array(op.gate.full_invert_mask(), dtype=bool)
+                results[op.gate.key][:] = digits ^ (invert_mask & (digits < 2))
+            elif protocols.has_unitary(op):
+                result = _apply_unitary_batch(op, state, axes, buffer)
+                if result is buffer:
+                    buffer = state
+                state = result
+            elif protocols.has_mixture(op, allow_decompose=False):
+                state = _apply_mixture_batch(op, state, axes, prng)
+            else:
+                state = _apply_channel_batch(op, state, axes, prng)
+        yield state, results
+
+
+def _apply_unitary_batch(
+    op: 'cirq.Operation', state: np.ndarray, axes: Sequence[int], buffer: np.ndarray
+) -> np.ndarray:
+    return protocols.apply_unitary(
+        op, protocols.ApplyUnitaryArgs(target_tensor=state, available_buffer=buffer, axes=axes)
+    )
+
+
+def _sample_indices(probabilities: np.ndarray, prng: np.random.RandomState) -> np.ndarray:
+    """Samples one column index per row of a `(batch, k)` probability array."""
+    cumulative = np.cumsum(probabilities, axis=1)
+    draws = prng.random_sample(len(probabilities)) * cumulative[:, -1]
+    indices = (cumulative <= draws[:, np.newaxis]).sum(axis=1)
+    return np.minimum(indices, probabilities.shape[1] - 1)
+
+
+def _measure_batch(state: np.ndarray, axes: Sequence[int], prng: np.random.RandomState):
+    """Measures the given axes of every trajectory, collapsing the states."""
+    batch = state.shape[0]
+    meas_shape = tuple(state.shape[a] for a in axes)
+    front = list(range(1, len(axes) + 1))
+    moved = np.moveaxis(state, axes, front)
+    probs = np.abs(moved.reshape(batch, int(np.prod(meas_shape)), -1)) ** 2
+    outcome_probs = probs.sum(axis=2)
+    outcomes = _sample_indices(outcome_probs, prng)
+
+    mask = np.zeros_like(outcome_probs)
+    chosen = outcome_probs[np.arange(batch), outcomes]
+    mask[np.arange(batch), outcomes] = 1 / np.sqrt(chosen)
+    mask = mask.reshape((batch,) + meas_shape + (1,) * (state.ndim - 1 - len(axes)))
+    collapsed = np.moveaxis(moved * mask.astype(state.dtype), front, axes)
+
+    digits = np.stack(np.unravel_index(outcomes, meas_shape), axis=1).astype(np.uint8)
+    return np.ascontiguousarray(collapsed), digits
+
+
+def _kraus_tensors(operators: List[np.ndarray], op: 'cirq.Operation', dtype: np.dtype):
+    shape = protocols.qid_shape(op) * 2
+    return [e.reshape(shape).astype(dtype) for e in operators]
+
+
+def _apply_mixture_batch(
+    op: 'cirq.Operation', state: np.ndarray, axes: Sequence[int], prng: np.random.RandomState
+) -> np.ndarray:
+    """Applies a randomly chosen unitary of a mixture to each trajectory.
+
+    Trajectories are grouped by the sampled unitary so that each unitary is
+    applied with a single contraction. Trajectories that sampled the identity,
+    the most likely outcome of typical noise, are left untouched.
+    """
+    probabilities, unitaries = zip(*protocols.mixture(op))
+    choices = _sample_indices(np.tile(probabilities, (len(state), 1)), prng)
+    tensors = _kraus_tensors(list(unitaries), op, state.dtype)
+    for k, (unitary, tensor) in enumerate(zip(unitaries, tensors)):
+        members = np.flatnonzero(choices == k)
+        if len(members) and not np.allclose(unitary, np.eye(len(unitary))):
+            state[members] = linalg.targeted_left_multiply(tensor, state[members], axes)
+    return state
+
+
+def _apply_channel_batch(
+    op: 'cirq.Operation', state: np.ndarray, axes: Sequence[int], prng: np.random.RandomState
+) -> np.ndarray:
+    """Applies a Kraus operator sampled per trajectory from its weight."""
+    batch = state.shape[0]
+    tensors = _kraus_tensors(list(protocols.channel(op)), op, state.dtype)
+    candidates = np.stack([linalg.targeted_left_multiply(t, state, axes) for t in tensors])
+    weights = np.sum(np.abs(candidates.reshape(len(tensors), batch, -1)) ** 2, axis=2)
+    choices = _sample_indices(weights.T, prng)
+    chosen = candidates[choices, np.arange(batch)]
+    norms = np.sqrt(weights[choices, np.arange(batch)])
+    return chosen / norms.reshape((batch,) + (1,) * (state.ndim - 1)).astype(state.dtype)
@@ -0,0 +1,115 @@
+# Copyright 2020 The Cirq Developers
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import numpy as np
+import pytest
+
+import cirq
+from cirq.sim import trajectory_batch
+
+
+class _ActOnOnlyGate(cirq.SingleQubitGate):
+    def _act_on_(self, args):
+        return True
+
+
+def _sample(circuit, repetitions, seed=1234, **kwargs):
+    qubits = sorted(circuit.all_qubits())
+    qid_shape = cirq.qid_shape(qubits)
+    initial_state = cirq.to_valid_state_vector(0, qid_shape=qid_shape).reshape(qid_shape)
+    return trajectory_batch.simulate_trajectory_batches(
+        circuit,
+        qubits=qubits,
+        initial_state=initial_state,
+        repetitions=repetitions,
+        prng=np.random.RandomState(seed),
+        **kwargs,
+    )
+
+
+def test_can_simulate_in_batches():
+    q = cirq.LineQubit(0)
+    assert trajectory_batch.can_simulate_in_batches(
+        cirq.Circuit(
+            cirq.H(q), cirq.measure(q), cirq.depolarize(0.1).on(q), cirq.amplitude_damp(0.1).on(q)
+        )
+    )
+    assert not trajectory_batch.can_simulate_in_batches(cirq.Circuit(_ActOnOnlyGate().on(q)))
+
+
+def test_measurements_collapse_state():
+    a, b = cirq.LineQubit.range(2)
+    circuit = cirq.Circuit(
+        cirq.H(a),
+        cirq.CNOT(a, b),
+        cirq.measure(a, key='a'),
+        cirq.H(a),
+        cirq.H(a),
+        cirq.measure(a, b, key='ab', invert_mask=(False, True)),
+    )
+    results = _sample(circuit, repetitions=200)
+    assert results['a'].shape == (200, 1)
+    assert results['ab'].shape == (200, 2)
+    assert results['a'].dtype == np.uint8
+    np.testing.assert_equal(results['ab'][:, 0], results['a'][:, 0])
+    np.testing.assert_equal(results['ab'][:, 1], 1 - results['a'][:, 0])
+    assert 0 < np.sum(results['a']) < 200
+
+
+def test_batches_are_split_by_amplitude_budget():
+    q = cirq.LineQubit.range(3)
+    circuit = cirq.Circuit(
+        cirq.X(q[0]), cirq.measure(*q, key='m'), cirq.X(q[1]), cirq.measure(q[1])
+    )
+    results = _sample(circuit, repetitions=7, max_batch_amplitudes=16)
+    np.testing.assert_equal(results['m'], [[1, 0, 0]] * 7)
+    np.testing.assert_equal(results['1'], [[1]] * 7)
+
+
+def test_qudit_measurement():
+    q = cirq.LineQid(0, dimension=3)
+
+    class PlusOne(cirq.Gate):
+        def _qid_shape_(self):
+            return (3,)
+
+        def _unitary_(self):
+            return np.roll(np.eye(3), 1, axis=0)
+
+    circuit = cirq.Circuit(PlusOne().on(q), PlusOne().on(q), cirq.measure(q, key='m'))
+    np.testing.assert_equal(_sample(circuit, repetitions=5)['m'], [[2]] * 5)
+
+
+@pytest.mark.parametrize(
+    'prepare_one, channel, expected_ones',
+    [
+        (False, cirq.bit_flip(0.25), 0.25),
+        (True, cirq.amplitude_damp(0.5), 0.5),
+        (False, cirq.depolarize(0.3), 0.2),
+    ],
+)
+def test_noise_statistics(prepare_one, channel, expected_ones):
+    q = cirq.LineQubit(0)
+    circuit = cirq.Circuit(cirq.X(q) ** prepare_one, channel.on(q), cirq.measure(q, key='m'))
+    results = _sample(circuit, repetitions=20000)
+    assert abs(np.mean(results['m']) - expected_ones) < 0.02
+
+
+def test_simulator_falls_back_to_repeated_simulation():
+    q = cirq.LineQubit(0)
+    circuit = cirq.Circuit(cirq.X(q), cirq.measure(q, key='a'), _ActOnOnlyGate().on(q))
+    circuit.append(cirq.measure(q, key='b'))
+    result = cirq.Simulator().run(circuit, repetitions=3)
+    np.testing.assert_equal(result.measurements['a'], [[1]] * 3)
+    np.testing.assert_equal(result.measurements['b'], [[1]] * 3)
@@ -0,0 +1,204 @@
+# Copyright 2020 The Cirq Developers
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""A noisy simulator that samples quantum trajectories of state vectors."""
+
+from typing import Any, Dict, List, Sequence, Tuple, Type, TYPE_CHECKING, Union
+
+import numpy as np
+
+from cirq import circuits, devices, linalg, ops, protocols, qis, study, value
+from cirq.sim import simulator, trajectory_batch
+from cirq.sim.simulator import check_all_resolved
+
+if TYPE_CHECKING:
+    import cirq
+
+
+class TrajectorySimulator(simulator.SimulatesSamples):
+    """A noisy simulator that samples quantum trajectories of state vectors.
+
+    Instead of evolving a density matrix, which needs memory proportional to
+    4^n for n qubits, every repetition evolves a state vector (2^n memory)
+    and samples one Kraus operator of every noisy operation, with
+    probability given by the weight of the resulting state. This is also
+    known as the Monte-Carlo wave function method. Averaging over many
+    trajectories reproduces the statistics of the density matrix simulation.
+
+    Trajectories are simulated in batches: unitary operations are applied to
+    all trajectories of a batch with a single contraction, while channels and
+    measurements sample an outcome per trajectory. The batch size is limited
+    by `max_batch_amplitudes`. To also spread trajectories across processes,
+    wrap the simulator in a `cirq.ParallelSampler`.
+
+    The simulator supports operations that have a unitary, a mixture or a
+    channel, measurements, and operations that decompose into those. A noise
+    model is applied to every circuit before simulation.
+
+    Measurement results are available through the `cirq.Sampler` methods,
+    e.g. `run` and `run_sweep`. Expectation values of observables on the final
+    states of the trajectories, together with their standard errors, are
+    returned by `estimate_expectation_values`.
+    """
+
+    def __init__(
+        self,
+        *,
+        noise: 'cirq.NOISE_MODEL_LIKE' = None,
+        dtype: Type[np.number] = np.complex64,
+        seed: 'cirq.RANDOM_STATE_OR_SEED_LIKE' = None,
+        max_batch_amplitudes: int = trajectory_batch.MAX_BATCH_AMPLITUDES,
+    ):
+        """Trajectory simulator.
+
+        Args:
+            noise: A noise model to apply while simulating.
+            dtype: The `numpy.dtype` used by the simulation. One of
+                `numpy.complex64` or `numpy.complex128`.
+            seed: The random seed to use for this simulator.
+            max_batch_amplitudes: The largest number of amplitudes held in
+                memory at once, across the trajectories of a batch. At least
+                one trajectory is always simulated at a time.
+        """
+        if np.dtype(dtype).kind != 'c':
+            raise ValueError('dtype must be a complex type but was {}'.format(dtype))
+        self.noise = devices.NoiseModel.from_noise_model_like(noise)
+        self._dtype = dtype
+        self._prng = value.parse_random_state(seed)
+        self._max_batch_amplitudes = max_batch_amplitudes
+
+    def _run(
+        self, circuit: circuits.Circuit, param_resolver: study.ParamResolver, repetitions: int
+    ) -> Dict[str, np.ndarray]:
+        """See definition in `cirq.SimulatesSamples`."""
+        qubits = sorted(circuit.all_qubits())
+        noisy_circuit = self._noisy_resolved_circuit(circuit, param_resolver, qubits)
+        initial_state = self._initial_state(0, qubits)
+        return trajectory_batch.simulate_trajectory_batches(
+            noisy_circuit,
+            qubits,
+            initial_state,
+            repetitions,
+            self._prng,
+            self._max_batch_amplitudes,
+        )
+
+    def estimate_expectation_values(
+        self,
+        program: 'cirq.Circuit',
+        observables: Union['cirq.PauliSumLike', List['cirq.PauliSumLike']],
+        repetitions: int,
+        param_resolver: 'cirq.ParamResolverOrSimilarType' = None,
+        qubit_order: 'cirq.QubitOrderOrList' = ops.QubitOrder.DEFAULT,
+        initial_state: 'cirq.STATE_VECTOR_LIKE' = 0,
+    ) -> Tuple[List[float], List[float]]:
+        """Estimates expectation values by averaging over trajectories.
+
+        Args:
+            program: The circuit to simulate. Measurements collapse the state
+                of each trajectory.
+            observables: An observable or list of observables.
+            repetitions: The number of trajectories to average over.
+            param_resolver: Parameters to run with the program.
+            qubit_order: Determines the canonical ordering of the qubits, which
+                is used to interpret `initial_state`.
+            initial_state: The initial state of every trajectory, as a
+                computational basis state index or a state vector.
+
+        Returns:
+            The mean over trajectories of the expectation value of each
+            observable and the standard error of each mean.
+
+        Raises:
+            ValueError: `repetitions` is less than 2.
+        """
+        if repetitions < 2:
+            raise ValueError(f'At least 2 repetitions are needed but got {repetitions}.')
+        if not isinstance(observables, List):
+            observables = [observables]
+        pauli_sums = [ops.PauliSum.wrap(observable) for observable in observables]
+        observable_qubits = {q for pauli_sum in pauli_sums for q in pauli_sum.qubits}
+        qubits = ops.QubitOrder.as_qubit_order(qubit_order).order_for(
+            program.all_qubits() | observable_qubits
+        )
+        qubit_map = {q: i for i, q in enumerate(qubits)}
+        noisy_circuit = self._noisy_resolved_circuit(
+            program, study.ParamResolver(param_resolver), qubits
+        )
+
+        values = np.empty((len(pauli_sums), repetitions))
+        start = 0
+        for states, _ in trajectory_batch.final_trajectory_states(
+            noisy_circuit,
+            qubits,
+            self._initial_state(initial_state, qubits),
+            repetitions,
+            self._prng,
+            self._max_batch_amplitudes,
+        ):
+            stop = start + len(states)
+            for i, pauli_sum in enumerate(pauli_sums):
+                values[i, start:stop] = _batch_expectation(pauli_sum, states, qubit_map)
+            start = stop
+
+        means = np.mean(values, axis=1)
+        standard_errors = np.std(values, axis=1, ddof=1) / np.sqrt(repetitions)
+        return means.tolist(), standard_errors.tolist()
+
+    def _noisy_resolved_circuit(
+        self,
+        circuit: 'cirq.Circuit',
+        param_resolver: 'cirq.ParamResolver',
+        qubits: Sequence['cirq.Qid'],
+    ) -> 'cirq.Circuit':
+        resolved_circuit = protocols.resolve_parameters(circuit, param_resolver)
+        check_all_resolved(resolved_circuit)
+        noisy_circuit = circuits.Circuit(self.noise.noisy_moments(resolved_circuit, qubits))
+        if not trajectory_batch.can_simulate_in_batches(noisy_circuit):
+            noisy_circuit = circuits.Circuit(
+                protocols.decompose(noisy_circuit, keep=_is_simulatable, on_stuck_raise=None)
+            )
+        if not trajectory_batch.can_simulate_in_batches(noisy_circuit):
+            raise ValueError(
+                'TrajectorySimulator only supports operations with a unitary, a mixture or a '
+                'channel, and measurements. The noisy circuit was:\n{}'.format(noisy_circuit)
+            )
+        return noisy_circuit
+
+    def _initial_state(self, initial_state: Any, qubits: Sequence['cirq.Qid']) -> np.ndarray:
+        qid_shape = protocols.qid_shape(qubits)
+        state = qis.to_valid_state_vector(
+            initial_state, len(qubits), qid_shape=qid_shape, dtype=self._dtype
+        )
+        return state.reshape(qid_shape)
+
+
+def _is_simulatable(op: 'cirq.Operation') -> bool:
+    return trajectory_batch.can_simulate_in_batches(circuits.Circuit(op))
+
+
+def _batch_expectation(
+    pauli_sum: 'cirq.PauliSum', states: np.ndarray, qubit_map: Dict['cirq.Qid', int]
+) -> np.ndarray:
+    """Returns the expectation value of an observable in each trajectory."""
+    state_axes = tuple(range(1, states.ndim))
+    values = np.zeros(len(states))
+    for term in pauli_sum:
+        applied = states
+        for q, pauli in term.items():
+            matrix = protocols.unitary(pauli).astype(states.dtype)
+            applied = linalg.targeted_left_multiply(matrix, applied, [qubit_map[q] + 1])
+        overlaps = np.sum(np.conjugate(states) * applied, axis=state_axes)
+        values += np.real(term.coefficient * overlaps)
+    return values
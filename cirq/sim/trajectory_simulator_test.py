@@ -0,0 +1,163 @@
+# Copyright 2020 The Cirq Developers
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import concurrent.futures
+
+import numpy as np
+import pytest
+import sympy
+
+import cirq
+
+
+def test_invalid_dtype():
+    with pytest.raises(ValueError, match='complex'):
+        cirq.TrajectorySimulator(dtype=np.int32)
+
+
+def test_run_noiseless():
+    q0, q1 = cirq.LineQubit.range(2)
+    circuit = cirq.Circuit(cirq.X(q0), cirq.CNOT(q0, q1), cirq.measure(q0, q1, key='m'))
+    result = cirq.TrajectorySimulator(seed=1).run(circuit, repetitions=10)
+    np.testing.assert_equal(result.measurements['m'], [[1, 1]] * 10)
+
+
+def test_run_with_noise_model():
+    q0 = cirq.LineQubit(0)
+    circuit = cirq.Circuit(cirq.X(q0), cirq.measure(q0, key='m'))
+    simulator = cirq.TrajectorySimulator(noise=cirq.amplitude_damp(0.3), seed=1234)
+    result = simulator.run(circuit, repetitions=4000)
+    # Amplitude damping is applied after each of the two moments.
+    assert abs(np.mean(result.measurements['m']) - 0.7) < 0.03
+
+
+def test_run_matches_density_matrix_simulator():
+    q0, q1 = cirq.LineQubit.range(2)
+    circuit = cirq.Circuit(
+        cirq.H(q0),
+        cirq.CNOT(q0, q1),
+        cirq.depolarize(0.2).on(q1),
+        cirq.measure(q0, q1, key='m'),
+    )
+    probabilities = np.diag(
+        cirq.DensityMatrixSimulator().simulate(circuit[:-1]).final_density_matrix
+    ).real
+    result = cirq.TrajectorySimulator(seed=2).run(circuit, repetitions=4000)
+    counts = result.histogram(key='m', fold_func=lambda bits: 2 * bits[0] + bits[1])
+    for i, p in enumerate(probabilities):
+        assert abs(counts[i] / 4000 - p) < 0.03
+
+
+def test_run_sweep():
+    q0 = cirq.LineQubit(0)
+    circuit = cirq.Circuit(cirq.X(q0) ** sympy.Symbol('t'), cirq.measure(q0, key='m'))
+    results = cirq.TrajectorySimulator(seed=3).run_sweep(
+        circuit, cirq.Points('t', [0, 1]), repetitions=5
+    )
+    np.testing.assert_equal(results[0].measurements['m'], [[0]] * 5)
+    np.testing.assert_equal(results[1].measurements['m'], [[1]] * 5)
+
+
+def test_run_in_small_batches():
+    q0, q1 = cirq.LineQubit.range(2)
+    circuit = cirq.Circuit(cirq.H(q0), cirq.CNOT(q0, q1), cirq.measure(q0, q1, key='m'))
+    simulator = cirq.TrajectorySimulator(seed=4, max_batch_amplitudes=8)
+    measurements = simulator.run(circuit, repetitions=101).measurements['m']
+    assert measurements.shape == (101, 2)
+    np.testing.assert_equal(measurements[:, 0], measurements[:, 1])
+    assert 0 < np.sum(measurements[:, 0]) < 101
+
+
+def test_run_decomposes():
+    q0, q1 = cirq.LineQubit.range(2)
+
+    class Composite(cirq.Gate):
+        def num_qubits(self):
+            return 2
+
+        def _decompose_(self, qubits):
+            yield cirq.X(qubits[0])
+            yield cirq.bit_flip(1).on(qubits[1])
+
+    circuit = cirq.Circuit(Composite().on(q0, q1), cirq.measure(q0, q1, key='m'))
+    result = cirq.TrajectorySimulator(seed=5).run(circuit, repetitions=3)
+    np.testing.assert_equal(result.measurements['m'], [[1, 1]] * 3)
+
+
+def test_run_unsupported_operation():
+    class Unsupported(cirq.SingleQubitGate):
+        pass
+
+    q0 = cirq.LineQubit(0)
+    circuit = cirq.Circuit(Unsupported().on(q0), cirq.measure(q0))
+    with pytest.raises(ValueError, match='only supports'):
+        cirq.TrajectorySimulator().run(circuit)
+
+
+def test_run_unresolved():
+    q0 = cirq.LineQubit(0)
+    circuit = cirq.Circuit(cirq.X(q0) ** sympy.Symbol('t'), cirq.measure(q0))
+    with pytest.raises(ValueError, match='not specified in parameter sweep'):
+        cirq.TrajectorySimulator().run(circuit)
+
+
+def test_estimate_expectation_values_noiseless():
+    q0, q1 = cirq.LineQubit.range(2)
+    circuit = cirq.Circuit(cirq.H(q0), cirq.CNOT(q0, q1))
+    means, errors = cirq.TrajectorySimulator(seed=6).estimate_expectation_values(
+        circuit, [cirq.Z(q0) * cirq.Z(q1), cirq.X(q0) * cirq.X(q1), 0.5 * cirq.Z(q0)], 10
+    )
+    np.testing.assert_allclose(means, [1, 1, 0], atol=1e-6)
+    np.testing.assert_allclose(errors, [0, 0, 0], atol=1e-6)
+
+
+def test_estimate_expectation_values_with_noise():
+    q0 = cirq.LineQubit(0)
+    circuit = cirq.Circuit(cirq.depolarize(0.3).on(q0))
+    simulator = cirq.TrajectorySimulator(seed=7)
+    (mean,), (error,) = simulator.estimate_expectation_values(circuit, cirq.Z(q0), 2000)
+    # The depolarizing channel shrinks <Z> from 1 to 1 - 4p/3.
+    assert abs(mean - 0.6) < 4 * error
+    assert 0.01 < error < 0.03
+
+
+def test_estimate_expectation_values_initial_state_and_extra_qubits():
+    q0, q1 = cirq.LineQubit.range(2)
+    circuit = cirq.Circuit(cirq.X(q0))
+    means, _ = cirq.TrajectorySimulator().estimate_expectation_values(
+        circuit,
+        [cirq.Z(q0), cirq.Z(q1)],
+        2,
+        qubit_order=[q0, q1],
+        initial_state=1,
+    )
+    np.testing.assert_allclose(means, [-1, -1], atol=1e-6)
+
+
+def test_estimate_expectation_values_needs_two_repetitions():
+    q0 = cirq.LineQubit(0)
+    with pytest.raises(ValueError, match='At least 2'):
+        cirq.TrajectorySimulator().estimate_expectation_values(
+            cirq.Circuit(cirq.X(q0)), cirq.Z(q0), 1
+        )
+
+
+def test_parallel_sampler():
+    q0 = cirq.LineQubit(0)
+    circuit = cirq.Circuit(cirq.X(q0), cirq.measure(q0, key='m'))
+    with concurrent.futures.ThreadPoolExecutor(2) as executor:
+        sampler = cirq.ParallelSampler(cirq.TrajectorySimulator(seed=8), executor=executor)
+        results = sampler.run_sweep(circuit, [{}, {}], repetitions=3)
+    for result in results:
+        np.testing.assert_equal(result.measurements['m'], [[1]] * 3)
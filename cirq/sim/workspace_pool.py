@@ -0,0 +1,88 @@
+# Copyright 2020 The Cirq Developers
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Reusable arrays for simulator state and scratch buffers."""
+
+import threading
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+_Key = Tuple[Tuple[int, ...], np.dtype]
+
+
+class WorkspacePool:
+    """A pool of preallocated arrays, keyed by shape and dtype.
+
+    Simulators take arrays from the pool instead of allocating new ones, and
+    give back the arrays they no longer need when a simulation ends. Arrays
+    taken from the pool have arbitrary contents.
+
+    The pool is safe to share between threads. Pickling or copying a pool
+    with `copy.deepcopy` produces an empty pool with the same limits.
+    """
+
+    def __init__(self, max_arrays_per_key: int = 4):
+        """Initializes an empty pool.
+
+        Args:
+            max_arrays_per_key: The largest number of arrays with the same
+                shape and dtype kept by the pool. Arrays given back beyond
+                this limit are dropped.
+        """
+        self._max_arrays_per_key = max_arrays_per_key
+        self._arrays: Dict[_Key, List[np.ndarray]] = {}
+        self._lock = threading.Lock()
+
+    def take(self, shape: Sequence[int], dtype: Any) -> np.ndarray:
+        """Returns an array from the pool, or a new one if there is none."""
+        key = (tuple(shape), np.dtype(dtype))
+        with self._lock:
+            arrays = self._arrays.get(key)
+            if arrays:
+                return arrays.pop()
+        return np.empty(key[0], dtype=key[1])
+
+    def give(self, *arrays: Optional[np.ndarray]) -> None:
+        """Returns arrays that are no longer referenced to the pool.
+
+        Arrays that are `None`, views or not contiguous are ignored.
+        """
+        with self._lock:
+            for array in arrays:
+                if array is None or array.base is not None or not array.flags.c_contiguous:
+                    continue
+                pooled = self._arrays.setdefault((array.shape, array.dtype), [])
+                if len(pooled) < self._max_arrays_per_key and all(array is not p for p in pooled):
+                    pooled.append(array)
+
+    def clear(self) -> None:
+        """Releases all arrays held by the pool."""
+        with self._lock:
+            self._arrays.clear()
+
+    @property
+    def nbytes(self) -> int:
+        """The total size of the arrays held by the pool."""
+        with self._lock:
+            return sum(a.nbytes for arrays in self._arrays.values() for a in arrays)
+
+    def __getstate__(self):
+        return {'max_arrays_per_key': self._max_arrays_per_key}
+
+    def __setstate__(self, state):
+        self.__init__(state['max_arrays_per_key'])
+
+    def __deepcopy__(self, memo):
+        return WorkspacePool(self._max_arrays_per_key)
@@ -0,0 +1,66 @@
+# Copyright 2020 The Cirq Developers
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import copy
+import pickle
+
+import numpy as np
+
+from cirq.sim import workspace_pool
+
+
+def test_take_and_give():
+    pool = workspace_pool.WorkspacePool()
+    a = pool.take((2, 2), np.complex64)
+    assert a.shape == (2, 2)
+    assert a.dtype == np.complex64
+    assert pool.nbytes == 0
+
+    pool.give(a)
+    assert pool.nbytes == a.nbytes
+    assert pool.take((2, 2), np.complex128) is not a
+    assert pool.take([2, 2], np.complex64) is a
+    assert pool.nbytes == 0
+
+
+def test_give_ignores_views_and_duplicates():
+    pool = workspace_pool.WorkspacePool()
+    a = np.zeros((4, 4), dtype=np.complex64)
+    pool.give(None, a.reshape(16), a[:, ::2].copy()[:, ::2], a.T)
+    assert pool.nbytes == 0
+
+    pool.give(a, a)
+    assert pool.nbytes == a.nbytes
+
+
+def test_max_arrays_per_key():
+    pool = workspace_pool.WorkspacePool(max_arrays_per_key=2)
+    pool.give(*[np.zeros(3) for _ in range(5)])
+    assert pool.nbytes == 2 * 3 * 8
+
+
+def test_clear():
+    pool = workspace_pool.WorkspacePool()
+    pool.give(np.zeros(3))
+    pool.clear()
+    assert pool.nbytes == 0
+
+
+def test_copies_are_empty():
+    pool = workspace_pool.WorkspacePool(max_arrays_per_key=1)
+    pool.give(np.zeros(3))
+    for other in [copy.deepcopy(pool), pickle.loads(pickle.dumps(pool))]:
+        assert other.nbytes == 0
+        other.give(np.zeros(3), np.zeros(3))
+        assert other.nbytes == 3 * 8
@@ -18,6 +18,9 @@ from typing import (
     Callable,
     Dict,
     Iterable,
+    List,
+    Mapping,
+    Iterator,
     Optional,
     Sequence,
     TYPE_CHECKING,
@@ -56,13 +59,128 @@ def _tuple_of_big_endian_int(bit_groups: Iterable[Any]) -> Tuple[int, ...]:
     return tuple(value.big_endian_bits_to_int(bits) for bits in bit_groups)
 
 
+class _PackedBits:
+    """Rows of bits packed eight to a byte by `np.packbits(bits, axis=1)`.
+
+    The rows are a window into a buffer that may have spare rows at the end.
+    Concatenating onto the window that ends at the last written row of its
+    buffer writes into the spare rows instead of copying, so a result built
+    up by repeated addition is copied an amortized constant number of times.
+    """
+
+    def __init__(
+        self,
+        buffer: np.ndarray,
+        num_bits: int,
+        dtype: Any,
+        start: int = 0,
+        stop: Optional[int] = None,
+        written: Optional[List[int]] = None,
+    ) -> None:
+        self._buffer = buffer
+        self.num_bits = num_bits
+        self.dtype = np.dtype(dtype)
+        self._start = start
+        self._stop = len(buffer) if stop is None else stop
+        # Number of rows of the buffer in use, shared by all windows into it.
+        self._written = [self._stop] if written is None else written
+
+    @staticmethod
+    def pack(bits: np.ndarray) -> '_PackedBits':
+        return _PackedBits(np.packbits(bits != 0, axis=1), bits.shape[1], bits.dtype)
+
+    @property
+    def words(self) -> np.ndarray:
+        return self._buffer[self._start : self._stop]
+
+    @property
+    def shape(self) -> Tuple[int, int]:
+        return len(self), self.num_bits
+
+    def __len__(self) -> int:
+        return self._stop - self._start
+
+    def unpack(self) -> np.ndarray:
+        return np.unpackbits(self.words, axis=1)[:, : self.num_bits].astype(self.dtype)
+
+    def __getitem__(self, index: slice) -> '_PackedBits':
+        return _PackedBits(self.words[index], self.num_bits, self.dtype)
+
+    def concat(self, other: '_PackedBits') -> '_PackedBits':
+        n, m = len(self), len(other)
+        if self._stop == self._written[0] and self._stop + m <= len(self._buffer):
+            self._buffer[self._stop : self._stop + m] = other.words
+            self._written[0] += m
+            return _PackedBits(
+                self._buffer, self.num_bits, self.dtype, self._start, self._stop + m, self._written
+            )
+        buffer = np.empty((2 * (n + m), self._buffer.shape[1]), dtype=np.uint8)
+        buffer[:n] = self.words
+        buffer[n : n + m] = other.words
+        return _PackedBits(buffer, self.num_bits, self.dtype, 0, n + m)
+
+
+class _UnpackedMeasurements(Mapping[str, np.ndarray]):
+    """Read-only view of measurement records that unpacks packed bits.
+
+    Packed records are unpacked on every access, so that a result keeps only
+    its packed form in memory.
+    """
+
+    def __init__(self, records: Dict[str, Union[np.ndarray, _PackedBits]]) -> None:
+        self._records = records
+
+    def __getitem__(self, key: str) -> np.ndarray:
+        record = self._records[key]
+        if isinstance(record, _PackedBits):
+            return record.unpack()
+        return record
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._records)
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+
+def _big_endian_int_codes(
+    record: Union[np.ndarray, _PackedBits]
+) -> Tuple[np.ndarray, Optional[np.ndarray]]:
+    """Returns integer codes for the rows of a 2-D array of bits.
+
+    Rows of at most 63 bits are coded by their big endian integer value, and
+    the returned table is None. Wider rows are coded by their index into the
+    returned table, an object array of the distinct big endian values.
+    """
+    if isinstance(record, _PackedBits):
+        packed = record.words
+        n = record.num_bits
+        if n <= 63:
+            powers = np.arange(8 * packed.shape[1] - 8, -1, -8).astype(np.uint64)
+            weights = np.left_shift(np.uint64(1), powers)
+            pad = np.uint64(8 * packed.shape[1] - n)
+            return ((packed.astype(np.uint64) @ weights) >> pad).astype(np.int64), None
+    else:
+        bits = np.asarray(record) != 0
+        n = bits.shape[1]
+        if n <= 63:
+            weights = np.left_shift(np.int64(1), np.arange(n - 1, -1, -1, dtype=np.int64))
+            return bits.astype(np.int64) @ weights, None
+        packed = np.packbits(bits, axis=1)
+    rows, codes = np.unique(packed, axis=0, return_inverse=True)
+    shift = 8 * packed.shape[1] - n
+    table = np.empty(len(rows), dtype=object)
+    table[:] = [int.from_bytes(row.tobytes(), 'big') >> shift for row in rows]
+    return codes.reshape(-1).astype(np.int64), table
+
+
 def _bitstring(vals: Iterable[Any]) -> str:
     str_list = [str(int(v)) for v in vals]
     separator = '' if all(len(s) == 1 for s in str_list) else ' '
     return separator.join(str_list)
 
 
-def _keyed_repeated_bitstrings(vals: Dict[str, np.ndarray]) -> str:
+def _keyed_repeated_bitstrings(vals: Mapping[str, np.ndarray]) -> str:
     keyed_bitstrings = []
     for key in sorted(vals.keys()):
         reps = vals[key]
@@ -89,6 +207,10 @@ class Result:
     repetition.  See `cirq.big_endian_int_to_bits` and similar functions
     for how to convert this integer into bits.
 
+    Measurements of binary values can also be stored packed eight to a
+    byte, see `pack_bits` and `from_packed_bits`. Such results unpack a
+    key's bits each time `measurements` is indexed with it.
+
     Attributes:
         params: A ParamResolver of settings used when sampling result.
     """
@@ -110,16 +232,29 @@ class Result:
         """
         self.params = params
         self._data: Optional[pd.DataFrame] = None
-        self._measurements = measurements
+        self._measurements: Mapping[str, np.ndarray] = measurements
+        self._records = cast(Dict[str, Union[np.ndarray, _PackedBits]], measurements)
+
+    @staticmethod
+    def _from_records(
+        params: resolver.ParamResolver, records: Dict[str, Union[np.ndarray, _PackedBits]]
+    ) -> 'Result':
+        if not any(isinstance(record, _PackedBits) for record in records.values()):
+            return Result(params=params, measurements=cast(Dict[str, np.ndarray], records))
+        result = Result(params=params, measurements={})
+        result._records = records
+        result._measurements = _UnpackedMeasurements(records)
+        return result
 
     @property
     def data(self) -> pd.DataFrame:
         if self._data is None:
             # Convert to a DataFrame with columns as measurement keys, rows as
             # repetitions and a big endian integer for individual measurements.
-            converted_dict = {}
-            for key, val in self._measurements.items():
-                converted_dict[key] = [value.big_endian_bits_to_int(m_vals) for m_vals in val]
+            converted_dict: Dict[str, Any] = {}
+            for key, record in self._records.items():
+                codes, table = _big_endian_int_codes(record)
+                converted_dict[key] = codes if table is None else table[codes].tolist()
             # Note that when a numpy array is produced from this data frame,
             # Pandas will try to use np.int64 as dtype, but will upgrade to
             # object if any value is too large to fit.
@@ -144,13 +279,131 @@ class Result:
         """
         return Result(params=params, measurements=measurements)
 
+    @staticmethod
+    def from_packed_bits(
+        *,  # Forces keyword args.
+        params: resolver.ParamResolver,
+        packed_measurements: Dict[str, np.ndarray],
+        num_qubits: Dict[str, int],
+        dtype: Any = np.bool_,
+    ) -> 'Result':
+        """Packages runs whose measurements were packed with `np.packbits`.
+
+        Args:
+            params: A ParamResolver of settings used for this result.
+            packed_measurements: A dictionary from measurement gate key to a
+                2-D uint8 array with one row per repetition, holding the bits
+                measured in that repetition as packed by
+                `np.packbits(bits, axis=1)`.
+            num_qubits: The number of qubits measured by each key.
+            dtype: The dtype of the unpacked measurement arrays.
+        """
+        return Result._from_records(
+            params,
+            {
+                key: _PackedBits(np.asarray(words, dtype=np.uint8), num_qubits[key], dtype)
+                for key, words in packed_measurements.items()
+            },
+        )
+
+    def pack_bits(self) -> 'Result':
+        """Returns a copy of this result with binary measurements bit-packed.
+
+        The packed result uses an eighth of the memory for each key whose
+        measurements are all 0 or 1. Other keys are kept as they are.
+        """
+        records: Dict[str, Union[np.ndarray, _PackedBits]] = {}
+        for key, record in self._records.items():
+            if not isinstance(record, _PackedBits) and np.all((record == 0) | (record == 1)):
+                record = _PackedBits.pack(record)
+            records[key] = record
+        return Result._from_records(self.params, records)
+
+    def slice_repetitions(self, index: slice) -> 'Result':
+        """Returns the result of the repetitions selected by a slice.
+
+        Measurement arrays and packed bits are sliced without copying.
+        """
+        return Result._from_records(
+            self.params, {key: record[index] for key, record in self._records.items()}
+        )
+
     @property
-    def measurements(self) -> Dict[str, np.ndarray]:
+    def measurements(self) -> Mapping[str, np.ndarray]:
         return self._measurements
 
     @property
     def repetitions(self) -> int:
-        return self.data.shape[0]
+        if not self._records:
+            return 0
+        return len(next(iter(self._records.values())))
+
+    def counts(self, keys: Iterable[TMeasurementKey]) -> Tuple[np.ndarray, np.ndarray]:
+        """Counts the distinct combined measurement results, as arrays.
+
+        This is an array-valued version of 'multi_measurement_histogram' with
+        the default `fold_func`, for consumers that want to keep working with
+        numpy arrays.
+
+        Args:
+            keys: Keys of measurements to include in the counts.
+
+        Returns:
+            A tuple `(values, counts)`. `values` is a 2-D array with one row
+            for each distinct combined result, in sorted order, holding the
+            big endian integer of each key's bits. Its dtype is np.int64,
+            or object if a key measures more than 63 qubits. `counts` is a
+            1-D array with the number of repetitions giving each row.
+        """
+        values, counts, _ = self._unique_counts(keys)
+        return values, counts
+
+    def _unique_counts(
+        self, keys: Iterable[TMeasurementKey]
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Returns `counts(keys)` and the first repetition giving each row."""
+        fixed_keys = [_key_to_str(key) for key in keys]
+        if not fixed_keys:
+            n = min(self.repetitions, 1)
+            return (
+                np.zeros((n, 0), dtype=np.int64),
+                np.full(n, self.repetitions, dtype=np.int64),
+                np.zeros(n, dtype=np.int64),
+            )
+
+        columns = []
+        tables = []
+        for key in fixed_keys:
+            codes, table = _big_endian_int_codes(self._records[key])
+            columns.append(codes)
+            tables.append(table)
+        if len(columns) == 1:
+            unique, first, counts = np.unique(columns[0], return_index=True, return_counts=True)
+            codes = unique.reshape(-1, 1)
+        else:
+            codes, first, counts = np.unique(
+                np.stack(columns, axis=1), axis=0, return_index=True, return_counts=True
+            )
+
+        values = codes
+        if any(table is not None for table in tables):
+            values = codes.astype(object)
+            for j, table in enumerate(tables):
+                if table is not None:
+                    values[:, j] = table[codes[:, j]]
+        return values, counts, first
+
+    def _default_histogram(self, keys: Iterable[TMeasurementKey]) -> collections.Counter:
+        """Returns `multi_measurement_histogram` for the default fold_func.
+
+        Entries are inserted in order of first occurrence, as in the general
+        path.
+        """
+        values, counts, first = self._unique_counts(keys)
+        order = np.argsort(first, kind='stable')
+        return collections.Counter(
+            {tuple(values[i].tolist()): int(counts[i]) for i in order.tolist()}
+        )
 
     # Reason for 'type: ignore': https://github.com/python/mypy/issues/5273
     def multi_measurement_histogram(  # type: ignore
@@ -203,6 +456,8 @@ class Result:
             A counter indicating how often measurements sampled various
             results.
         """
+        if fold_func is _tuple_of_big_endian_int:
+            return self._default_histogram(keys)
         fixed_keys = tuple(_key_to_str(key) for key in keys)
         samples = zip(
             *(self.measurements[sub_key] for sub_key in fixed_keys)
@@ -257,6 +512,10 @@ class Result:
             A counter indicating how often a measurement sampled various
             results.
         """
+        if fold_func is value.big_endian_bits_to_int:
+            return collections.Counter(
+                {k[0]: v for k, v in self._default_histogram([key]).items()}
+            )
         return self.multi_measurement_histogram(keys=[key], fold_func=lambda e: fold_func(e[0]))
 
     def __repr__(self) -> str:
@@ -287,7 +546,7 @@ class Result:
         return self.data.equals(other.data) and self.params == other.params
 
     def _measurement_shape(self):
-        return self.params, {k: v.shape[1] for k, v in self.measurements.items()}
+        return self.params, {k: v.shape[1] for k, v in self._records.items()}
 
     def __add__(self, other: 'cirq.Result') -> 'cirq.Result':
         if not isinstance(other, type(self)):
@@ -297,12 +556,16 @@ class Result:
                 'TrialResults do not have the same parameters or do '
                 'not have the same measurement keys.'
             )
-        all_measurements: Dict[str, np.ndarray] = {}
-        for key in other.measurements:
-            all_measurements[key] = np.append(
-                self.measurements[key], other.measurements[key], axis=0
-            )
-        return Result(params=self.params, measurements=all_measurements)
+        all_records: Dict[str, Union[np.ndarray, _PackedBits]] = {}
+        for key, record in other._records.items():
+            own_record = self._records[key]
+            if isinstance(own_record, _PackedBits) and isinstance(record, _PackedBits):
+                all_records[key] = own_record.concat(record)
+            else:
+                all_records[key] = np.append(
+                    self.measurements[key], other.measurements[key], axis=0
+                )
+        return Result._from_records(self.params, all_records)
 
     def _json_dict_(self):
         packed_measurements = {}
@@ -320,12 +583,40 @@ class Result:
             'measurements': packed_measurements,
         }
 
+    def _binary_dict_(self):
+        """Like `_json_dict_`, but for `cirq.to_binary`.
+
+        Measurements are given as numpy arrays, bit-packed if binary.
+        """
+        measurements = {}
+        for key, record in self.pack_bits()._records.items():
+            if isinstance(record, _PackedBits):
+                measurements[key] = {
+                    'packed_bits': record.words,
+                    'num_bits': record.num_bits,
+                    'dtype': record.dtype.name,
+                }
+            else:
+                measurements[key] = record
+        return {
+            'cirq_type': self.__class__.__name__,
+            'params': self.params,
+            'measurements': measurements,
+        }
+
     @classmethod
     def _from_json_dict_(cls, params, measurements, **kwargs):
-        return cls(
-            params=params,
-            measurements={key: _unpack_digits(**val) for key, val in measurements.items()},
-        )
+        records = {}
+        for key, val in measurements.items():
+            if isinstance(val, np.ndarray):
+                records[key] = val
+            elif 'packed_bits' in val:
+                records[key] = _PackedBits(val['packed_bits'], val['num_bits'], val['dtype'])
+            else:
+                records[key] = _unpack_digits(**val)
+        if any(isinstance(record, _PackedBits) for record in records.values()):
+            return Result._from_records(params, records)
+        return cls(params=params, measurements=records)
 
 
 @deprecated_class(deadline='v0.11', fix='Use cirq.Result instead.', name="cirq.TrialResult")
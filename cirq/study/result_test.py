@@ -88,6 +88,53 @@ def test_histogram():
     assert result.histogram(key='c') == collections.Counter({0: 3, 1: 2})
 
 
+def test_counts():
+    result = cirq.Result.from_single_parameter_set(
+        params=cirq.ParamResolver({}),
+        measurements={
+            'ab': np.array([[0, 1], [0, 1], [0, 1], [1, 0], [0, 1]], dtype=np.bool),
+            'c': np.array([[0], [0], [1], [0], [1]], dtype=np.bool),
+        },
+    )
+
+    values, counts = result.counts(['ab', 'c'])
+    np.testing.assert_array_equal(values, [[1, 0], [1, 1], [2, 0]])
+    np.testing.assert_array_equal(counts, [2, 2, 1])
+    assert values.dtype == np.int64
+
+    values, counts = result.counts(['c'])
+    np.testing.assert_array_equal(values, [[0], [1]])
+    np.testing.assert_array_equal(counts, [3, 2])
+
+    values, counts = result.counts([])
+    assert values.shape == (1, 0)
+    np.testing.assert_array_equal(counts, [5])
+
+
+@pytest.mark.parametrize('n', [3, 63, 64, 100])
+def test_default_histogram_matches_fold_func(n):
+    prng = np.random.RandomState(1234)
+    bits = prng.randint(2, size=(200, n)).astype(np.uint8)
+    bits[::3] = bits[0]
+    digits = prng.randint(3, size=(200, 2)).astype(np.int8)
+    result = cirq.Result(params=cirq.ParamResolver({}), measurements={'m': bits, 'd': digits})
+
+    expected = result.multi_measurement_histogram(
+        keys=['m', 'd'], fold_func=lambda e: tuple(cirq.big_endian_bits_to_int(b) for b in e)
+    )
+    actual = result.multi_measurement_histogram(keys=['m', 'd'])
+    assert actual == expected
+    assert list(actual) == list(expected)
+    assert all(type(k) is int for key in actual for k in key)
+    assert result.histogram(key='m') == result.histogram(
+        key='m', fold_func=lambda e: cirq.big_endian_bits_to_int(e)
+    )
+
+    values, counts = result.counts(['m'])
+    assert values.dtype == (np.int64 if n <= 63 else object)
+    assert dict(zip(values[:, 0].tolist(), counts.tolist())) == result.histogram(key='m')
+
+
 def test_multi_measurement_histogram():
     result = cirq.Result.from_single_parameter_set(
         params=cirq.ParamResolver({}),
@@ -199,6 +246,88 @@ def test_trial_result_addition_valid():
     np.testing.assert_array_equal(c.measurements['q1'], np.array([[0], [0], [1], [0]]))
 
 
+def test_packed_bits():
+    prng = np.random.RandomState(0)
+    measurements = {
+        'a': prng.randint(2, size=(50, 3)).astype(np.uint8),
+        'b': prng.randint(2, size=(50, 70)).astype(bool),
+        'c': prng.randint(3, size=(50, 2)).astype(np.int8),
+        'd': np.zeros((50, 0), dtype=bool),
+    }
+    result = cirq.Result(params=cirq.ParamResolver({'x': 1}), measurements=measurements)
+    packed = result.pack_bits()
+
+    assert packed == result
+    assert packed.repetitions == 50
+    assert packed._records['c'] is measurements['c']
+    assert packed._records['a'].words.shape == (50, 1)
+    assert packed._records['b'].words.shape == (50, 9)
+    assert list(packed.measurements) == ['a', 'b', 'c', 'd']
+    for key, bits in measurements.items():
+        np.testing.assert_array_equal(packed.measurements[key], bits)
+        assert packed.measurements[key].dtype == bits.dtype
+    assert packed.histogram(key='b') == result.histogram(key='b')
+    assert packed.multi_measurement_histogram(
+        keys=['a', 'b', 'c']
+    ) == result.multi_measurement_histogram(keys=['a', 'b', 'c'])
+    pd.testing.assert_frame_equal(packed.data, result.data)
+    assert str(packed) == str(result)
+    assert cirq.read_json(json_text=cirq.to_json(packed)) == result
+
+    unpacked = cirq.Result.from_packed_bits(
+        params=cirq.ParamResolver({'x': 1}),
+        packed_measurements={'a': np.packbits(measurements['a'], axis=1)},
+        num_qubits={'a': 3},
+        dtype=np.uint8,
+    )
+    np.testing.assert_array_equal(unpacked.measurements['a'], measurements['a'])
+
+
+def test_packed_bits_slice_repetitions():
+    bits = np.array([[0, 1], [1, 0], [1, 1], [0, 0]], dtype=bool)
+    for result in [
+        cirq.Result(params=cirq.ParamResolver({}), measurements={'m': bits}),
+        cirq.Result(params=cirq.ParamResolver({}), measurements={'m': bits}).pack_bits(),
+    ]:
+        sliced = result.slice_repetitions(slice(1, 3))
+        assert sliced.repetitions == 2
+        np.testing.assert_array_equal(sliced.measurements['m'], bits[1:3])
+        assert np.shares_memory(
+            getattr(sliced._records['m'], 'words', sliced._records['m']),
+            getattr(result._records['m'], 'words', result._records['m']),
+        )
+
+
+def test_packed_bits_addition():
+    prng = np.random.RandomState(1)
+    chunks = [prng.randint(2, size=(n, 5)).astype(bool) for n in [3, 1, 4, 1, 5, 9, 2, 6]]
+    results = [
+        cirq.Result(params=cirq.ParamResolver({}), measurements={'m': chunk}).pack_bits()
+        for chunk in chunks
+    ]
+
+    total = results[0]
+    reallocations = 0
+    for result in results[1:]:
+        buffer = total._records['m']._buffer
+        total = total + result
+        reallocations += total._records['m']._buffer is not buffer
+    np.testing.assert_array_equal(total.measurements['m'], np.concatenate(chunks))
+    assert reallocations == 3
+
+    # Adding onto an earlier total must not overwrite the rows of a later one.
+    first = results[0] + results[1]
+    second = first + results[2]
+    third = first + results[3]
+    np.testing.assert_array_equal(second.measurements['m'], np.concatenate(chunks[:3]))
+    np.testing.assert_array_equal(third.measurements['m'], np.concatenate(chunks[:2] + chunks[3:4]))
+
+    dense = cirq.Result(params=cirq.ParamResolver({}), measurements={'m': chunks[0]})
+    np.testing.assert_array_equal(
+        (results[1] + dense).measurements['m'], np.concatenate([chunks[1], chunks[0]])
+    )
+
+
 def test_trial_result_addition_invalid():
     a = cirq.Result.from_single_parameter_set(
         params=cirq.ParamResolver({'ax': 1}),
@@ -37,6 +37,9 @@ from cirq.work.observable_measurement_data import (
 from cirq.work.sampler import (
     Sampler,
 )
+from cirq.work.parallel_sampler import (
+    ParallelSampler,
+)
 from cirq.work.zeros_sampler import (
     ZerosSampler,
 )
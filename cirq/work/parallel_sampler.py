@@ -0,0 +1,159 @@
+# Copyright 2020 The Cirq Developers
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""A sampler that spreads sweeps and batches across a pool of workers."""
+
+import concurrent.futures
+import copy
+from typing import List, Optional, Sequence, Tuple, TYPE_CHECKING, Union
+
+from cirq import study, value
+from cirq.work import sampler
+
+if TYPE_CHECKING:
+    import cirq
+
+
+class ParallelSampler(sampler.Sampler):
+    """Runs the sweep points and batch entries of another sampler in parallel.
+
+    The sweep of every circuit is cut into chunks of `chunk_size` consecutive
+    parameter resolvers. Each chunk is sent, together with a copy of the
+    wrapped sampler, to a `concurrent.futures` executor (by default a process
+    pool), and the results are returned in the original order.
+
+    Before running a chunk, the copy of the wrapped sampler is given a fresh
+    random state seeded from a per-chunk seed. Those seeds are drawn from
+    `seed`, or from the random state of the wrapped sampler if `seed` is not
+    given, so results are reproducible and do not depend on the number of
+    workers or on the order in which chunks complete. Reseeding applies to
+    samplers that keep their random state in a `_prng` attribute, which is the
+    case for all of cirq's built-in simulators.
+
+    The wrapped sampler, circuits and resolvers must be picklable when a
+    process pool is used.
+    """
+
+    def __init__(
+        self,
+        sampler: 'cirq.Sampler',
+        *,
+        max_workers: Optional[int] = None,
+        chunk_size: int = 1,
+        seed: 'cirq.RANDOM_STATE_OR_SEED_LIKE' = None,
+        executor: Optional[concurrent.futures.Executor] = None,
+    ):
+        """Wraps a sampler so that its work is spread across workers.
+
+        Args:
+            sampler: The sampler that runs each chunk of work.
+            max_workers: The number of worker processes to start when no
+                `executor` is given. Defaults to the number of processors.
+            chunk_size: The number of consecutive sweep points run by a single
+                task. Larger chunks let samplers share work between sweep
+                points, e.g. the prefix reuse of `cirq.Simulator.run_sweep`.
+            seed: The seed for the per-chunk random states. Defaults to
+                drawing seeds from the wrapped sampler's random state.
+            executor: An executor to submit work to instead of creating a new
+                process pool on every call. It is not shut down by this
+                sampler.
+        """
+        if chunk_size < 1:
+            raise ValueError(f'chunk_size must be positive but was {chunk_size}.')
+        self._sampler = sampler
+        self._max_workers = max_workers
+        self._chunk_size = chunk_size
+        self._executor = executor
+        if seed is None and hasattr(sampler, '_prng'):
+            self._prng = getattr(sampler, '_prng')
+        else:
+            self._prng = value.parse_random_state(seed)
+
+    def run_sweep(
+        self,
+        program: 'cirq.Circuit',
+        params: 'cirq.Sweepable',
+        repetitions: int = 1,
+    ) -> List['cirq.Result']:
+        return self.run_batch([program], [params], repetitions)[0]
+
+    def run_batch(
+        self,
+        programs: List['cirq.Circuit'],
+        params_list: Optional[List['cirq.Sweepable']] = None,
+        repetitions: Union[int, List[int]] = 1,
+    ) -> List[List['cirq.Result']]:
+        """Runs the supplied circuits, spreading their sweeps across workers.
+
+        See `cirq.Sampler.run_batch` for the meaning of the arguments. All
+        chunks of all circuits are submitted to the executor at once.
+        """
+        if params_list is None:
+            params_list = [None] * len(programs)
+        if len(programs) != len(params_list):
+            raise ValueError(
+                'len(programs) and len(params_list) must match. '
+                f'Got {len(programs)} and {len(params_list)}.'
+            )
+        if isinstance(repetitions, int):
+            repetitions = [repetitions] * len(programs)
+        if len(programs) != len(repetitions):
+            raise ValueError(
+                'len(programs) and len(repetitions) must match. '
+                f'Got {len(programs)} and {len(repetitions)}.'
+            )
+
+        tasks: List[Tuple[int, 'cirq.Circuit', List['cirq.ParamResolver'], int]] = []
+        for index, (program, params, reps) in enumerate(zip(programs, params_list, repetitions)):
+            resolvers = list(study.to_resolvers(params))
+            for start in range(0, len(resolvers), self._chunk_size):
+                tasks.append((index, program, resolvers[start : start + self._chunk_size], reps))
+        seeds = self._prng.randint(2 ** 31, size=len(tasks))
+
+        # The random state of the wrapped sampler is replaced in every worker,
+        # so it is dropped here; the global `np.random` state is not picklable.
+        template = copy.copy(self._sampler)
+        if hasattr(template, '_prng'):
+            setattr(template, '_prng', None)
+        args = (
+            [template] * len(tasks),
+            [program for _, program, _, _ in tasks],
+            [resolvers for _, _, resolvers, _ in tasks],
+            [reps for _, _, _, reps in tasks],
+            seeds.tolist(),
+        )
+        if self._executor is not None:
+            chunk_results = list(self._executor.map(_run_chunk, *args))
+        else:
+            with concurrent.futures.ProcessPoolExecutor(self._max_workers) as executor:
+                chunk_results = list(executor.map(_run_chunk, *args))
+
+        results: List[List['cirq.Result']] = [[] for _ in programs]
+        for (index, _, _, _), chunk_result in zip(tasks, chunk_results):
+            results[index].extend(chunk_result)
+        return results
+
+
+def _run_chunk(
+    sampler: 'cirq.Sampler',
+    program: 'cirq.Circuit',
+    resolvers: Sequence['cirq.ParamResolver'],
+    repetitions: int,
+    seed: int,
+) -> List['cirq.Result']:
+    """Runs one chunk of a sweep on a freshly seeded copy of a sampler."""
+    sampler = copy.copy(sampler)
+    if hasattr(sampler, '_prng'):
+        setattr(sampler, '_prng', value.parse_random_state(seed))
+    return sampler.run_sweep(program, params=list(resolvers), repetitions=repetitions)
@@ -0,0 +1,102 @@
+# Copyright 2020 The Cirq Developers
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import concurrent.futures
+
+import numpy as np
+import pytest
+import sympy
+
+import cirq
+
+
+def _circuit():
+    q = cirq.LineQubit.range(2)
+    return cirq.Circuit(
+        cirq.H(q[0]),
+        cirq.CNOT(q[0], q[1]),
+        cirq.X(q[1]) ** sympy.Symbol('t'),
+        cirq.measure(*q, key='m'),
+    )
+
+
+def test_run_sweep_in_process_pool_preserves_order():
+    sampler = cirq.ParallelSampler(cirq.Simulator(), max_workers=2)
+    results = sampler.run_sweep(_circuit(), cirq.Linspace('t', 0, 1, 3), repetitions=20)
+    assert [r.params['t'] for r in results] == [0, 0.5, 1]
+    m0 = results[0].measurements['m']
+    m2 = results[2].measurements['m']
+    np.testing.assert_equal(m0[:, 0], m0[:, 1])
+    np.testing.assert_equal(m2[:, 0], 1 - m2[:, 1])
+
+
+@pytest.mark.parametrize('chunk_size', [1, 2, 5])
+def test_results_do_not_depend_on_workers(chunk_size):
+    params = cirq.Linspace('t', 0, 1, 5)
+    expected = cirq.ParallelSampler(
+        cirq.Simulator(seed=1),
+        chunk_size=chunk_size,
+        executor=concurrent.futures.ThreadPoolExecutor(max_workers=1),
+    ).run_sweep(_circuit(), params, repetitions=30)
+    with concurrent.futures.ThreadPoolExecutor(max_workers=4) as executor:
+        actual = cirq.ParallelSampler(
+            cirq.Simulator(seed=1), chunk_size=chunk_size, executor=executor
+        ).run_sweep(_circuit(), params, repetitions=30)
+    assert actual == expected
+
+
+def test_explicit_seed():
+    executor = concurrent.futures.ThreadPoolExecutor(max_workers=2)
+    a = cirq.ParallelSampler(cirq.Simulator(), seed=5, executor=executor)
+    b = cirq.ParallelSampler(cirq.Simulator(), seed=5, executor=executor)
+    params = cirq.Points('t', [0.5, 0.5])
+    assert a.run_sweep(_circuit(), params, repetitions=40) == b.run_sweep(
+        _circuit(), params, repetitions=40
+    )
+
+
+def test_run_batch():
+    q = cirq.LineQubit(0)
+    programs = [_circuit(), cirq.Circuit(cirq.X(q), cirq.measure(q, key='x'))]
+    with concurrent.futures.ThreadPoolExecutor(max_workers=3) as executor:
+        sampler = cirq.ParallelSampler(cirq.Simulator(), chunk_size=2, executor=executor)
+        results = sampler.run_batch(
+            programs, params_list=[cirq.Linspace('t', 0, 1, 3), None], repetitions=[5, 7]
+        )
+        assert len(results) == 2
+        assert [r.params['t'] for r in results[0]] == [0, 0.5, 1]
+        assert all(r.repetitions == 5 for r in results[0])
+        assert len(results[1]) == 1
+        np.testing.assert_equal(results[1][0].measurements['x'], [[1]] * 7)
+
+        results = sampler.run_batch(programs[1:])
+        np.testing.assert_equal(results[0][0].measurements['x'], [[1]])
+
+        with pytest.raises(ValueError, match='len\\(programs\\) and len\\(params_list\\)'):
+            sampler.run_batch(programs, params_list=[None])
+        with pytest.raises(ValueError, match='len\\(programs\\) and len\\(repetitions\\)'):
+            sampler.run_batch(programs, repetitions=[1])
+
+
+def test_sampler_without_random_state():
+    with concurrent.futures.ThreadPoolExecutor(max_workers=2) as executor:
+        sampler = cirq.ParallelSampler(cirq.ZerosSampler(), executor=executor)
+        results = sampler.run_sweep(_circuit(), cirq.Linspace('t', 0, 1, 2), repetitions=3)
+    assert len(results) == 2
+    np.testing.assert_equal(results[1].measurements['m'], np.zeros((3, 2)))
+
+
+def test_invalid_chunk_size():
+    with pytest.raises(ValueError, match='chunk_size'):
+        cirq.ParallelSampler(cirq.Simulator(), chunk_size=0)
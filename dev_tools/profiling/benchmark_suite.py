@@ -0,0 +1,365 @@
+# Copyright 2020 The Cirq Developers
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Benchmarks of cirq hot paths with regression tracking against a baseline.
+
+Every benchmark builds its inputs from a fixed seed, outside of the timed
+region, and returns the function to time. Results can be written as JSON or
+CSV and compared against a JSON baseline written by an earlier run:
+
+    python dev_tools/profiling/benchmark_suite.py --output=baseline.json
+    # ... make changes ...
+    python dev_tools/profiling/benchmark_suite.py --baseline=baseline.json
+
+The second command exits with a non-zero status if any benchmark got slower
+than the baseline by more than the tolerance.
+"""
+
+import argparse
+import csv
+import json
+import platform
+import statistics
+import sys
+import timeit
+from typing import Callable, Dict, IO, List, NamedTuple, Optional, Sequence
+
+import numpy as np
+import sympy
+
+import cirq
+
+# The seed all benchmark inputs are generated from.
+_SEED = 1234
+
+_CLIFFORD_GATES = {cirq.H: 1, cirq.S: 1, cirq.X: 1, cirq.CNOT: 2, cirq.CZ: 2}
+
+
+class BenchmarkResult(NamedTuple):
+    """The timings of one benchmark, in seconds per call."""
+
+    name: str
+    min_seconds: float
+    median_seconds: float
+    mean_seconds: float
+    repetitions: int
+    number: int
+
+
+class Regression(NamedTuple):
+    """A benchmark that got slower than its baseline."""
+
+    name: str
+    baseline_seconds: float
+    seconds: float
+
+    @property
+    def ratio(self) -> float:
+        return self.seconds / self.baseline_seconds
+
+
+def _random_circuit(num_qubits: int, num_moments: int, **kwargs) -> cirq.Circuit:
+    return cirq.testing.random_circuit(
+        cirq.LineQubit.range(num_qubits), num_moments, op_density=0.8, random_state=_SEED, **kwargs
+    )
+
+
+def _measured(circuit: cirq.Circuit) -> cirq.Circuit:
+    return circuit + cirq.Circuit(cirq.measure(*sorted(circuit.all_qubits()), key='m'))
+
+
+def _sparse_simulate() -> Callable[[], object]:
+    circuit = _random_circuit(14, 20)
+    simulator = cirq.Simulator(seed=_SEED)
+    return lambda: simulator.simulate(circuit)
+
+
+def _sparse_sample() -> Callable[[], object]:
+    circuit = _measured(_random_circuit(12, 20))
+    simulator = cirq.Simulator(seed=_SEED)
+    return lambda: simulator.run(circuit, repetitions=1000)
+
+
+def _sparse_sweep() -> Callable[[], object]:
+    qubits = cirq.LineQubit.range(10)
+    circuit = _random_circuit(10, 20)
+    circuit.append(cirq.rx(sympy.Symbol('t')).on_each(*qubits))
+    circuit = _measured(circuit)
+    sweep = cirq.Linspace('t', 0, 1, 20)
+    simulator = cirq.Simulator(seed=_SEED)
+    return lambda: simulator.run_sweep(circuit, sweep, repetitions=100)
+
+
+def _expectation_values() -> Callable[[], object]:
+    qubits = cirq.LineQubit.range(10)
+    circuit = _random_circuit(10, 20)
+    observables = [cirq.Z(q) * cirq.Z(q2) for q, q2 in zip(qubits, qubits[1:])]
+    observables.append(sum(cirq.X(q) for q in qubits))
+    simulator = cirq.Simulator(seed=_SEED)
+    return lambda: simulator.simulate_expectation_values(circuit, observables)
+
+
+def _density_matrix_run() -> Callable[[], object]:
+    circuit = _measured(_random_circuit(6, 10).with_noise(cirq.depolarize(0.01)))
+    simulator = cirq.DensityMatrixSimulator(seed=_SEED)
+    return lambda: simulator.run(circuit, repetitions=100)
+
+
+def _clifford_simulate() -> Callable[[], object]:
+    circuit = _random_circuit(30, 50, gate_domain=_CLIFFORD_GATES)
+    simulator = cirq.CliffordSimulator(seed=_SEED)
+    return lambda: simulator.simulate(circuit)
+
+
+def _stabilizer_sample() -> Callable[[], object]:
+    circuit = _measured(_random_circuit(30, 50, gate_domain=_CLIFFORD_GATES))
+    sampler = cirq.StabilizerSampler(seed=_SEED)
+    return lambda: sampler.run(circuit, repetitions=1000)
+
+
+def _mps_simulate() -> Callable[[], object]:
+    # quimb is an optional dependency of cirq.contrib.quimb.
+    import cirq.contrib.quimb as ccq
+
+    circuit = _random_circuit(12, 10)
+    simulator = ccq.MPSSimulator(seed=_SEED)
+    return lambda: simulator.simulate(circuit)
+
+
+def _circuit_construction() -> Callable[[], object]:
+    operations = list(_random_circuit(20, 100).all_operations())
+    return lambda: cirq.Circuit(operations)
+
+
+def _optimizers() -> Callable[[], object]:
+    circuit = cirq.testing.random_circuit(
+        cirq.LineQubit.range(6),
+        30,
+        op_density=0.8,
+        gate_domain={cirq.CZ: 2, cirq.X ** 0.5: 1, cirq.T: 1, cirq.H: 1},
+        random_state=_SEED,
+    )
+
+    def optimize():
+        c = circuit.copy()
+        cirq.MergeInteractions().optimize_circuit(c)
+        cirq.MergeSingleQubitGates().optimize_circuit(c)
+        cirq.EjectPhasedPaulis().optimize_circuit(c)
+        cirq.EjectZ().optimize_circuit(c)
+        cirq.DropNegligible().optimize_circuit(c)
+        cirq.DropEmptyMoments().optimize_circuit(c)
+        return c
+
+    return optimize
+
+
+def _json_serialization() -> Callable[[], object]:
+    circuit = _random_circuit(20, 50)
+    return lambda: cirq.read_json(json_text=cirq.to_json(circuit))
+
+
+def _proto_serialization() -> Callable[[], object]:
+    circuit = cirq.google.optimized_for_sycamore(
+        _random_circuit(6, 10, gate_domain={cirq.CZ: 2, cirq.X ** 0.5: 1, cirq.Z ** 0.25: 1}),
+        optimizer_type='sqrt_iswap',
+    )
+    gate_set = cirq.google.SQRT_ISWAP_GATESET
+    return lambda: gate_set.deserialize(gate_set.serialize(circuit))
+
+
+# Maps benchmark names to functions that prepare the inputs of the benchmark
+# and return the function to time.
+BENCHMARKS: Dict[str, Callable[[], Callable[[], object]]] = {
+    'sparse_simulate': _sparse_simulate,
+    'sparse_sample': _sparse_sample,
+    'sparse_sweep': _sparse_sweep,
+    'expectation_values': _expectation_values,
+    'density_matrix_run': _density_matrix_run,
+    'clifford_simulate': _clifford_simulate,
+    'stabilizer_sample': _stabilizer_sample,
+    'mps_simulate': _mps_simulate,
+    'circuit_construction': _circuit_construction,
+    'optimizers': _optimizers,
+    'json_serialization': _json_serialization,
+    'proto_serialization': _proto_serialization,
+}
+
+
+def run_benchmark(name: str, repetitions: int = 5, number: int = 1) -> BenchmarkResult:
+    """Times one benchmark.
+
+    Args:
+        name: The key of the benchmark in `BENCHMARKS`.
+        repetitions: The number of timing measurements to take.
+        number: The number of calls averaged over in each measurement.
+
+    Returns:
+        The timings of the benchmark, in seconds per call.
+    """
+    np.random.seed(_SEED)
+    func = BENCHMARKS[name]()
+    times = [t / number for t in timeit.repeat(func, repeat=repetitions, number=number)]
+    return BenchmarkResult(
+        name=name,
+        min_seconds=min(times),
+        median_seconds=statistics.median(times),
+        mean_seconds=statistics.mean(times),
+        repetitions=repetitions,
+        number=number,
+    )
+
+
+def run_benchmarks(
+    names: Optional[Sequence[str]] = None, repetitions: int = 5, number: int = 1
+) -> List[BenchmarkResult]:
+    """Times several benchmarks.
+
+    Benchmarks whose optional dependencies are not installed are skipped.
+
+    Args:
+        names: The keys of the benchmarks to run. Defaults to all of
+            `BENCHMARKS`.
+        repetitions: The number of timing measurements to take per benchmark.
+        number: The number of calls averaged over in each measurement.
+
+    Returns:
+        The timings of the benchmarks that ran.
+    """
+    if names is None:
+        names = list(BENCHMARKS)
+    unknown = [name for name in names if name not in BENCHMARKS]
+    if unknown:
+        raise ValueError(f'Unknown benchmarks: {unknown}. Known: {sorted(BENCHMARKS)}.')
+    results = []
+    for name in names:
+        try:
+            results.append(run_benchmark(name, repetitions=repetitions, number=number))
+        except ImportError as e:
+            print(f'Skipping {name}: {e}', file=sys.stderr)
+    return results
+
+
+def write_json(results: Sequence[BenchmarkResult], file: IO[str]) -> None:
+    json.dump(
+        {
+            'cirq_version': cirq.__version__,
+            'python_version': platform.python_version(),
+            'results': [result._asdict() for result in results],
+        },
+        file,
+        indent=2,
+    )
+
+
+def write_csv(results: Sequence[BenchmarkResult], file: IO[str]) -> None:
+    writer = csv.writer(file)
+    writer.writerow(BenchmarkResult._fields)
+    for result in results:
+        writer.writerow(result)
+
+
+def read_json(file: IO[str]) -> List[BenchmarkResult]:
+    return [BenchmarkResult(**result) for result in json.load(file)['results']]
+
+
+def find_regressions(
+    results: Sequence[BenchmarkResult],
+    baseline: Sequence[BenchmarkResult],
+    tolerance: float = 0.2,
+) -> List[Regression]:
+    """Finds the benchmarks that got slower than their baseline.
+
+    Minimum times are compared, since they are the least affected by other
+    load on the machine. Benchmarks missing from either side are ignored.
+
+    Args:
+        results: The new timings.
+        baseline: The timings to compare against.
+        tolerance: The allowed relative slowdown, e.g. 0.2 for 20%.
+
+    Returns:
+        The benchmarks that were more than `1 + tolerance` times slower.
+    """
+    baseline_seconds = {result.name: result.min_seconds for result in baseline}
+    return [
+        Regression(result.name, baseline_seconds[result.name], result.min_seconds)
+        for result in results
+        if result.name in baseline_seconds
+        and result.min_seconds > baseline_seconds[result.name] * (1 + tolerance)
+    ]
+
+
+def main(
+    benchmarks: Optional[Sequence[str]],
+    repetitions: int,
+    number: int,
+    output: Optional[str],
+    output_format: str,
+    baseline: Optional[str],
+    tolerance: float,
+) -> int:
+    results = run_benchmarks(benchmarks, repetitions=repetitions, number=number)
+    write = write_csv if output_format == 'csv' else write_json
+    if output is None:
+        write(results, sys.stdout)
+        print()
+    else:
+        with open(output, 'w') as f:
+            write(results, f)
+
+    if baseline is None:
+        return 0
+    with open(baseline) as f:
+        regressions = find_regressions(results, read_json(f), tolerance)
+    for regression in regressions:
+        print(
+            f'REGRESSION {regression.name}: {regression.seconds:.6f}s vs '
+            f'{regression.baseline_seconds:.6f}s baseline ({regression.ratio:.2f}x)',
+            file=sys.stderr,
+        )
+    return 1 if regressions else 0
+
+
+def parse_arguments(args):
+    parser = argparse.ArgumentParser('Benchmark cirq hot paths.')
+    parser.add_argument(
+        '--benchmarks',
+        nargs='+',
+        choices=sorted(BENCHMARKS),
+        default=None,
+        help='Which benchmarks to run. Defaults to all of them.',
+    )
+    parser.add_argument(
+        '--repetitions', default=5, type=int, help='Number of timings taken per benchmark.'
+    )
+    parser.add_argument(
+        '--number', default=1, type=int, help='Number of calls averaged over in each timing.'
+    )
+    parser.add_argument(
+        '--output', default=None, type=str, help='File to write results to. Defaults to stdout.'
+    )
+    parser.add_argument(
+        '--output_format', choices=['json', 'csv'], default='json', help='Format of the results.'
+    )
+    parser.add_argument(
+        '--baseline', default=None, type=str, help='JSON results to check for regressions against.'
+    )
+    parser.add_argument(
+        '--tolerance', default=0.2, type=float, help='Allowed relative slowdown vs the baseline.'
+    )
+    return vars(parser.parse_args(args))
+
+
+if __name__ == '__main__':
+    sys.exit(main(**parse_arguments(sys.argv[1:])))
@@ -0,0 +1,92 @@
+# Copyright 2020 The Cirq Developers
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for the benchmark suite."""
+
+import io
+
+import pytest
+
+from dev_tools.profiling import benchmark_suite
+
+
+def _result(name, seconds):
+    return benchmark_suite.BenchmarkResult(name, seconds, seconds, seconds, 1, 1)
+
+
+@pytest.mark.parametrize('name', sorted(benchmark_suite.BENCHMARKS))
+def test_benchmarks_run(name):
+    if name == 'mps_simulate':
+        pytest.importorskip('quimb')
+    result = benchmark_suite.run_benchmark(name, repetitions=2)
+    assert result.name == name
+    assert 0 < result.min_seconds <= result.median_seconds
+    assert result.repetitions == 2
+
+
+def test_run_benchmarks_unknown():
+    with pytest.raises(ValueError, match='Unknown benchmarks'):
+        _ = benchmark_suite.run_benchmarks(['not_a_benchmark'])
+
+
+def test_json_round_trip():
+    results = [_result('a', 0.5), _result('b', 1.5)]
+    buffer = io.StringIO()
+    benchmark_suite.write_json(results, buffer)
+    buffer.seek(0)
+    assert benchmark_suite.read_json(buffer) == results
+
+
+def test_write_csv():
+    buffer = io.StringIO()
+    benchmark_suite.write_csv([_result('a', 0.5)], buffer)
+    assert buffer.getvalue().splitlines() == [
+        'name,min_seconds,median_seconds,mean_seconds,repetitions,number',
+        'a,0.5,0.5,0.5,1,1',
+    ]
+
+
+def test_find_regressions():
+    baseline = [_result('a', 1.0), _result('b', 1.0), _result('c', 1.0)]
+    results = [_result('a', 1.1), _result('b', 1.5), _result('d', 9.0)]
+    regressions = benchmark_suite.find_regressions(results, baseline, tolerance=0.2)
+    assert regressions == [benchmark_suite.Regression('b', 1.0, 1.5)]
+    assert regressions[0].ratio == 1.5
+    assert benchmark_suite.find_regressions(results, baseline, tolerance=0.6) == []
+
+
+def test_main(tmpdir, capsys):
+    baseline = str(tmpdir.join('baseline.json'))
+    args = f'--benchmarks circuit_construction --repetitions 1 --output {baseline}'
+    assert benchmark_suite.main(**benchmark_suite.parse_arguments(args.split())) == 0
+    with open(baseline) as f:
+        assert [r.name for r in benchmark_suite.read_json(f)] == ['circuit_construction']
+
+    args = f'--benchmarks circuit_construction --repetitions 1 --baseline {baseline}'
+    args += ' --tolerance 1000 --output_format csv'
+    assert benchmark_suite.main(**benchmark_suite.parse_arguments(args.split())) == 0
+    assert capsys.readouterr().out.startswith('name,min_seconds')
+
+    with open(baseline, 'w') as f:
+        benchmark_suite.write_json([_result('circuit_construction', 1e-9)], f)
+    args = f'--benchmarks circuit_construction --repetitions 1 --baseline {baseline}'
+    assert benchmark_suite.main(**benchmark_suite.parse_arguments(args.split())) == 1
+    assert 'REGRESSION circuit_construction' in capsys.readouterr().err
+
+
+def test_args_have_defaults():
+    kwargs = benchmark_suite.parse_arguments([])
+    assert kwargs['benchmarks'] is None
+    assert kwargs['repetitions'] == 5
+    assert kwargs['output_format'] == 'json'